@@ -5,60 +5,46 @@ Classes related to the starting of an Operation Commander, whether via commands
 
 # import discord
 # import discord.ext
-from discord import app_commands, Interaction, File, Member, VoiceState
+from discord import app_commands, Interaction, File
 from discord.ext import tasks, commands
 
-from datetime import timezone
-
-from botUtils import UserHasCommandPerms, FilesAndFolders
-from botUtils import BotPrinter as BUPrint
+from botUtils import UserHasCommandPerms, FileCatalogue
+from botUtils import BotPrinter
 
 import botData.settings as BotSettings
 from botData.settings import CommandLimit
-from botData.dataObjects import OperationData
+from botData.dataObjects import OperationData, OpFeedback
 
 import opsManager
 
 import OpCommander.commander
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from botScheduler import BotScheduler
+
+BUPrint = BotPrinter.GetLogger("commander.auto")
+
 
 class AutoCommander(commands.Cog):
 	"""
 	# AUTO COMMANDER
 
-	A cog for holding the Auto Commander scheduler and linking voice chat state changes to refreshing commanders.
+	A cog for starting the shared scheduler used by Auto Commanders.
+	The scheduler starts paused; it is resumed once live ops are loaded (`OperationManager.RefreshAutostarts`) so restored auto-starts can find their operation.
+	Voice state changes are routed to commanders by the `VoiceRouter`.
 	"""
 
 	def __init__(self, p_bot) -> None:
 		super().__init__()
 		self.botRef = p_bot
-		self.scheduler = AsyncIOScheduler(timezone=timezone.utc)
-		self.scheduler.start()
+		BotScheduler.Start(bPaused=True)
 		BUPrint.Info("COG: AutoCommander loaded!")
 
 
-	@commands.Cog.listener("on_voice_state_update")
-	async def VoiceStateChanged(self, p_member:Member, p_before:VoiceState, p_after:VoiceState):
-		"""
-		# VOICE STATE CHANGED: Listener
-		Checks if user is in any live ops, and updates their commander if present.
-		"""
-
-		if opsManager.OperationManager.vLiveCommanders.__len__() != 0:
-			for commander in opsManager.OperationManager.vLiveCommanders:
-				if not commander.bIgnoreStateChange and p_member.id in commander.vOpData.GetParticipantIDs():
-					for participant in commander.participants:
-						if participant.discordID == p_member.id:
-							participant.bInEventChannel = bool(p_member.voice != None and p_member.voice.channel in commander.vCategory.voice_channels)
-							break
-					
-					await commander.UpdateCommanderLive()
-
-
 
 
 
 class CommanderCommands(commands.Cog, name="commander", description=""):
+	feedbackCatalogue = FileCatalogue(BotSettings.Directories.tempDir, OpFeedback.GetFileExtension(), BotSettings.Directories.feedbackPrefix)
+
 	def __init__(self, p_bot) -> None:
 		super().__init__()
 		self.botRef = p_bot
@@ -127,16 +113,4 @@ class CommanderCommands(commands.Cog, name="commander", description=""):
 
 	@GetFeedback.autocomplete("p_typedStr")
 	async def AutoCompleteGetFeedback(self, p_interaction: Interaction, p_typedStr:str):
-		vFileList = []
-		returnChoices = []
-
-		file:str
-		for file in FilesAndFolders.GetFiles(f"{BotSettings.Directories.tempDir}", ".txt"):
-			if file.startswith(BotSettings.Directories.feedbackPrefix):
-				vFileList.append(file)
-
-		for file in vFileList:
-			if file.lower().__contains__(p_typedStr.lower()):
-				returnChoices.append( app_commands.Choice(name=file.replace(".txt", "").replace(BotSettings.Directories.feedbackPrefix, ""), value=file) )
-
-		return returnChoices
\ No newline at end of file
+		return CommanderCommands.feedbackCatalogue.GetChoices(p_typedStr)
\ No newline at end of file
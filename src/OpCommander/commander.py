@@ -9,19 +9,17 @@ from __future__ import annotations # Backport of list hint typing.
 import discord
 import discord.ext
 from discord.ext import commands
-import auraxium
 import re
+import importlib
+from typing import TYPE_CHECKING
 
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.schedulers import SchedulerNotRunningError
 from datetime import timedelta, datetime, timezone
 from dateutil.relativedelta import relativedelta
 
-from OpCommander.events import OpsEventTracker
-from botData.dataObjects import CommanderStatus, OpsStatus, Participant, Session, OpFeedback
+from botData.dataObjects import CommanderStatus, OpsStatus, Participant, Session, OpFeedback, FeedbackEntry
 
 from botUtils import GetGuild, GetGuildNF, GetDiscordTime, SplitStrToSegments, EllipsiseStringArrayToSize
-from botUtils import BotPrinter as BUPrint
+from botUtils import BotPrinter
 from botUtils import ChannelPermOverwrites as ChanPermOverWrite
 from botData.utilityData import DateFormat, Colours
 
@@ -34,8 +32,26 @@ from botData.dataObjects import OperationData, User, OpRoleData, PS2EventAttende
 
 import opsManager
 import userManager
+from voiceRouter import VoiceRouter
+from botScheduler import BotScheduler
 from OpCommander.graphs import GraphMaker
 
+if TYPE_CHECKING:
+	import auraxium
+	from OpCommander.events import OpsEventTracker
+
+BUPrint = BotPrinter.GetLogger("commander")
+
+
+def GetEventsModule():
+	"""# GET EVENTS MODULE
+	Returns the `OpCommander.events` module, importing it (and with it auraxium & numpy) on first use.
+
+	Only called once a PS2 event is tracked, so these aren't loaded otherwise.
+	"""
+	return importlib.import_module("OpCommander.events")
+
+
 async def StartCommander(p_opData: OperationData):
 	"""
 	# START COMMANDER
@@ -78,6 +94,21 @@ async def StartCommander(p_opData: OperationData):
 
 
 
+async def AutoStartCommander(p_messageID:str):
+	"""
+	# AUTO START COMMANDER
+	Function called by the persistent auto-start job.
+	The live operation is found by its message ID, so persisted jobs don't hold a stale copy of the operation.
+	"""
+	for opData in opsManager.OperationManager.vLiveOps:
+		if opData.messageID == p_messageID:
+			await StartCommander(opData)
+			return
+
+	BUPrint.Info(f"Auto-start called for an operation that no longer exists ({p_messageID}).")
+
+
+
 class Commander():
 	"""
 	# COMMANDER
@@ -105,14 +136,15 @@ class Commander():
 
 		if p_opData.options.bIsPS2Event and commanderSettings.bTrackingIsEnabled:
 			BUPrint.Debug("Event is PS2 related, creating tracker & client...")
-			self.vAuraxClient = auraxium.EventClient(service_id=BotSettings.ps2ServiceID)
-			self.vOpsEventTracker = OpsEventTracker(p_aurClient=self.vAuraxClient)
+			vEvents = GetEventsModule()
+			self.vAuraxClient = vEvents.EventClient(service_id=BotSettings.ps2ServiceID)
+			self.vOpsEventTracker = vEvents.OpsEventTracker(p_aurClient=self.vAuraxClient)
 			self.vOpsEventTracker.updateParentFunction:callable = self.UpdateCommanderLive
 			self.vOpsEventTracker.parentReupdateTriggers:callable = self.AuraxClientUnavailableRetry
 			self.vOpsEventTracker.parentSendForFunVehicleDeath:callable = self.SendForFunVehicleDeath
 
-		# Alert & Autostart Scheduler
-		self.scheduler = AsyncIOScheduler(timezone=timezone.utc)
+		# Alert & Autostart jobs are added to the shared scheduler, with IDs prefixed by this.
+		self.jobPrefix = f"commander_{p_opData.messageID}_"
 		self.alertTimes:list[datetime] = [] # Saved to be displayed in Info embed
 
 		#DiscordElements:
@@ -124,13 +156,15 @@ class Commander():
 		self.standbyChn: discord.VoiceChannel = None # Standby channel voice connected users are moved into during start.
 		self.lastStartAlert: discord.Message = None # Last Start alert sent, used to store + remove a previous alert to not flood the channel.
 		self.participants:list[Participant] = [] # List of Participant objects.
-		self.notifFeedbackMsg: discord.Message = None # Message for non-soberdogs Feedback.
+		self.notifFeedbackMsgs: list[discord.Message] = [] # Messages for non-soberdogs Feedback.
 		self.continentAlert: discord.Message = None # Message for contintent alerts, if enabled.
+		self.commanderView: CommanderView = None # View of the commander message; created once, and its buttons updated on status change.
+		self.connectionRows = ParticipantRowCache() # Cached rows of the connections embed.
 		
 		# Soberdogs Discord Elements, saved here to avoid repeated fetching.
 		self.soberdogFeedbackForum: discord.ForumChannel = None # Forum for soberdogs Debriefs.
 		self.soberdogFeedbackThread : discord.Thread = None # Thread holding the feedback message. Also used to get a jump-link for the notif channel button.
-		self.soberdogFeedbackMsg: discord.Message = None # Message for the soberdogs Feedback.
+		self.soberdogFeedbackMsgs: list[discord.Message] = [] # Messages for the soberdogs Feedback.
 
 
 	async def SetupCommander(self):
@@ -173,7 +207,7 @@ class Commander():
 		self.trueStartTime = datetime.now(tz=timezone.utc)
 
 		BUPrint.Info(f"Event: {self.vOpData.name} started!")
-		self.scheduler.remove_all_jobs()
+		self.RemoveScheduledJobs()
 
 		self.vCommanderStatus = CommanderStatus.Started
 		self.vOpData.status = OpsStatus.started
@@ -181,12 +215,12 @@ class Commander():
 
 		await self.MoveUsers(True)
 
-		self.scheduler.add_job(Commander.CheckAttendance, 'date', run_date=(self.trueStartTime + timedelta(minutes=commanderSettings.gracePeriod)), args=[self])
+		self.AddScheduledJob("attendance", Commander.CheckAttendance, 'date', run_date=(self.trueStartTime + timedelta(minutes=commanderSettings.gracePeriod)))
 
 		if self.vOpData.options.bIsPS2Event:
 			BUPrint.Debug("Configuring PS2 event schedule tasks")
-			self.scheduler.add_job(Commander.UpdateCommanderLive, 'interval', seconds=(commanderSettings.dataPointInterval + 5), args=[self])
-			self.scheduler.add_job(OpsEventTracker.NewEventPoint, 'interval', seconds=commanderSettings.dataPointInterval, args=[self.vOpsEventTracker])
+			self.AddScheduledJob("liveUpdate", Commander.UpdateCommanderLive, 'interval', seconds=(commanderSettings.dataPointInterval + 5))
+			self.AddScheduledJob("eventPoint", GetEventsModule().OpsEventTracker.NewEventPoint, 'interval', p_args=[self.vOpsEventTracker], seconds=commanderSettings.dataPointInterval)
 			self.vOpsEventTracker.CreateTriggers()
 
 		await self.UpdateCommander()
@@ -199,7 +233,8 @@ class Commander():
 		"""
 		if self.vOpData.options.bIsPS2Event:
 			await self.vAuraxClient.close()
-			self.scheduler.shutdown()
+			self.RemoveScheduledJobs()
+			self.vOpsEventTracker.stats.WriteSessions()
 
 			# Sends the first messages.
 			await self.CreateFeedback()
@@ -235,6 +270,8 @@ class Commander():
 		if not self.bHasSoftEnded:
 			await self.EndEventSoft()
 
+		VoiceRouter.UnsubscribeCommander(self)
+		self.RemoveScheduledJobs()
 		await self.MoveUsers(False)
 		await self.DeleteChannels()
 
@@ -270,16 +307,39 @@ class Commander():
 					lastInterval = lastInterval - relativedelta(minutes=intervalTime)
 					self.alertTimes.append(lastInterval)
 					BUPrint.Debug(f"AutoAlert Interval: {lastInterval}")
-					self.scheduler.add_job( Commander.SendReminder, 'date', run_date=lastInterval, args=[self] )
+					self.AddScheduledJob(f"reminder{setIntervals}", Commander.SendReminder, 'date', run_date=lastInterval)
 					setIntervals += 1
 		
 		
 		# Setup AutoStart
 		if self.vOpData.options.bAutoStart and commanderSettings.bAutoStartEnabled:
 			BUPrint.Debug(f"Commander set to Start Operation at {self.vOpData.date}")
-			self.scheduler.add_job( Commander.StartEvent, 'date', run_date=self.vOpData.date, args=[self], id="CommanderAutoStart")
+			self.AddScheduledJob("autoStart", Commander.StartEvent, 'date', run_date=self.vOpData.date)
+
+
+
+	def AddScheduledJob(self, p_jobName:str, p_function, p_trigger:str, p_args:list = None, **p_triggerArgs):
+		"""# ADD SCHEDULED JOB
+		Adds a job for this commander to the shared scheduler.
+		The job ID is the commander prefix + `p_jobName`; adding a job with the same name replaces it.
+
+		## PARAMETERS
+		- `p_args`: Arguments for the function. Defaults to this commander.
+		- `p_triggerArgs`: Passed to the trigger (eg, `run_date`, `seconds`).
+		"""
+		BotScheduler.scheduler.add_job(
+			p_function, p_trigger,
+			args=p_args if p_args != None else [self],
+			id=f"{self.jobPrefix}{p_jobName}",
+			replace_existing=True,
+			**p_triggerArgs
+		)
+
 
-		self.scheduler.start()
+	def RemoveScheduledJobs(self):
+		"""# REMOVE SCHEDULED JOBS
+		Removes all of this commanders jobs from the shared scheduler."""
+		BotScheduler.RemoveJobsWithPrefix(self.jobPrefix)
 
 
 
@@ -353,6 +413,7 @@ class Commander():
 				if self.vOpData.options.bIsPS2Event:
 					participant.userSession.kda = PS2SessionKDA()
 		
+		VoiceRouter.SubscribeCommander(self, self.participants)
 
 		BUPrint.Debug("Participants Updated!")
 
@@ -367,6 +428,7 @@ class Commander():
 		NOTE: `UpdateParticipants_UserLibs` should be called before this.
 		"""
 		BUPrint.Debug(f"	-> Getting PS2 Character IDs for\n{p_participantsToUpdate}")
+		vCharacter = GetEventsModule().Character
 
 		for participant in p_participantsToUpdate:
 
@@ -386,7 +448,7 @@ class Commander():
 						BUPrint.Debug("Participant name is same as last checked name.  Skipping...")
 						continue
 
-					vPlayerChar = await self.vAuraxClient.get_by_name(auraxium.ps2.Character, charName)
+					vPlayerChar = await self.vAuraxClient.get_by_name(vCharacter, charName)
 					
 					if vPlayerChar == None:
 						BUPrint.Debug(f"{participant.discordUser.display_name}'s name does not match a PS2 character!")
@@ -403,7 +465,7 @@ class Commander():
 					participant.ps2CharID = vPlayerChar.id
 
 			else:
-				vPlayerChar = await self.vAuraxClient.get_by_name(auraxium.ps2.Character, charName)	
+				vPlayerChar = await self.vAuraxClient.get_by_name(vCharacter, charName)	
 				
 				if vPlayerChar == None:
 					BUPrint.Debug(f"Participant {participant.discordUser.display_name} doesn't have a name that matches a PS2 character.")
@@ -427,6 +489,13 @@ class Commander():
 
 
 
+	def IsEventVoiceChannel(self, p_channel:discord.VoiceChannel):
+		"""# IS EVENT VOICE CHANNEL
+		Returns true if the voice channel is within the commanders category.
+		"""
+		return bool(p_channel != None and self.vCategory != None and p_channel.category_id == self.vCategory.id)
+
+
 	async def UpdateCommanderInfo(self):
 		"""# UPDATE COMMANDER INFO:
 		Updates the commaner's info message.
@@ -451,10 +520,15 @@ class Commander():
 		if self.vOpData.options.bIsPS2Event and self.vCommanderStatus.value >= CommanderStatus.GracePeriod.value:
 			vEmbeds.append( self.CreateEmbed_Session() )
 
+		bViewChanged = self.commanderView == None or self.commanderView.commanderStatus != self.vCommanderStatus
+
 		if self.commanderMsg == None:
 			self.commanderMsg = await self.commanderChannel.send(content="**OP COMMANDER**", embeds=vEmbeds, view=self.CreateCommanderView())
-		else:
+		elif bViewChanged:
 			await self.commanderMsg.edit(embeds=vEmbeds, view=self.CreateCommanderView())
+		else:
+			# Unchanged view is left as is.
+			await self.commanderMsg.edit(embeds=vEmbeds)
 
 
 
@@ -579,9 +653,10 @@ class Commander():
 		"""
 		BUPrint.Debug("Checking all participant characters for online status.")
 		validParticipants = [participant for participant in self.participants if participant.ps2CharID != -1]
+		vCharacter = GetEventsModule().Character
 
 		for participant in validParticipants:
-			vCharObj:auraxium.ps2.Character = await self.vAuraxClient.get_by_id(auraxium.ps2.Character, participant.ps2CharID)
+			vCharObj:auraxium.ps2.Character = await self.vAuraxClient.get_by_id(vCharacter, participant.ps2CharID)
 			participant.bPS2Online = await vCharObj.is_online()
 
 
@@ -823,42 +898,7 @@ class Commander():
 		"""
 		vEmbed = discord.Embed(colour=discord.Colour.from_rgb(200, 200, 255), title="CONNECTIONS", description="Discord and PS2 connection information for participants.")
 
-		vPlayersStr = "\u200b\n"
-		vStatusStr = f"{commanderSettings.connIcon_discord} | {commanderSettings.connIcon_voice} | {commanderSettings.connIcon_ps2}\n"
-
-		for participant in self.participants:
-
-			vPlayersStr += f"{participant.discordUser.display_name}\n"
-			
-			if participant.discordUser.status == discord.Status.offline:
-				vStatusStr += f"{commanderSettings.connIcon_discordOffline} | "
-			else:
-				vStatusStr += f"{commanderSettings.connIcon_discordOnline} | "
-
-
-			if participant.discordUser.voice == None:
-				vStatusStr += f"{commanderSettings.connIcon_voiceDisconnected} | "
-			elif participant.bInEventChannel:
-				vStatusStr += f"{commanderSettings.connIcon_voiceConnected} | "
-			else:
-				vStatusStr += f"{commanderSettings.connIcon_voiceNotEventChan} | "
-
-
-			if participant.libraryEntry != None and participant.libraryEntry.ps2ID != -1:
-				if participant.bPS2Online == True:
-					vStatusStr += f"{commanderSettings.connIcon_ps2Online}"
-				else:
-					vStatusStr += f"{commanderSettings.connIcon_ps2Offline}"
-
-			else:
-				vStatusStr += f"{commanderSettings.connIcon_ps2Invalid}"
-
-			
-			if BotSettings.botFeatures.UserLibrary:
-				if participant.libraryEntry != None and participant.libraryEntry.bIsRecruit:
-					vStatusStr += f" | {commanderSettings.connIcon_ps2Recruit}"
-
-			vStatusStr += "\n"
+		vPlayersStr, vStatusStr = self.connectionRows.Render(self.participants)
 
 		vEmbed.add_field(name="PLAYERS", value=vPlayersStr)
 		vEmbed.add_field(name=f"STATUS:", value=vStatusStr)
@@ -874,39 +914,43 @@ class Commander():
 		Creates and returns an embed containing session information.
 		Only shows if the operation is for Planetside 2.
 		"""
-		vTempStr = ""
 		vEmbed = discord.Embed(colour=discord.Colour.from_rgb(200, 200, 255), title="SESSION", 
-		description=f"Status: {self.vCommanderStatus.name} | DataPoints: {str(self.vOpsEventTracker.eventPoints.__len__())}")
+		description=f"Status: {self.vCommanderStatus.name} | DataPoints: {self.vOpsEventTracker.stats.GetIntervalCount()}")
 
+		vTotals = self.vOpsEventTracker.stats.GetTotals()
 
 		vEmbed.add_field(
 			name="KDA",
 			value=
-			f"""**Kills:** {self.vOpsEventTracker.sessionStats.eventKDA.kills}
+			f"""**Kills:** {vTotals["kills"]}
 			
-			**Deaths:** {self.vOpsEventTracker.sessionStats.eventKDA.deathTotal}
-			 - By Squad: {self.vOpsEventTracker.sessionStats.eventKDA.deathBySquad}
-			 - By Allies: {self.vOpsEventTracker.sessionStats.eventKDA.deathByAllies}
-			 - By Enemies: {self.vOpsEventTracker.sessionStats.eventKDA.deathByEnemies}
+			**Deaths:** {vTotals["deathTotal"]}
+			 - By Squad: {vTotals["deathBySquad"]}
+			 - By Allies: {vTotals["deathByAllies"]}
+			 - By Enemies: {vTotals["deathByEnemies"]}
 			"""
 		)
 
 		vEmbed.add_field(
 			name="Facilities...",
-			value=f"""Captured: {self.vOpsEventTracker.sessionStats.facilitiesCaptured}
-			Defended: {self.vOpsEventTracker.sessionStats.facilitiesDefended}
+			value=f"""Captured: {vTotals["captured"]}
+			Defended: {vTotals["defended"]}
 			"""
 		)
 
+		vLeaderboard = ""
+		for metric, label in (("kills", "Kills"), ("revives", "Revives"), ("repairScore", "Repairs")):
+			vLeaders = self.vOpsEventTracker.stats.GetLeaderboard(metric, 3)
+			if len(vLeaders) != 0:
+				vLeaderboard += f"**{label}:** " + ", ".join(f"{participant.discordUser.display_name} ({value})" for participant, value in vLeaders) + "\n"
+
+		if vLeaderboard != "":
+			vEmbed.add_field(name="Leaderboard", value=vLeaderboard, inline=False)
+
 		if self.vOpsEventTracker.sessionStats.facilityFeed.__len__() != 0:
-			for feedEntry in self.vOpsEventTracker.sessionStats.facilityFeed:
-				vTempStr += f"{feedEntry}\n"
-			if vTempStr.__len__() > 1024:
-				vTempStr = EllipsiseStringArrayToSize(vTempStr, 1024)
-		
 			vEmbed.add_field(
 				name="Facility Feed",
-				value=vTempStr,
+				value=self.vOpsEventTracker.sessionStats.facilityFeed.GetText(1024),
 				inline= False
 			)
 
@@ -983,10 +1027,10 @@ class Commander():
 		Called from the event tracker when adding triggers, if the service is unavailable.
 		Creates a new task that recalls create triggers with a delay of x minutes.
 		"""
-		self.scheduler.add_job(
-			OpsEventTracker.CreateTriggers,
-			"date", run_date=datetime.now(tz=timezone.utc) + timedelta(minutes=5),
-			args=[self.vOpsEventTracker]
+		self.AddScheduledJob(
+			"triggerRetry", GetEventsModule().OpsEventTracker.CreateTriggers,
+			"date", p_args=[self.vOpsEventTracker],
+			run_date=datetime.now(tz=timezone.utc) + timedelta(minutes=5)
 		)
 
 
@@ -1026,96 +1070,35 @@ class Commander():
 		"""
 		# CREATE COMMANDER VIEW
 
-		Creates a commander view.  Buttons status are updated depending on Op Status
+		Returns the commander view, created on first call.  Buttons are updated to match the Op Status.
 
 		## RETURNS: `discord.ui.View`
 		"""
-		newView = discord.ui.View(timeout=None)
-		# Button Objects
-		btnStart = Commander_btnStart(self)
-		btnEnd = Commander_btnEnd(self)
-		btnDebrief = Commander_btnDebrief(self)
-		btnDownloadDebrief = Commander_btnDownloadFeedback(self)
-		btnNotify = Commander_btnNotify(self)
+		if self.commanderView == None:
+			self.commanderView = CommanderView(self)
 
-	
-		# Before op Started:
-		if self.vCommanderStatus.value < CommanderStatus.Started.value:
-			btnEnd.disabled = True
-			btnDebrief.disabled = True
-			newView.add_item(btnStart)
-			newView.add_item(btnNotify)
-
-		# Ops Started:
-		elif self.vCommanderStatus == CommanderStatus.Started:
-			btnStart.disabled = True
-			btnDebrief.disabled = False
-			btnEnd.disabled = False
-			newView.add_item(btnDebrief)
-			newView.add_item(btnEnd)
-
-		# Debrief:
-		elif self.vCommanderStatus == CommanderStatus.Debrief:
-			btnStart.disabled = True
-			btnDebrief.disabled = True
-			btnEnd.disabled = False
-			newView.add_item(btnDownloadDebrief)
-			newView.add_item(btnEnd)
-
-		newView.add_item(discord.ui.Button(
-							label="HELP",
-							emoji="❓",
-							url="https://github.com/LCWilliams/planetside-discord-bot/wiki/Op-Commander"
-					)
-		)
-
-		return newView
+		self.commanderView.SetStatus(self.vCommanderStatus)
+		return self.commanderView
 
 
 
 	async def CreateFeedback(self):
 		"""# CREATE FEEDBACK
-		Takes the feedback provided and sends it to the appropriate channel, then updates the commander."""
-		vFeedbackMsg = "**FEEDBACK:**\n"
-		for feedback in self.vFeedback.generic:
-			if feedback != "":
-				vFeedbackMsg += f"{feedback}\n"
-
-		if self.vOpData.options.bIsPS2Event:
-			vFeedbackMsg += "\n**FOR SQUADMATES:**\n"
-			for feedback in self.vFeedback.forSquadmates:
-				if feedback != "":
-					vFeedbackMsg += f"{feedback}\n"
-
-			vFeedbackMsg += "\n**FOR SQUAD LEAD:**\n"
-			for feedback in self.vFeedback.forSquadLead:
-				if feedback != "":
-					vFeedbackMsg += f"{feedback}\n"
-
-			vFeedbackMsg += "\n**FOR PLATOON LEAD:**\n"
-			for feedback in self.vFeedback.forPlatLead:
-				if feedback != "":
-					vFeedbackMsg += f"{feedback}\n"
-
-
+		Takes the feedback provided and sends it to the appropriate channel, then updates the commander.
+		Feedback too long for one message is split over several, which are edited as feedback changes."""
+		bIsPS2Event = self.vOpData.options.bIsPS2Event
+		vSegments = self.vFeedback.GetMessages(bIsPS2Event, 1990)
+		vFeedbackFile = self.vFeedback.SaveToFile(f"{Directories.feedbackPrefix}{self.vOpData.fileName}", bIsPS2Event)
 
-		if vFeedbackMsg.__len__() > 2000: # greater than discords max message limit
-			vFeedbackMsg = vFeedbackMsg[1900:] + "\n\n**Feedback is too large!**\nDownload file to see entire message."
-
-		
 		facilityFeed = ""
-		if self.vOpData.options.bIsPS2Event:
-			for facility in self.vOpsEventTracker.sessionStats.facilityFeed:
-				facilityFeed += f"{facility}\n"
-			if facilityFeed.__len__() > 4000:
-				facilityFeed = facilityFeed[3900:]
+		if bIsPS2Event:
+			facilityFeed = self.vOpsEventTracker.sessionStats.facilityFeed.GetText(1950)
 
 
 		if self.vOpData.options.bUseSoberdogsFeedback:
 			BUPrint.Debug("using soberdogs feedback")
-			feedbackFile = discord.File( self.vFeedback.SaveToFile(f"{Directories.feedbackPrefix}{self.vOpData.fileName}") )
 
-			if self.soberdogFeedbackMsg == None:
+			if self.soberdogFeedbackThread == None:
 				self.soberdogFeedbackForum = self.vBotRef.get_channel(Channels.soberFeedbackID)
 
 				threadName = f"{self.vOpData.name} {self.vOpData.date.date()}"
@@ -1126,42 +1109,74 @@ class Commander():
 				self.soberdogFeedbackThread = await self.soberdogFeedbackForum.create_thread(
 					name= threadName,
 					content=f"**Facility Feed:**\n{facilityFeed}",
-					files=self.GetGraphs()
+					files=await self.GetGraphs()
 				)
 
-
-				self.soberdogFeedbackMsg = await self.soberdogFeedbackThread.thread.send(content=vFeedbackMsg, file=feedbackFile)
-				return
-			else:
-				await self.soberdogFeedbackMsg.edit(content=vFeedbackMsg, attachments=[feedbackFile])
-				return
+			self.soberdogFeedbackMsgs = await self.SendFeedbackMessages(self.soberdogFeedbackThread.thread, self.soberdogFeedbackMsgs, vSegments, vFeedbackFile)
+			return
 
 		
 		BUPrint.Debug("using normal feedback")
-		if self.notifFeedbackMsg == None:
-			feedbackFile = discord.File( self.vFeedback.SaveToFile(f"{Directories.feedbackPrefix}{self.vOpData.fileName}") )
+		bIsFirstPost = len(self.notifFeedbackMsgs) == 0
+		self.notifFeedbackMsgs = await self.SendFeedbackMessages(self.notifChn, self.notifFeedbackMsgs, vSegments, vFeedbackFile)
 
-			self.notifFeedbackMsg = await self.notifChn.send(content=vFeedbackMsg, file=feedbackFile)
-			if self.vOpData.options.bIsPS2Event and commanderSettings.bTrackingIsEnabled:
-				await self.notifChn.send(content=f"**Facility Feed:**:\n{facilityFeed}")
-				await self.notifChn.send(content="Stat visualisation", files=self.GetGraphs() )
-		
-		else:
-			await self.notifFeedbackMsg.edit(content=vFeedbackMsg, attachments=[feedbackFile])
+		if bIsFirstPost and bIsPS2Event and commanderSettings.bTrackingIsEnabled:
+			await self.notifChn.send(content=f"**Facility Feed:**\n{facilityFeed}")
+			await self.notifChn.send(content="Stat visualisation", files=await self.GetGraphs() )
 
 
 		await self.UpdateCommanderLive()
 
 
 
-	def GetGraphs(self):
+	async def SendFeedbackMessages(self, p_channel:discord.abc.Messageable, p_messages:list[discord.Message], p_segments:list[str], p_filePath:str) -> list[discord.Message]:
+		"""# SEND FEEDBACK MESSAGES
+		Edits the existing feedback messages to match the segments, sending more if needed and removing any left over.
+		The feedback file, if saved, is attached to the first message.
+
+		## RETURNS
+		The feedback messages.
+		"""
+		vMessages = p_messages.copy()
+
+		for index, segment in enumerate(p_segments):
+			vFiles = [discord.File(p_filePath)] if index == 0 and p_filePath != "" else []
+
+			try:
+				if index < len(vMessages):
+					if index == 0:
+						await vMessages[index].edit(content=segment, attachments=vFiles)
+					else:
+						await vMessages[index].edit(content=segment)
+				else:
+					vMessages.append( await p_channel.send(content=segment, files=vFiles) )
+
+			except discord.HTTPException as vError:
+				BUPrint.LogErrorExc("Unable to send feedback message.", vError)
+
+		for message in vMessages[len(p_segments):]:
+			try:
+				await message.delete()
+			except discord.HTTPException as vError:
+				BUPrint.LogErrorExc("Unable to remove feedback message.", vError)
+
+		return vMessages[:len(p_segments)]
+
+
+
+	async def GetGraphs(self):
 		""" # GET GRAPHS
-		Returns a list[discord.File] of graphs for the event. """
+		Returns a list[discord.File] of graphs for the event: all metrics, followed by any per-metric graphs set in settings. """
 		graphList = []
 		if not self.vOpData.options.bIsPS2Event or not commanderSettings.bTrackingIsEnabled:
 			return []
 
-		graphList.append( discord.File(GraphMaker.CreateGraphAll(self.vOpData.fileName, self.vOpsEventTracker.eventPoints)) )
+		vEventPoints = self.vOpsEventTracker.eventPoints
+
+		graphList.append( discord.File(await GraphMaker.CreateGraphAll(self.vOpData.fileName, vEventPoints), filename=f"{self.vOpData.fileName}_StatVisAll.png") )
+
+		for metric in commanderSettings.debriefGraphMetrics:
+			graphList.append( discord.File(await GraphMaker.CreateGraphMetric(self.vOpData.fileName, vEventPoints, metric), filename=f"{self.vOpData.fileName}_StatVis_{metric}.png") )
 
 
 		return graphList
@@ -1191,7 +1206,161 @@ class Commander():
 		else:
 			BUPrint.Debug("	>> For fun vehicle event being scheduled!")
 			p_event.bHasSetSchedTask = True
-			self.scheduler.add_job(Commander.SendForFunVehicleDeath, "date", run_date=(datetime.now(timezone.utc) + timedelta(seconds=10)), args=[self, p_event])
+			self.AddScheduledJob(f"forFun{id(p_event)}", Commander.SendForFunVehicleDeath, "date", p_args=[self, p_event], run_date=(datetime.now(timezone.utc) + timedelta(seconds=10)))
+
+############  COMMANDER RENDER CLASSES
+
+class ParticipantRowCache():
+	"""
+	# PARTICIPANT ROW CACHE
+	Caches the rows of the connections embed for each participant.
+
+	A participants rows are only rebuilt when its status changes, and the joined strings only when a row or the participants change.
+	"""
+	def __init__(self) -> None:
+		self.rows: dict[int, tuple[tuple, str, str]] = {} # Discord ID : (status signature, player row, status row)
+		self.order: tuple[int] = ()
+		self.playersStr = ""
+		self.statusStr = ""
+
+
+	@staticmethod
+	def GetSignature(p_participant:Participant) -> tuple:
+		"""# GET SIGNATURE
+		Returns a tuple of every value shown in the participants rows."""
+		vLibEntry = p_participant.libraryEntry
+		return (
+			p_participant.discordUser.display_name,
+			p_participant.discordUser.status == discord.Status.offline,
+			p_participant.discordUser.voice == None,
+			p_participant.bInEventChannel,
+			vLibEntry != None and vLibEntry.ps2ID != -1,
+			p_participant.bPS2Online,
+			vLibEntry != None and vLibEntry.bIsRecruit
+		)
+
+
+	@staticmethod
+	def CreateStatusRow(p_signature:tuple) -> str:
+		"""# CREATE STATUS ROW
+		Creates the status row from a participants signature."""
+		vName, bDiscordOffline, bNoVoice, bInEventChannel, bValidPS2, bPS2Online, bIsRecruit = p_signature
+
+		if bDiscordOffline:
+			vStatusStr = f"{commanderSettings.connIcon_discordOffline} | "
+		else:
+			vStatusStr = f"{commanderSettings.connIcon_discordOnline} | "
+
+
+		if bNoVoice:
+			vStatusStr += f"{commanderSettings.connIcon_voiceDisconnected} | "
+		elif bInEventChannel:
+			vStatusStr += f"{commanderSettings.connIcon_voiceConnected} | "
+		else:
+			vStatusStr += f"{commanderSettings.connIcon_voiceNotEventChan} | "
+
+
+		if bValidPS2:
+			if bPS2Online:
+				vStatusStr += f"{commanderSettings.connIcon_ps2Online}"
+			else:
+				vStatusStr += f"{commanderSettings.connIcon_ps2Offline}"
+
+		else:
+			vStatusStr += f"{commanderSettings.connIcon_ps2Invalid}"
+
+
+		if BotSettings.botFeatures.UserLibrary and bIsRecruit:
+			vStatusStr += f" | {commanderSettings.connIcon_ps2Recruit}"
+
+		return vStatusStr
+
+
+	def Render(self, p_participants:list[Participant]) -> tuple[str, str]:
+		"""# RENDER
+		Returns the players & status strings of the connections embed, rebuilding only what changed.
+		"""
+		vOrder = tuple(participant.discordID for participant in p_participants)
+		bChanged = vOrder != self.order
+
+		if bChanged:
+			self.order = vOrder
+			vCurrentIDs = set(vOrder)
+			self.rows = {discordID: row for discordID, row in self.rows.items() if discordID in vCurrentIDs}
+
+		for participant in p_participants:
+			vSignature = self.GetSignature(participant)
+			vCachedRow = self.rows.get(participant.discordID)
+
+			if vCachedRow == None or vCachedRow[0] != vSignature:
+				self.rows[participant.discordID] = (vSignature, vSignature[0], self.CreateStatusRow(vSignature))
+				bChanged = True
+
+		if bChanged:
+			self.playersStr = "\u200b\n" + "".join(f"{self.rows[discordID][1]}\n" for discordID in vOrder)
+			self.statusStr = f"{commanderSettings.connIcon_discord} | {commanderSettings.connIcon_voice} | {commanderSettings.connIcon_ps2}\n"
+			self.statusStr += "".join(f"{self.rows[discordID][2]}\n" for discordID in vOrder)
+
+		return (self.playersStr, self.statusStr)
+
+
+
+class CommanderView(discord.ui.View):
+	"""
+	# COMMANDER VIEW
+	The view of the commander message.  Buttons are created once, and re-arranged when the Op Status changes.
+	"""
+	def __init__(self, p_commanderParent:Commander):
+		super().__init__(timeout=None)
+		self.commanderStatus: CommanderStatus = None
+
+		self.btnStart = Commander_btnStart(p_commanderParent)
+		self.btnEnd = Commander_btnEnd(p_commanderParent)
+		self.btnDebrief = Commander_btnDebrief(p_commanderParent)
+		self.btnDownloadDebrief = Commander_btnDownloadFeedback(p_commanderParent)
+		self.btnNotify = Commander_btnNotify(p_commanderParent)
+		self.btnHelp = discord.ui.Button(
+							label="HELP",
+							emoji="❓",
+							url="https://github.com/LCWilliams/planetside-discord-bot/wiki/Op-Commander"
+					)
+
+
+	def SetStatus(self, p_status:CommanderStatus):
+		"""# SET STATUS
+		Updates the buttons to match the status.  Does nothing if the status is unchanged."""
+		if p_status == self.commanderStatus:
+			return
+
+		self.commanderStatus = p_status
+		self.clear_items()
+
+		# Before op Started:
+		if p_status.value < CommanderStatus.Started.value:
+			self.btnEnd.disabled = True
+			self.btnDebrief.disabled = True
+			self.add_item(self.btnStart)
+			self.add_item(self.btnNotify)
+
+		# Ops Started:
+		elif p_status == CommanderStatus.Started:
+			self.btnStart.disabled = True
+			self.btnDebrief.disabled = False
+			self.btnEnd.disabled = False
+			self.add_item(self.btnDebrief)
+			self.add_item(self.btnEnd)
+
+		# Debrief:
+		elif p_status == CommanderStatus.Debrief:
+			self.btnStart.disabled = True
+			self.btnDebrief.disabled = True
+			self.btnEnd.disabled = False
+			self.add_item(self.btnDownloadDebrief)
+			self.add_item(self.btnEnd)
+
+		self.add_item(self.btnHelp)
+
+
 
 ############  COMMANDER BUTTON CLASSES
 
@@ -1278,12 +1447,12 @@ class Commander_btnDownloadFeedback(discord.ui.Button):
 
 
 	async def callback(self, p_interaction:discord.Interaction):
-		if len(self.vCommander.vFeedback.userID) == 0:
+		if len(self.vCommander.vFeedback) == 0:
 			await p_interaction.response.send_message("No user feedback yet!", ephemeral=True)
 			return
 
 
-		vFilePath = self.vCommander.vFeedback.SaveToFile(self.vCommander.vOpData.fileName)
+		vFilePath = self.vCommander.vFeedback.SaveToFile(self.vCommander.vOpData.fileName, self.vCommander.vOpData.options.bIsPS2Event)
 		if vFilePath != "":
 			vMessage = ""
 
@@ -1328,7 +1497,7 @@ class FeedbackModal(discord.ui.Modal):
 	def __init__(self, p_parentCommander:Commander , p_callingUser:discord.User):
 		super().__init__(title="Feedback", timeout=None)
 		self.parentCommander = p_parentCommander
-		self.foundUserID = -1
+		self.existingEntry: FeedbackEntry = None
 		self.bIsPS2Event = self.parentCommander.vOpData.options.bIsPS2Event
 		self.PropogateFields(p_callingUser.id)
 
@@ -1339,22 +1508,18 @@ class FeedbackModal(discord.ui.Modal):
 
 
 	async def on_submit(self, pInteraction:discord.Interaction):
-		if self.foundUserID == -1:
-			BUPrint.Debug("No user ID found; new feedback entry...")
-			self.parentCommander.vFeedback.userID.append(pInteraction.user.id)
-			self.parentCommander.vFeedback.generic.append(f"{self.txt_general.value}")
-			if self.bIsPS2Event:
-				self.parentCommander.vFeedback.forSquadmates.append(f"{self.txt_squadMates.value}")
-				self.parentCommander.vFeedback.forSquadLead.append(f"{self.txt_squadLead.value}")
-				self.parentCommander.vFeedback.forPlatLead.append(f"{self.txt_platLead.value}")
-
+		if self.existingEntry == None:
+			BUPrint.Debug("No feedback found for user; new feedback entry...")
 		else:
-			BUPrint.Debug(f"Found user ID at position {self.foundUserID}, updating entry...")
-			self.parentCommander.vFeedback.generic[self.foundUserID] = self.txt_general.value
-			if self.bIsPS2Event:
-				self.parentCommander.vFeedback.forSquadmates[self.foundUserID] = self.txt_squadMates.value
-				self.parentCommander.vFeedback.forSquadLead[self.foundUserID] = self.txt_squadLead.value
-				self.parentCommander.vFeedback.forPlatLead[self.foundUserID] = self.txt_platLead.value
+			BUPrint.Debug("Found feedback for user, updating entry...")
+
+		vEntry = FeedbackEntry(generic=self.txt_general.value)
+		if self.bIsPS2Event:
+			vEntry.forSquadmates = self.txt_squadMates.value
+			vEntry.forSquadLead = self.txt_squadLead.value
+			vEntry.forPlatLead = self.txt_platLead.value
+
+		self.parentCommander.vFeedback.SetEntry(pInteraction.user.id, vEntry)
 
 
 		await self.parentCommander.CreateFeedback()
@@ -1364,20 +1529,13 @@ class FeedbackModal(discord.ui.Modal):
 	def PropogateFields(self, p_userID:int):
 		"""
 		# PROPOGATE FIELDS
-		Finds the user ID and pre-sets the fields if present.
+		Finds the users existing feedback and pre-sets the fields if present.
 		"""
-		feedback = self.parentCommander.vFeedback
-
-		index = 0
-		for userID in self.parentCommander.vFeedback.userID:
-			if userID == p_userID:
-				self.foundUserID = index
-				break
-			index += 1
+		self.existingEntry = self.parentCommander.vFeedback.GetEntry(p_userID)
 
-		if self.foundUserID != -1:
-			self.txt_general.default = feedback.generic[index]
+		if self.existingEntry != None:
+			self.txt_general.default = self.existingEntry.generic
 			if self.bIsPS2Event:
-				self.txt_squadMates.default = feedback.forSquadmates[index]
-				self.txt_squadLead.default = feedback.forSquadLead[index]
-				self.txt_platLead.default = feedback.forPlatLead[index]
\ No newline at end of file
+				self.txt_squadMates.default = self.existingEntry.forSquadmates
+				self.txt_squadLead.default = self.existingEntry.forSquadLead
+				self.txt_platLead.default = self.existingEntry.forPlatLead
\ No newline at end of file
@@ -0,0 +1,198 @@
+"""
+OP COMMANDER - EVENT STATS:
+Statistics for a tracked planetside 2 event.
+
+Each participant is given a row, and each metric is a column; events increment the relevant columns of a row.
+Totals, event points and leaderboards are derived from the columns when needed, so they always match the participants stats.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+
+import numpy as np
+
+from botData.dataObjects import EventPoint, Participant, PS2SessionKDA, PS2SessionMedic, PS2SessionEngineer
+
+
+class EventStats():
+	"""
+	# EVENT STATS
+	Per participant counters for an event, stored as a 2D array of (metric, row).
+
+	Rows are never removed, so participants who leave mid-event still count towards the totals.
+	"""
+	metrics = (
+		# Kills
+		"kills", "killedAllies", "killedSquad", "assists", "vehiclesDestroyed",
+		# Deaths
+		"deathTotal", "deathByEnemies", "deathByAllies", "deathBySquad", "deathBySuicide",
+		# Medic
+		"revives", "heals",
+		# Engineer
+		"repairScore", "resupplyScore",
+		"score"
+	)
+	"""Per participant metrics; names match the attributes of the session data objects."""
+
+	eventMetrics = ("captured", "defended")
+	"""Event wide metrics, not attributed to a participant."""
+
+	kdaMetrics = ("kills", "killedAllies", "killedSquad", "assists", "vehiclesDestroyed", "deathTotal", "deathByEnemies", "deathByAllies", "deathBySquad", "deathBySuicide")
+	medicMetrics = ("revives", "heals")
+	engineerMetrics = ("repairScore", "resupplyScore")
+
+
+	def Index(*p_metrics:str) -> np.ndarray:
+		"""# INDEX
+		Returns the column indexes of the metrics, for use with `Add`."""
+		return np.array([EventStats.metrics.index(metric) for metric in p_metrics], dtype=np.intp)
+
+
+	def __init__(self, p_initialRows:int = 16) -> None:
+		self.columns = np.zeros((len(EventStats.metrics), max(p_initialRows, 1)), dtype=np.int64)
+		self.rows: dict[int, int] = {}
+		"""PS2 Character ID : Row."""
+		self.participants: list[Participant] = []
+		"""Participant of each row."""
+
+		self.eventCounts = np.zeros(len(EventStats.eventMetrics), dtype=np.int64)
+
+		# Interval snapshots: the totals at the start of each interval.
+		self.intervalTimes: list[datetime] = []
+		self.intervalActive: list[int] = []
+		self.intervalTotals: list[np.ndarray] = []
+
+
+	def SetParticipants(self, p_participants:list[Participant]):
+		"""# SET PARTICIPANTS
+		Adds a row for each participant with a PS2 character not already tracked."""
+		for participant in p_participants:
+			if participant.ps2CharID == -1:
+				continue
+
+			if participant.ps2CharID in self.rows:
+				self.participants[self.rows[participant.ps2CharID]] = participant
+				continue
+
+			vRow = len(self.participants)
+			if vRow == self.columns.shape[1]:
+				self.columns = np.concatenate((self.columns, np.zeros_like(self.columns)), axis=1)
+
+			self.rows[participant.ps2CharID] = vRow
+			self.participants.append(participant)
+
+
+	def GetParticipant(self, p_charID:int) -> Participant|None:
+		"""# GET PARTICIPANT
+		Returns the participant of the character, or None if they're not a participant."""
+		vRow = self.rows.get(p_charID)
+		if vRow == None:
+			return None
+
+		return self.participants[vRow]
+
+
+	def Add(self, p_charID:int, p_metrics:np.ndarray, p_amount:int = 1) -> bool:
+		"""# ADD
+		Increments the metrics of the characters row.
+
+		## PARAMETERS
+		- `p_charID`: PS2 Character ID of the participant.
+		- `p_metrics`: Column indexes, from `EventStats.Index`.
+		- `p_amount`: Amount added to each metric.
+
+		## RETURNS
+		`bool`: False if the character isn't a participant.
+		"""
+		vRow = self.rows.get(p_charID)
+		if vRow == None:
+			return False
+
+		self.columns[p_metrics, vRow] += p_amount
+		return True
+
+
+	def AddEvent(self, p_metric:str, p_amount:int = 1):
+		"""# ADD EVENT
+		Increments an event wide metric."""
+		self.eventCounts[EventStats.eventMetrics.index(p_metric)] += p_amount
+
+
+	def GetTotalsArray(self) -> np.ndarray:
+		"""# GET TOTALS ARRAY
+		Returns the totals of each metric, followed by the event metrics."""
+		return np.concatenate((self.columns[:, :len(self.participants)].sum(axis=1), self.eventCounts))
+
+
+	def GetTotals(self) -> dict[str, int]:
+		"""# GET TOTALS
+		Returns metric : total, for all metrics."""
+		return dict(zip(EventStats.metrics + EventStats.eventMetrics, self.GetTotalsArray().tolist()))
+
+
+	def GetLeaderboard(self, p_metric:str, p_count:int = 3) -> list[tuple[Participant, int]]:
+		"""# GET LEADERBOARD
+		Returns up to `p_count` (participant, value) with the highest non-zero value for the metric, highest first."""
+		vValues = self.columns[EventStats.metrics.index(p_metric), :len(self.participants)]
+		vOrder = np.argsort(-vValues, kind="stable")[:p_count]
+
+		return [(self.participants[row], int(vValues[row])) for row in vOrder if vValues[row] > 0]
+
+
+	def NewInterval(self, p_timestamp:datetime, p_activeParticipants:int):
+		"""# NEW INTERVAL
+		Ends the current interval and starts a new one."""
+		self.intervalTimes.append(p_timestamp)
+		self.intervalActive.append(p_activeParticipants)
+		self.intervalTotals.append(self.GetTotalsArray())
+
+
+	def GetIntervalCount(self) -> int:
+		"""# GET INTERVAL COUNT
+		Returns the number of completed intervals."""
+		return max(len(self.intervalTimes) - 1, 0)
+
+
+	def GetEventPoints(self) -> list[EventPoint]:
+		"""# GET EVENT POINTS
+		Returns an event point for each completed interval, from the difference between its totals and those of the next interval."""
+		if len(self.intervalTotals) < 2:
+			return []
+
+		vDeltas = np.diff(np.stack(self.intervalTotals), axis=0)
+		vColumns = {metric: vDeltas[:, index].tolist() for index, metric in enumerate(EventStats.metrics + EventStats.eventMetrics)}
+
+		return [
+			EventPoint(
+				timestamp=self.intervalTimes[index],
+				activeParticipants=self.intervalActive[index],
+				captured=vColumns["captured"][index],
+				defended=vColumns["defended"][index],
+				deaths=vColumns["deathTotal"][index] + vColumns["deathBySuicide"][index],
+				kills=vColumns["kills"][index],
+				revives=vColumns["revives"][index],
+				repairs=vColumns["repairScore"][index]
+			)
+			for index in range(len(vDeltas))
+		]
+
+
+	def WriteSessions(self):
+		"""# WRITE SESSIONS
+		Sets the stats of each participants session from their row.
+		Medic and engineer data are only set for participants with stats for them."""
+		for row, participant in enumerate(self.participants):
+			if participant.userSession == None:
+				continue
+
+			vValues = dict(zip(EventStats.metrics, self.columns[:, row].tolist()))
+
+			participant.userSession.kda = PS2SessionKDA(**{metric: vValues[metric] for metric in EventStats.kdaMetrics})
+
+			if any(vValues[metric] for metric in EventStats.medicMetrics):
+				participant.userSession.medicData = PS2SessionMedic(**{metric: vValues[metric] for metric in EventStats.medicMetrics})
+
+			if any(vValues[metric] for metric in EventStats.engineerMetrics):
+				participant.userSession.engineerData = PS2SessionEngineer(**{metric: vValues[metric] for metric in EventStats.engineerMetrics})
+
+			participant.userSession.score = vValues["score"]
@@ -4,22 +4,36 @@ Deals with live ops tracking by use of events.
 """
 from __future__ import annotations
 
-from auraxium.event import EventClient, Trigger, PlayerLogin, PlayerLogout, GainExperience, VehicleDestroy
-from auraxium.ps2 import Character, Vehicle, MapRegion
+from typing import TYPE_CHECKING
+
+from auraxium.event import EventClient, Trigger, GainExperience
+from auraxium.ps2 import Character, MapRegion
 from auraxium.errors import ServiceUnavailableError
-from auraxium import event
+
+if TYPE_CHECKING:
+	from auraxium.event import PlayerLogin, PlayerLogout
+	from auraxium import event
 
 from datetime import datetime, timezone
 
-from botUtils import BotPrinter as BUPrint
+from botUtils import BotPrinter
 from botUtils import GetDiscordTime
 from botData.utilityData import DateFormat
 
 from botData.settings import ForFun, BotSettings
-from botData.dataObjects import EventPoint, Participant, EventID, PS2SessionKDA, PS2SessionEngineer, PS2SessionMedic, ForFunData, ForFunVehicleDeath, FacilityData, PS2EventTotals
+from botData.dataObjects import EventPoint, Participant, EventID, ForFunData, ForFunVehicleDeath, FacilityData, PS2EventTotals
+from OpCommander.eventStats import EventStats
 
 from random import choice
 
+import numpy as np
+
+from botMetrics import BotMetrics, censusRequests
+
+BUPrint = BotPrinter.GetLogger("commander.events")
+
+trackerHandlers = BotMetrics.Histogram("tracker_handler_seconds", "Duration of ops event tracker callbacks.", ("event",))
+
 
 class OpsEventTracker():
 	"""
@@ -28,6 +42,22 @@ class OpsEventTracker():
 
 	Must be passed a participant list before starting!
 	"""
+	# Stat columns incremented by each event.
+	statRepair = EventStats.Index("repairScore")
+	statResupply = EventStats.Index("resupplyScore")
+	statHeal = EventStats.Index("heals")
+	statRevive = EventStats.Index("revives", "score")
+	statKill = EventStats.Index("kills", "score")
+	statAssist = EventStats.Index("assists", "score")
+	statVehicleDestroyed = EventStats.Index("vehiclesDestroyed")
+	statSuicide = EventStats.Index("deathBySuicide")
+	statDeath = EventStats.Index("deathTotal")
+	statDeathByEnemy = EventStats.Index("deathTotal", "deathByEnemies")
+	statDeathByAlly = EventStats.Index("deathTotal", "deathByAllies")
+	statDeathBySquad = EventStats.Index("deathTotal", "deathByAllies", "deathBySquad")
+	statKilledAlly = EventStats.Index("killedAllies")
+	statKilledSquad = EventStats.Index("killedAllies", "killedSquad")
+
 	def __init__(self, p_aurClient: EventClient) -> None:
 		self.auraxClient = p_aurClient
 		self.updateParentFunction:callable = None
@@ -42,37 +72,38 @@ class OpsEventTracker():
 		# LAST FACILITY DEFENDED/CAPTURED
 		self.lastFacilityCaptured: FacilityData = None
 		self.lastFacilityDefended: FacilityData = None
-		# Session Stats, encapsulates KDA & facility capture/defense into a single dataclass.
+		# Session Stats, holds the facility feed.
 		self.sessionStats:PS2EventTotals = PS2EventTotals()
-		self.sessionStats.eventKDA = PS2SessionKDA()
 
 		self.forFunVehicleDeaths: list[ForFunVehicleDeath] = []
 
-		# More detailed, time set data.
-		self.eventPoints: list[EventPoint] = []
-		self.currentEventPoint:EventPoint = None
+		# Per participant stats, from which totals & event points are derived.
+		self.stats = EventStats()
 		BUPrint.Info("Ops Event Tracker initialised!")
 
 
 
+	@property
+	def eventPoints(self) -> list[EventPoint]:
+		"""Event points of each completed interval, derived from the stats."""
+		return self.stats.GetEventPoints()
+
+
+
 	def Start(self):
 		"""
 		# START
 		Starts the tracking and locks in the participants.
 		"""
 
-		self.currentEventPoint = EventPoint(timestamp=datetime.now(timezone.utc), activeParticipants=self.participants.__len__())
 		# Redundancy, the event should be closed without ever calling start if there's no participants.
 		if self.participants.__len__() == 0:
 			BUPrint.LogError(p_titleStr="OPS EVENT TRACKER | ", p_string="Not starting tracker, no participants!")
 			return
 		
+		self.stats.SetParticipants(self.participants)
+		self.stats.NewInterval(datetime.now(timezone.utc), self.participants.__len__())
 		self.CreateTriggers()
-
-		# Create KDA object.  Since every participant is capable of obtaining this; it is created for everyone, unlike the role specific objects.
-		for participant in self.participants:
-			participant.userSession.kda = PS2SessionKDA()
-		
 		
 		BUPrint.Info("Full event Tracking has started!")
 
@@ -92,7 +123,8 @@ class OpsEventTracker():
 		and is added to the client immediately- intended to be called from the commander after the participant list has changed.
 		"""
 		self.participants = p_newParticipantList
-		BUPrint.Debug(f"Creating Login/Out Triggers, for :{self.participants}")
+		self.stats.SetParticipants(self.participants)
+		BUPrint.Debug("Creating Login/Out Triggers, for :%s", self.participants)
 
 		if len(p_newParticipantList) == 0:
 			BUPrint.Debug("Participant list is empty. Not creating login triggers.")
@@ -109,7 +141,7 @@ class OpsEventTracker():
 
 
 		vCharList:list[int] = [participant.ps2CharID for participant in self.participants if participant.ps2CharID != -1]
-		BUPrint.Debug(f"	> Character Trigger List: {vCharList}")	
+		BUPrint.Debug("	> Character Trigger List: %s", vCharList)	
 
 		if vCharList.__len__() == 0:
 			BUPrint.Debug("No Characters, not creating triggers.")
@@ -133,11 +165,13 @@ class OpsEventTracker():
 
 
 
+	@BotMetrics.Timed(trackerHandlers, "login")
 	async def UpdatePlayerLogin(self, p_loginEvent: PlayerLogin):
 		await self.UpdatePlayerStatus(p_loginEvent.character_id, True)
 
 
 
+	@BotMetrics.Timed(trackerHandlers, "logout")
 	async def UpdatePlayerLogout(self, p_logoutEvent: PlayerLogout):
 		await self.UpdatePlayerStatus(p_logoutEvent.character_id, False)
 
@@ -152,7 +186,7 @@ class OpsEventTracker():
 		for participant in self.participants:
 			if participant.ps2CharID == p_charID:
 				participant.bPS2Online = p_isLoggedIn
-				BUPrint.Debug(f"Participant: {participant.discordUser.display_name} updated.  Online [{p_isLoggedIn}]")
+				BUPrint.Debug("Participant: %s updated.  Online [%s]", participant.discordUser.display_name, p_isLoggedIn)
 				await self.updateParentFunction()
 				return
 		BUPrint.Debug("Player Status attempted update but participant not found")
@@ -161,19 +195,13 @@ class OpsEventTracker():
 
 	def NewEventPoint(self):
 		"""# NEW EVENT POINT
-		Moves the current event point into the point list, and sets a new one.
+		Ends the current event point interval, and starts a new one.
 		"""
-		if self.currentEventPoint != None:
-			self.eventPoints.append(self.currentEventPoint)
-		
 		stillOnline = [participant for participant in self.participants if participant.bPS2Online].__len__()
-	
-		
-		self.currentEventPoint = EventPoint(timestamp=datetime.now(timezone.utc), activeParticipants=stillOnline)
-		# self.currentEventPoint.timestamp = datetime.now(timezone.utc)
-		# self.currentEventPoint.activeParticipants = stillOnline
 
-		BUPrint.Debug(f"New Event Point: TimeStamp:{datetime.now(timezone.utc).time()}, Active Participants: {stillOnline}")
+		self.stats.NewInterval(datetime.now(timezone.utc), stillOnline)
+
+		BUPrint.Debug("New Event Point: Active Participants: %d", stillOnline)
 
 
 
@@ -260,6 +288,15 @@ class OpsEventTracker():
 				)
 			)
 
+			# Vehicle Destroyed
+			self.auraxClient.add_trigger(
+				Trigger(
+					action=self.VehicleDestroyed,
+					characters=playerCharacters,
+					event="VehicleDestroy"
+				)
+			)
+
 			self.auraxClient.add_trigger(
 				Trigger(
 					action=self.FacilityCapture,
@@ -289,16 +326,7 @@ class OpsEventTracker():
 		
 		None if not found, though this occurance shouldn't happen for events related to participants, it will occur for Deaths; when the attacker ID is not another participant. 
 		"""
-		for participant in self.participants:
-			if participant.ps2CharID == -1:
-				BUPrint.Debug(f"No PS2Char ID set for: {participant.ps2CharID}: Likely enemy.")
-				return None
-
-			BUPrint.Debug(f"Checking ID: {participant.ps2CharID} to: {p_playerCharID}")
-			if participant.ps2CharID == p_playerCharID:
-				return participant 
-		
-		return None
+		return self.stats.GetParticipant(p_playerCharID)
 
 
 
@@ -327,91 +355,48 @@ class OpsEventTracker():
 
 # # # # # EVENT FUNCTIONS
 
+	@BotMetrics.Timed(trackerHandlers, "repair")
 	def EngSquadVehicleRepair(self, p_event: event.GainExperience):
 		""" # ENGINEER SQUAD VEHICLE REPAIR:
 		Event function for when a player gains experience from repairing a squad vehicle.
 		"""
 		BUPrint.Debug("Vehicle repair!")
-		vParticipant = self.GetMatchingParticipant(p_event.character_id)
-		
-		if vParticipant == None:
-			return
-
-		if vParticipant.userSession.engineerData == None:
-			vParticipant.userSession.engineerData = PS2SessionEngineer()
-
-		# Set operatons Event Point:
-		self.currentEventPoint.repairs += p_event.amount
-		
-		# Set participants data:
-		vParticipant.userSession.engineerData.repairScore += p_event.amount
+		self.stats.Add(p_event.character_id, OpsEventTracker.statRepair, p_event.amount)
 	
 
 
+	@BotMetrics.Timed(trackerHandlers, "resupply")
 	def EngSquadResupply(self, p_event: event.GainExperience):
 		""" # ENGINEER SQUAD RESUPPLY:
-		Event function for when a player gains experience from repairing a squad vehicle.
+		Event function for when a player gains experience from resupplying a squadmate.
 		"""
 		BUPrint.Debug("Squad resupply!")
-		vParticipant = self.GetMatchingParticipant(p_event.character_id)
-		
-		if vParticipant == None:
-			return
-
-		if vParticipant.userSession.engineerData == None:
-			vParticipant.userSession.engineerData = PS2SessionEngineer()
-
-		# Set operatons Event Point:  (none)
-		# self.currentEventPoint.resupply += p_event.amount
-		
-		# Set participants data:
-		vParticipant.userSession.engineerData.resupplyScore += p_event.amount
+		self.stats.Add(p_event.character_id, OpsEventTracker.statResupply, p_event.amount)
 
 
 
+	@BotMetrics.Timed(trackerHandlers, "heal")
 	def MedicSquadHeal(self, p_event: event.GainExperience):
 		"""# MEDIC SQUAD HEAL
 		Event function for when a player gains experience from healing a squadmate.
 		"""
 		BUPrint.Debug("Squad Heals!")
-		vParticipant = self.GetMatchingParticipant(p_event.character_id)
-		
-		if vParticipant == None:
-			return
-
-		if vParticipant.userSession.medicData == None:
-			vParticipant.userSession.medicData = PS2SessionMedic()
-
-		# Set operatons Event Point: (None)
-		# self.currentEventPoint.revives += p_event.amount
-		
-		# Set participants data:
-		vParticipant.userSession.medicData.heals += p_event.amount
+		self.stats.Add(p_event.character_id, OpsEventTracker.statHeal, p_event.amount)
 
 
 
+	@BotMetrics.Timed(trackerHandlers, "revive")
 	def MedicSquadRevive(self, p_event: event.GainExperience):
 		"""# MEDIC SQUAD REVIVE
 		Event function for when a player gains experience from reviving a squadmate.
 		"""
 		BUPrint.Debug("Squad revive!")
-		vParticipant = self.GetMatchingParticipant(p_event.character_id)
-		
-		if vParticipant == None:
-			return
-
-		if vParticipant.userSession.medicData == None:
-			vParticipant.userSession.medicData = PS2SessionMedic()
-
-		# Set operatons Event Point:
-		self.currentEventPoint.revives += 1
-		
-		# Set participants data:
-		vParticipant.userSession.medicData.revives += 1
-		vParticipant.userSession.score += p_event.amount
+		# Revives & score are both incremented; score by the experience gained.
+		self.stats.Add(p_event.character_id, OpsEventTracker.statRevive, np.array([1, p_event.amount]))
 
 
 
+	@BotMetrics.Timed(trackerHandlers, "kill")
 	def GotKill(self, p_event: event.GainExperience):
 		"""# GOT KILL:
 		Function to run when a player has gotten a kill.
@@ -420,65 +405,69 @@ class OpsEventTracker():
 		Death event does this instead.
 		"""
 		BUPrint.Debug("Player got a kill! :o")
-		self.currentEventPoint.kills += 1
-
-		vParticipant = self.GetMatchingParticipant(p_event.character_id)
-
-		vParticipant.userSession.score += p_event.amount
-		vParticipant.userSession.kda.kills += 1
-
-		self.sessionStats.eventKDA.kills += 1
+		self.stats.Add(p_event.character_id, OpsEventTracker.statKill, np.array([1, p_event.amount]))
 		
 
 
+	@BotMetrics.Timed(trackerHandlers, "assist")
 	async def GotAssist(self, p_event: event.GainExperience):
 		"""# GOT ASSIST
 		Function to run when a player gets a kill assist.  
 		Infantry assists only (fornow(tm)).
 		"""
-		self.sessionStats.eventKDA.assists += 1
-		vParticipant = self.GetMatchingParticipant(p_event.character_id)
+		self.stats.Add(p_event.character_id, OpsEventTracker.statAssist, np.array([1, p_event.amount]))
+
+
+
+	@BotMetrics.Timed(trackerHandlers, "vehicleDestroy")
+	def VehicleDestroyed(self, p_event: event.VehicleDestroy):
+		"""# VEHICLE DESTROYED
+		Function to run when a participant destroys an enemy vehicle, or their own is destroyed."""
+		if p_event.attacker_character_id == p_event.character_id or p_event.attacker_team_id == p_event.team_id:
+			return
 
-		vParticipant.userSession.score += p_event.amount
-		vParticipant.userSession.kda.assists += 1
+		self.stats.Add(p_event.attacker_character_id, OpsEventTracker.statVehicleDestroyed)
 
 
 
+	@BotMetrics.Timed(trackerHandlers, "death")
 	async def Died(self, p_event: event.Death):
 		"""# DIED
-		Function to run when a player died."""
-
-		BUPrint.Debug("Player died :(")
-		self.currentEventPoint.deaths += 1
+		Function to run when a player died.
+		
+		Called for deaths of participants, and kills by participants.
+		Allies are determined by team, so NSO playing for the faction are allies."""
 
 		vParticipant = self.GetMatchingParticipant(p_event.character_id)
 		vAttacker = self.GetMatchingParticipant(p_event.attacker_character_id)
+		bIsSuicide = p_event.character_id == p_event.attacker_character_id
+		bIsAlly = p_event.attacker_team_id == p_event.team_id
 
+		# Participant killed an ally that isn't a participant; victims that are participants are handled below.
 		if vParticipant == None:
-			BUPrint.Debug(f"Participant with PS2 ID: {p_event.character_id} not found")
+			if vAttacker != None and bIsAlly:
+				self.stats.Add(p_event.attacker_character_id, OpsEventTracker.statKilledAlly)
 			return
 
+		BUPrint.Debug("Player died :(")
 
-		if vParticipant.ps2CharID == p_event.attacker_character_id:
-			vParticipant.userSession.kda.deathBySuicide += 1
-			self.sessionStats.eventKDA.deathBySuicide += 1
+		if bIsSuicide:
+			self.stats.Add(p_event.character_id, OpsEventTracker.statSuicide)
+		elif vAttacker != None:
+			BUPrint.Debug("%s killed by squadmate: %s", vParticipant.discordUser.display_name, vAttacker.discordUser.display_name)
+			self.stats.Add(p_event.character_id, OpsEventTracker.statDeathBySquad)
+			self.stats.Add(p_event.attacker_character_id, OpsEventTracker.statKilledSquad)
+		elif p_event.attacker_character_id == 0:
+			# Non-player caused deaths (pain fields, falling).
+			self.stats.Add(p_event.character_id, OpsEventTracker.statDeath)
+		elif bIsAlly:
+			self.stats.Add(p_event.character_id, OpsEventTracker.statDeathByAlly)
 		else:
-			# Increment death total, to account for non-player caused deaths (pain fields) and avoid needing to caclulate later.
-			vParticipant.userSession.kda.deathTotal += 1
-			self.sessionStats.eventKDA.deathTotal += 1
+			self.stats.Add(p_event.character_id, OpsEventTracker.statDeathByEnemy)
 
 
 		# Attacker is squadmate (or self).
 		if vAttacker != None:
-			BUPrint.Debug(f"{vParticipant.discordUser.display_name} killed by squadmate: {vAttacker.discordUser.display_name}")
-			# Only add to stats if not the same person; as the relative suicide stat is already added beforehand.
-			if vParticipant.ps2CharID != vAttacker.ps2CharID:
-				vParticipant.userSession.kda.deathBySquad += 1
-				vAttacker.userSession.kda.killedSquad += 1
-
-			self.sessionStats.eventKDA.deathBySquad += 1
-			self.sessionStats.eventKDA.killedSquad += 1
-
 			if ForFun.bBroadcastPS2VehicleDeath or ForFun.bPS2VehicleDeathFunEvent:
 				BUPrint.Debug("FFVehicle Death enabled.  Checking if participant was flying/driving!")
 				if p_event.attacker_vehicle_id != 0:
@@ -529,175 +518,83 @@ class OpsEventTracker():
 							vFunEvent.message = choice(ForFunData.partyBusDeathBy)
 
 					else:
-						BUPrint.Debug(f"Vehicle ID was {p_event.attacker_vehicle_id}")
-
-
-			# Determine if killer character is allied or an enemy.
-			vAttackerPS2Char = await self.auraxClient.get_by_id(type_=Character, id_=p_event.attacker_character_id)
-			if vAttackerPS2Char == None:
-				vParticipant.userSession.kda.deathBySuicide += 1
-				return
-			
-			if vAttackerPS2Char.faction_id == 2: # NC
-				vParticipant.userSession.kda.deathByAllies += 1
-				self.sessionStats.eventKDA.deathByAllies += 1
-			else:
-				vParticipant.userSession.kda.deathByEnemies += 1
-				self.sessionStats.eventKDA.deathByEnemies += 1
+						BUPrint.Debug("Vehicle ID was %s", p_event.attacker_vehicle_id)
 
 			# Potential to do enemy character death by name fun events here.
 
-			# End of: Attacker != None
-			return
-
-
 
 
+	@BotMetrics.Timed(trackerHandlers, "facilityCapture")
 	async def FacilityCapture(self, p_event: event.PlayerFacilityCapture):
 		"""# FACILITY CAPTURE
 		Function to call when a player participates in a facility capture."""
-		vFacility = await MapRegion.get_by_facility_id(facility_id=p_event.facility_id, client=self.auraxClient)
-		# BUPrint.Debug(f"Facility ID: {p_event.facility_id} | Resulted MapRegion: {vFacility}")
-
-		if vFacility == None:
-			vFacility = await self.auraxClient.get_by_id(MapRegion, p_event.facility_id)
-
-			# Account for when the client decides to give an empty object despite having a correct ID.
-			if vFacility == None and self.lastFacilityCaptured.facilityID == -999:
-				self.lastFacilityCaptured.participants += 1
-			elif vFacility == None:
-				self.lastFacilityCaptured.facilityID = -999
-				self.lastFacilityCaptured.facilityObj = None
-				self.lastFacilityCaptured.timestamp = datetime.now(timezone.utc)
-				return
-
-
-		# First facility capture.
-		if self.lastFacilityCaptured == None:
-			self.NewFacilityCapture(vFacility)
+		vFacilityData = await self.UpdateFacility(p_event.facility_id, self.lastFacilityCaptured)
+		if vFacilityData == None:
 			return
 
-				
-		# Existing/Current facility capture.  Ensures repeated calls (from each character) don't inflate the stats.
-		# Also ensures if the facility captured is the last one captured and is being recaptured it's still counted.
-		if self.lastFacilityCaptured.facilityID == p_event.facility_id:
-			timeDifference = self.lastFacilityCaptured.timestamp - datetime.now()
-			if timeDifference.total_seconds() > 900: # 15 minutes
-				BUPrint.Debug("Time difference is greater than 15 minutes.  Recaptured last capture.")
-				self.NewFacilityCapture(vFacility)
-				await self.updateParentFunction()
-				return
-
-			else: # Not new facility capture; nth call from each character.
-				BUPrint.Debug("Adding participant to facility capture.")
-				self.lastFacilityCaptured.participants += 1
-				return
-
-		
-		# If reached here, facility ID doesn't match last facility ID, thus is a new capture!
-		BUPrint.Debug("New Facility Capture!")
-		self.NewFacilityCapture(vFacility)
+		self.lastFacilityCaptured = vFacilityData
+		self.sessionStats.facilityFeed.Add( self.GetFacilityFeedEntry(vFacilityData, "CAPTURED") )
+		self.stats.AddEvent("captured")
 		await self.updateParentFunction()
 
 
-	def NewFacilityCapture(self, p_facility:MapRegion):
-		"""# NEW FACILITY CAPTURE
-		Convenience function for new facility capture to avoid repetition.
-		"""
-		vNewFacilityData = None
-		bFacilityNotFound = False
-
-		if p_facility == None:
-			BUPrint.Debug("Client failed to find matching facility.")
-			bFacilityNotFound= True
-			# Make fake data:
-			vNewFacilityData = FacilityData(
-				facilityID=-999,
-				timestamp=datetime.now(timezone.utc),
-				participants=1
-			)
-		else:
-			vNewFacilityData = FacilityData(
-					facilityID=p_facility.id, 
-					timestamp=datetime.now(tz=timezone.utc),
-					facilityObj = p_facility,
-					participants=1
-				)
-		self.lastFacilityCaptured = vNewFacilityData
-
-		if bFacilityNotFound:
-			self.sessionStats.facilityFeed.append( f" {GetDiscordTime(vNewFacilityData.timestamp, DateFormat.TimeShorthand)} | **CAPTURED** | *FacilityLookupFailed* | {p_facility.facility_type}" )
-		else:
-			self.sessionStats.facilityFeed.append( f" {GetDiscordTime(vNewFacilityData.timestamp, DateFormat.TimeShorthand)} | **CAPTURED** | {p_facility.facility_name} | {p_facility.facility_type}" )
-		self.currentEventPoint.captured += 1
-		self.sessionStats.facilitiesCaptured += 1
-
 
+	@BotMetrics.Timed(trackerHandlers, "facilityDefense")
 	async def FacilityDefense(self, p_event: event.PlayerFacilityDefend):
 		"""# FACILITY DEFENSE
 		Function to call when a player participates in a facility defense."""
-		vFacility:MapRegion = await MapRegion.get_by_facility_id(facility_id=p_event.facility_id, client=self.auraxClient)
-
-		if vFacility == None:
-			vFacility = await self.auraxClient.get_by_id(FacilityData, p_event.facility_id)
-
-		# First facility capture.
-		if self.lastFacilityDefended == None:
-			self.NewFacilityDefense(vFacility)
+		vFacilityData = await self.UpdateFacility(p_event.facility_id, self.lastFacilityDefended)
+		if vFacilityData == None:
 			return
 
-				
-		# Existing/Current facility Defense.  Ensures repeated calls (from each character) don't inflate the stats.
-		# Also ensures if the facility defended is the last one captured and is being redefended it's still counted.
-		if self.lastFacilityDefended.facilityID == p_event.facility_id:
-			timeDifference = self.lastFacilityDefended.timestamp - datetime.now()
-			if timeDifference.total_seconds() > 900: # 15 minutes
-				BUPrint.Debug("Time difference is greater than 15 minutes.  Recaptured last capture.")
-				self.NewFacilityDefense(vFacility)
-				await self.updateParentFunction()
-				return
+		self.lastFacilityDefended = vFacilityData
+		self.sessionStats.facilityFeed.Add( self.GetFacilityFeedEntry(vFacilityData, "DEFENDED") )
+		self.stats.AddEvent("defended")
+		await self.updateParentFunction()
 
-			else: # Not new facility defense; nth call from each character.
-				BUPrint.Debug("Not new defense, adding participant to last facility defended.")
-				self.lastFacilityDefended.participants += 1
-				return
 
-		
-		# If reached here, facility ID doesn't match last facility ID, thus is a new defense!
-		BUPrint.Debug("New Facility Defense!")
-		self.NewFacilityDefense(vFacility)
-		await self.updateParentFunction()
 
+	async def UpdateFacility(self, p_facilityID:int, p_lastFacility:FacilityData) -> FacilityData|None:
+		"""# UPDATE FACILITY
+		Called for each participants capture/defense event.
+
+		Repeated calls (from each character) for the last facility within 15 minutes add a participant to it, so they don't inflate the stats.
+		A facility recaptured/redefended after that is counted again.
 
-	def NewFacilityDefense(self, p_facility:MapRegion):
-		"""# NEW FACILITY DEFENSE
-		Convenience function for new facility capture to avoid repetition.
+		## RETURNS
+		The `FacilityData` of a new capture/defense, or `None` if the event was part of the last one.
 		"""
-		vNewFacilityData = None
-		bFacilityNotFound = False
+		vNow = datetime.now(timezone.utc)
+
+		if p_lastFacility != None and p_lastFacility.facilityID == p_facilityID:
+			if (vNow - p_lastFacility.timestamp).total_seconds() <= 900: # 15 minutes
+				BUPrint.Debug("Adding participant to last facility.")
+				p_lastFacility.participants += 1
+				return None
 
-		if p_facility == None:
+			BUPrint.Debug("Time difference is greater than 15 minutes.  Counting again.")
+
+		with censusRequests.Time(("opsFacility",)):
+			vFacility = await MapRegion.get_by_facility_id(facility_id=p_facilityID, client=self.auraxClient)
+		if vFacility == None:
 			BUPrint.Debug("Client failed to find matching facility.")
-			bFacilityNotFound = True
-			# Make fake data:
-			vNewFacilityData = FacilityData(
-				facilityID=-999,
-				timestamp=datetime.now(timezone.utc),
-				participants=1
-			)
-		else:
-			vNewFacilityData = FacilityData(
-					facilityID=p_facility.id, 
-					timestamp=datetime.now(tz=timezone.utc),
-					facilityObj = p_facility,
-					participants=1
-				)
 
-		self.lastFacilityDefended = vNewFacilityData
+		BUPrint.Debug("New Facility Capture/Defense!")
+		return FacilityData(
+			facilityID=p_facilityID,
+			timestamp=vNow,
+			facilityObj=vFacility,
+			participants=1
+		)
 
-		if bFacilityNotFound:
-			self.sessionStats.facilityFeed.append( f" {GetDiscordTime(vNewFacilityData.timestamp, DateFormat.TimeShorthand)} | **DEFENDED** | *FacilityLookupFailed* | {p_facility.facility_type}" )
-		else:
-			self.sessionStats.facilityFeed.append( f" {GetDiscordTime(vNewFacilityData.timestamp, DateFormat.TimeShorthand)} | **DEFENDED** | {p_facility.facility_name} | {p_facility.facility_type}" )
-		self.currentEventPoint.defended += 1
-		self.sessionStats.facilitiesDefended += 1
\ No newline at end of file
+
+
+	def GetFacilityFeedEntry(self, p_facilityData:FacilityData, p_type:str) -> str:
+		"""# GET FACILITY FEED ENTRY
+		Returns the facility feed line for a capture/defense."""
+		vTime = GetDiscordTime(p_facilityData.timestamp, DateFormat.TimeShorthand)
+
+		if p_facilityData.facilityObj == None:
+			return f" {vTime} | **{p_type}** | *FacilityLookupFailed* | {p_facilityData.facilityID}"
+
+		return f" {vTime} | **{p_type}** | {p_facilityData.facilityObj.facility_name} | {p_facilityData.facilityObj.facility_type}"
@@ -1,56 +1,142 @@
 from __future__ import annotations
-# from matplotlib import pyplot
 from botData.dataObjects import EventPoint
-from botUtils import BotPrinter as BUPrint
-from botData.settings import Directories
+from botUtils import BotPrinter
+from botData.settings import Commander as commanderSettings
+
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from io import BytesIO
+import asyncio
+import multiprocessing
+
+BUPrint = BotPrinter.GetLogger("commander.graphs")
+
+
+def RenderGraph(p_title:str, p_timestamps:list[datetime], p_series:list[tuple[str, str, list[int]]]) -> bytes:
+	"""# RENDER GRAPH
+	Renders a line graph to PNG bytes.
+
+	Uses its own figure & canvas rather than pyplot's global state, so it's safe to run concurrently.
+	Run in a worker process by `GraphMaker`; all arguments must be picklable.
+
+	## PARAMETERS
+	- `p_title`: Title of the graph.
+	- `p_timestamps`: X axis values.
+	- `p_series`: (label, format string, values) for each plotted line.
+	"""
+	# Imported here so matplotlib is only loaded by the workers.
+	from matplotlib.figure import Figure
+	from matplotlib.backends.backend_agg import FigureCanvasAgg
+	import matplotlib.dates # Registers datetime axis support.
+
+	vFigure = Figure(figsize=(20, 10))
+	FigureCanvasAgg(vFigure)
+	vAxes = vFigure.add_subplot()
+
+	vAxes.set_xlabel("Time")
+	vAxes.set_yscale("linear")
+	vAxes.set_title(p_title)
+	vAxes.margins(tight=True)
+	vAxes.locator_params(axis="y", integer=True)
+
+	for label, formatString, values in p_series:
+		vAxes.plot(p_timestamps, values, formatString, label=label)
+
+	vAxes.legend(loc="upper right")
+
+	vBuffer = BytesIO()
+	vFigure.savefig(vBuffer, format="png")
+	return vBuffer.getvalue()
+
 
-from datetime import datetime, timezone
-from random import randint
 
 class GraphMaker():
 	"""# GRAPH MAKER
 	Used to create graphs from a list of event points;
 	Currently only for ps2 events.
+
+	Graphs are rendered in a process pool, so the bot stays responsive, and cached per event until new points are added.
 	"""
+	metrics: dict[str, tuple[str, str]] = {
+		"kills": ("Kills", "*-b"),
+		"deaths": ("Deaths", "*-r"),
+		"revives": ("Revives", "+:g"),
+		"captured": ("Captures", "D-c"),
+		"defended": ("Defenses", "d-m"),
+		"activeParticipants": ("Players", "d-.k")
+	}
+	"""EventPoint attribute : (label, format string), of each metric that can be graphed."""
+
+	processPool: ProcessPoolExecutor = None
+	cache: OrderedDict[tuple, bytes] = OrderedDict()
+	"""(event name, metric, point count, last timestamp) : PNG bytes.  Oldest first."""
+
+	maxCachedGraphs = 16
+
+
+	def GetPool() -> ProcessPoolExecutor:
+		"""# GET POOL
+		Returns the graph process pool, creating it on first use."""
+		if GraphMaker.processPool == None:
+			# Forkserver, so workers aren't forked from the bot process with its event loop & open sockets.
+			GraphMaker.processPool = ProcessPoolExecutor(max_workers=commanderSettings.graphWorkers, mp_context=multiprocessing.get_context("forkserver"))
 
-	def CreateGraphAll(p_eventName:str, p_dataList:list[EventPoint]):
+		return GraphMaker.processPool
+
+
+	def Shutdown():
+		"""# SHUTDOWN
+		Shuts down the graph process pool, if created."""
+		if GraphMaker.processPool != None:
+			GraphMaker.processPool.shutdown(wait=False, cancel_futures=True)
+			GraphMaker.processPool = None
+
+
+	async def CreateGraphAll(p_eventName:str, p_dataList:list[EventPoint]) -> BytesIO:
 		"""# CREATE GRAPH: ALL
-		The main function that returns a filepath to a saved graph of the session.
+		The main function; returns a PNG of all metrics of the session.
 		"""
-		from matplotlib import pyplot
-		# BUPrint.Debug(f"Using datapoints: \n{p_dataList}")
-
-		# Create individual Arrays for data:
-		dataArray_ActiveParticipants = [data.activeParticipants for data in p_dataList]
-		dataArray_kills = [data.kills for data in p_dataList]
-		dataArray_deaths = [data.deaths for data in p_dataList]
-		dataArray_captured = [data.captured for data in p_dataList]
-		dataArray_defended = [data.defended for data in p_dataList]
-		dataArray_revives = [data.revives for data in p_dataList]
-		dataArray_timeStamps = [data.timestamp for data in p_dataList]
-
-		# vFigure:figure.Figure = pyplot.figure()
-		pyplot.rcParams["figure.figsize"] = 20, 10
-		pyplot.xlabel("Time")
-		pyplot.yscale("linear")
-		pyplot.yscale("linear")
-		pyplot.title(p_eventName)
-		pyplot.margins(tight=True)
-		pyplot.locator_params(axis="y", integer=True)
-
-		pyplot.plot(dataArray_timeStamps,dataArray_kills, "*-b", label="Kills")
-		pyplot.plot(dataArray_timeStamps,dataArray_deaths, "*-r", label="Deaths")
-		pyplot.plot(dataArray_timeStamps,dataArray_revives, "+:g", label="Revives")
-		pyplot.plot(dataArray_timeStamps,dataArray_captured, "D-c", label="Captures")
-		pyplot.plot(dataArray_timeStamps,dataArray_defended, "d-m", label="Defenses")
-		pyplot.plot(dataArray_timeStamps, dataArray_ActiveParticipants, "d-.k", label="Players")
-
-		pyplot.legend(loc="upper right")
-
-		vFilePath = f"{Directories.tempDir}{p_eventName}_StatVisAll.png"
-
-		pyplot.savefig(vFilePath)
-
-		pyplot.close()
-
-		return vFilePath
\ No newline at end of file
+		return await GraphMaker.CreateGraph(p_eventName, p_dataList, list(GraphMaker.metrics))
+
+
+	async def CreateGraphMetric(p_eventName:str, p_dataList:list[EventPoint], p_metric:str) -> BytesIO:
+		"""# CREATE GRAPH: METRIC
+		Returns a PNG of a single metric of the session.  `p_metric` must be a key of `GraphMaker.metrics`.
+		"""
+		return await GraphMaker.CreateGraph(f"{p_eventName}: {GraphMaker.metrics[p_metric][0]}", p_dataList, [p_metric])
+
+
+	async def CreateGraph(p_title:str, p_dataList:list[EventPoint], p_metrics:list[str]) -> BytesIO:
+		"""# CREATE GRAPH
+		Returns a PNG graph of the metrics, from the cache if the event points are unchanged.
+		"""
+		vCacheKey = (p_title, tuple(p_metrics), len(p_dataList), p_dataList[-1].timestamp if p_dataList else None)
+
+		if vCacheKey in GraphMaker.cache:
+			GraphMaker.cache.move_to_end(vCacheKey)
+			return BytesIO(GraphMaker.cache[vCacheKey])
+
+		vTimestamps = [data.timestamp for data in p_dataList]
+		vSeries = [
+			(*GraphMaker.metrics[metric], [getattr(data, metric) for data in p_dataList])
+			for metric in p_metrics
+		]
+
+		vLoop = asyncio.get_running_loop()
+
+		try:
+			vImage = await vLoop.run_in_executor(GraphMaker.GetPool(), RenderGraph, p_title, vTimestamps, vSeries)
+
+		except (BrokenProcessPool, OSError) as vError:
+			# Unable to use worker processes; render in a thread instead.
+			BUPrint.LogErrorExc("Graph process pool unavailable, rendering in a thread.", vError)
+			GraphMaker.Shutdown()
+			vImage = await vLoop.run_in_executor(None, RenderGraph, p_title, vTimestamps, vSeries)
+
+		GraphMaker.cache[vCacheKey] = vImage
+		while len(GraphMaker.cache) > GraphMaker.maxCachedGraphs:
+			GraphMaker.cache.popitem(last=False)
+
+		return BytesIO(vImage)
@@ -4,11 +4,17 @@ Functions and classes specifically for administrative tasks that don't really fi
 """
 
 from discord.ext.commands import GroupCog, Bot
-from discord import app_commands, Interaction, Role, TextChannel, CategoryChannel, Emoji
+from discord import app_commands, Interaction, Role, TextChannel, CategoryChannel, Emoji, File
 from botData.settings import BotSettings, Channels, Roles, Messages
-from botUtils import BotPrinter as BUPrint
+from botUtils import BotPrinter
 from botUtils import PrintSettings, SplitStrToSegments, GetGuildNF, ChannelPermOverwrites
 from roleManager import UserAssignableRoleManager
+from botMetrics import BotMetrics
+from botProfiler import BotProfiler
+from datetime import datetime, timezone
+from io import BytesIO
+
+BUPrint = BotPrinter.GetLogger("admin")
 
 
 class BotAdminCog(GroupCog, name="admin", description="Administrative commands and functionality relating to the bot itself"):
@@ -83,6 +89,68 @@ class BotAdminCog(GroupCog, name="admin", description="Administrative commands a
 
 
 
+	@app_commands.command(name="metrics", description="Shows a summary of the bots metrics.")
+	async def GetMetrics(self, p_interaction:Interaction):
+		"""
+		# GET METRICS
+		Command that shows a summary of the bots metrics: counts, rates per minute and request latencies.
+		"""
+		if not self.HasPermission(p_interaction.user.id):
+			await p_interaction.response.send_message(Messages.invalidCommandPerms, ephemeral=True)
+			return
+
+		vSegments = SplitStrToSegments( p_string=BotMetrics.GetSummary(), p_limit=1990 )
+
+		await p_interaction.response.send_message( f"```{vSegments[0]}```", ephemeral=True )
+		for segment in vSegments[1:]:
+			await p_interaction.followup.send( f"```{segment}```", ephemeral=True )
+
+
+
+	@app_commands.command(name="profile", description="Profiles the bot for a time, and posts the results to the admin channel.")
+	@app_commands.rename(p_seconds="seconds", p_slowMilliseconds="slow_ms")
+	@app_commands.describe(
+		p_seconds="Duration of the profile, in seconds.",
+		p_slowMilliseconds="Callbacks blocking the bot for longer than this are listed."
+	)
+	async def ProfileBot(self, p_interaction:Interaction, p_seconds:app_commands.Range[int, 1, BotSettings.profileMaxSeconds] = 30, p_slowMilliseconds:app_commands.Range[int, 1] = 100):
+		"""
+		# PROFILE BOT
+		Command that samples the event loop for the duration, then posts a collapsed stack file (for flamegraph tools) and any slow callbacks to the admin channel.
+		"""
+		vAdminChn = self.botRef.get_channel(Channels.botAdminID)
+
+		if not self.HasPermission(p_interaction.user.id):
+			await p_interaction.response.send_message(Messages.invalidCommandPerms, ephemeral=True)
+			return
+
+		if vAdminChn == None:
+			await p_interaction.response.send_message("Invalid ADMIN channel.", ephemeral=True)
+			return
+
+		if BotProfiler.bIsRunning:
+			await p_interaction.response.send_message("A profile is already running.", ephemeral=True)
+			return
+
+		await p_interaction.response.send_message(f"Profiling for {p_seconds} seconds; results will be posted in {vAdminChn.mention}.", ephemeral=True)
+
+		vResult = await BotProfiler.Profile(p_seconds, BotSettings.profileSampleInterval, p_slowMilliseconds / 1000)
+		if vResult == None:
+			return
+
+		vFileName = f"profile_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
+		vFiles = [File(BytesIO(vResult.GetCollapsed().encode()), filename=f"{vFileName}.folded")]
+		if len(vResult.slowCallbacks) != 0:
+			vFiles.append( File(BytesIO("\n".join(vResult.slowCallbacks).encode()), filename=f"{vFileName}_slow.txt") )
+
+		vMessage = f"**Profile** by {p_interaction.user.display_name}: {vResult.duration:.0f}s, {vResult.sampleCount} samples, {len(vResult.slowCallbacks)} callbacks over {p_slowMilliseconds}ms.\n"
+		for frame, count in vResult.GetTopFrames(5):
+			vMessage += f"- `{frame}`: {count / max(vResult.sampleCount, 1):.0%}\n"
+
+		await vAdminChn.send(vMessage[:2000], files=vFiles)
+
+
+
 	@app_commands.command(name="refresh_roles", description="Reloads user assignable roles from the saved files.")
 	async def RefreshUserAssignableRoles(self, p_interaction:Interaction):
 		if not self.HasPermission(p_interaction.user.id):
@@ -4,17 +4,23 @@
 from __future__ import annotations
 
 from enum import Enum, IntEnum
+from collections import deque
 from discord import Member, Message, Guild
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from dateutil.relativedelta import relativedelta
 import botData.settings as Settings
 import botUtils
-from botData.utilityData import PS2ZoneIDs, PS2WarpgateIDs
-from auraxium.ps2 import Character as PS2Character
-from auraxium.ps2 import MapRegion as PS2Facility
-from auraxium.ps2 import OutfitMember as PS2OutfitMember
+from botData.utilityData import PS2ZoneIDs, PS2WarpgateIDs, PS2ContEventType
+from typing import TYPE_CHECKING
 import pickle
+import csv
+import gzip
+from io import StringIO
+
+if TYPE_CHECKING:
+	# Only used as hints; auraxium is loaded by the features which query the census.
+	from auraxium.ps2 import MapRegion as PS2Facility
 
 
 # # # # #  SETTINGS RELATED
@@ -228,6 +234,27 @@ class User:
 	"""Set to true when a recruit has manually requested promotion via library viewer."""
 
 
+@dataclass(frozen=True)
+class PS2CharacterInfo:
+	"""# PS2 CHARACTER INFO:
+	A PS2 character and their outfit membership, from a single census lookup.
+	Outfit values are empty if the character isn't in an outfit.
+	"""
+	charID: int
+	name: str
+	battleRank: int
+	outfitName: str = ""
+	outfitAlias: str = ""
+	outfitRank: str = ""
+	outfitRankOrdinal: int = -1
+	memberSince: int = 0 # POSIX timestamp.
+
+	@property
+	def bInOutfit(self) -> bool:
+		return self.outfitName != ""
+
+
+
 @dataclass
 class NewUserData:
 	"""# NEW USER DATA:
@@ -236,12 +263,12 @@ class NewUserData:
 	userObj : Member = None
 	joinMessage : Message = None
 	rulesMsg : Message = None
-	ps2CharObj: PS2Character = None
+	ps2Character: PS2CharacterInfo = None
 	ps2CharID : int = -1
 	ps2CharName : str = ""
 	ps2OutfitName: str = ""
 	ps2OutfitAlias: str = ""
-	ps2OutfitCharObj: PS2OutfitMember = None
+	bPS2Unverified: bool = False # The census was unavailable, so the character name was accepted without being checked.
 	bIsRecruit:bool = False
 	bSentRequest:bool = False
 
@@ -288,17 +315,63 @@ class PS2EventAttended(IntEnum):
 	InGameAndDiscordVC = 30
 
 
+class FacilityFeed:
+	"""# FACILITY FEED
+	A bounded feed of facility entries, oldest first.
+	The total length of the entries (including newlines) is kept as entries are added & dropped, so the feed can be sized without joining it.
+	"""
+	def __init__(self, p_maxEntries:int = None) -> None:
+		if p_maxEntries == None:
+			p_maxEntries = Settings.Commander.facilityFeedMaxEntries
+
+		self.entries:deque[str] = deque(maxlen=p_maxEntries)
+		self.length = 0
+
+
+	def __len__(self):
+		return len(self.entries)
+
+
+	def __iter__(self):
+		return iter(self.entries)
+
+
+	def Add(self, p_entry:str):
+		"""# ADD
+		Adds an entry, dropping the oldest if full."""
+		if len(self.entries) == self.entries.maxlen:
+			self.length -= len(self.entries[0]) + 1
+
+		self.entries.append(p_entry)
+		self.length += len(p_entry) + 1
+
+
+	def GetText(self, p_limit:int) -> str:
+		"""# GET TEXT
+		Returns the newest entries that fit within the limit, newline separated & oldest first."""
+		if self.length <= p_limit:
+			return "\n".join(self.entries)
+
+		vEntries = []
+		vLength = 0
+		for entry in reversed(self.entries):
+			if vLength + len(entry) + 1 > p_limit:
+				break
+			vEntries.append(entry)
+			vLength += len(entry) + 1
+
+		vEntries.reverse()
+		return "\n".join(vEntries)
+
+
+
 @dataclass
 class PS2EventTotals:
 	"""# PS2 EVENT TOTALS
-	Dataclass that holds stat totals.
-	Used to prevent unnessecery iteration calculations while event is running.
-	The event totals are added to this stat object at the same time as the current event point & user session stats.
+	Dataclass that holds event wide data which isn't a stat.
+	Stat totals are derived from the per participant stats; see `OpCommander.eventStats.EventStats`.
 	"""
-	eventKDA:PS2SessionKDA = None
-	facilityFeed:list[str] = field(default_factory=list)
-	facilitiesCaptured:int = 0
-	facilitiesDefended:int = 0
+	facilityFeed:FacilityFeed = field(default_factory=FacilityFeed)
 
 
 # SESSION SUB OBJECTS
@@ -434,57 +507,137 @@ class Participant:
 
 
 
+@dataclass
+class FeedbackEntry:
+	"""
+	# FEEDBACK ENTRY
+	The feedback submitted by a single user.
+	"""
+	generic:str = ""
+	forSquadmates:str = ""
+	forSquadLead:str = ""
+	forPlatLead:str = ""
+
+
+
 @dataclass
 class OpFeedback:
 	"""
 	# OPS FEEDBACK
-	Class containing variable lists which hold user submitted feedback
+	Holds user submitted feedback, keyed by user ID so users can edit their feedback.
 	"""
-	userID:list[str] = field(default_factory=list) # Saved to allow users to edit their feedback.
-	generic:list[str] = field(default_factory=list)
-	forSquadmates:list[str] = field(default_factory=list)
-	forSquadLead:list[str] = field(default_factory=list)
-	forPlatLead:list[str] = field(default_factory=list)
+	entries:dict[int, FeedbackEntry] = field(default_factory=dict)
+
+	sections = (
+		("generic", "GENERAL FEEDBACK", False),
+		("forSquadmates", "FOR SQUADMATES", True),
+		("forSquadLead", "FOR SQUAD LEAD", True),
+		("forPlatLead", "FOR PLATOON LEAD", True)
+	)
+	"""(FeedbackEntry attribute, heading, is PS2 only) of each feedback section, in display order."""
+
+
+	def __len__(self):
+		return len(self.entries)
+
+
+	def GetEntry(self, p_userID:int) -> FeedbackEntry|None:
+		"""# GET ENTRY
+		Returns the users feedback, or `None` if they haven't given any."""
+		return self.entries.get(p_userID)
+
+
+	def SetEntry(self, p_userID:int, p_entry:FeedbackEntry):
+		"""# SET ENTRY
+		Adds or replaces the users feedback."""
+		self.entries[p_userID] = p_entry
+
+
+	def IterSections(self, bIncludePS2:bool = True):
+		"""# ITERATE SECTIONS
+		Yields (heading, non-empty feedback) for each section, without building intermediate lists."""
+		for attribute, heading, bIsPS2Only in OpFeedback.sections:
+			if bIsPS2Only and not bIncludePS2:
+				continue
+
+			yield heading, self.IterFeedback(attribute)
+
 
-	def SaveToFile(self, p_eventName:str):
+	def IterFeedback(self, p_attribute:str):
+		"""# ITERATE FEEDBACK
+		Yields the non-empty feedback of one section, in submission order."""
+		for entry in self.entries.values():
+			vText = getattr(entry, p_attribute).strip()
+			if vText != "":
+				yield vText
+
+
+	def WriteMessage(self, p_stream, bIncludePS2:bool = True):
+		"""# WRITE MESSAGE
+		Writes the feedback, formatted for discord, to the stream."""
+		for heading, feedback in self.IterSections(bIncludePS2):
+			p_stream.write(f"\n**{heading}:**\n")
+			for text in feedback:
+				p_stream.write(f"{text}\n")
+
+
+	def GetMessages(self, bIncludePS2:bool = True, p_limit:int = 2000) -> list[str]:
+		"""# GET MESSAGES
+		Returns the feedback split into messages no longer than `p_limit`, without truncation."""
+		vStream = StringIO()
+		self.WriteMessage(vStream, bIncludePS2)
+
+		return botUtils.SplitStrToSegments(vStream.getvalue().strip("\n"), p_limit)
+
+
+	def GetFileExtension() -> str:
+		"""# GET FILE EXTENSION
+		Returns the extension of saved feedback files, from the export settings."""
+		vExtension = ".csv" if Settings.Commander.feedbackExportFormat == "csv" else ".txt"
+
+		if Settings.Commander.bCompressFeedback:
+			vExtension += ".gz"
+
+		return vExtension
+
+
+	def SaveToFile(self, p_eventName:str, bIncludePS2:bool = True):
 		"""
 		# SAVE TO FILE
 
 		Saves the feedback to a file, using the event name provided.
+		The file is written in a single pass, as plain text or CSV (one row per user), optionally gzip compressed; set in `Settings.Commander`.
 
 		## Returns: 
 		The filepath of the saved file.
 		Or "" if saving failed.
 		"""
+		filePath = f"{Settings.Directories.tempDir}{p_eventName}_feedback{OpFeedback.GetFileExtension()}"
 
-		# Save feedback to file.
-		filePath = f"{Settings.Directories.tempDir}{p_eventName}_feedback.txt"
 		try:
-			with open(filePath, "w") as vFile:
-				vFile.write("GENERAL FEEDBACK\n")
-				for line in self.generic:
-					if line != "" or "\n":
-						vFile.write(f"{line}\n\n")
-
-				vFile.write("\n\nTO SQUADMATES\n")
-				for line in self.forSquadmates:
-					if line != "" or "\n":
-						vFile.write(f"{line}\n\n")
-
-				vFile.write("\n\nTO SQUAD LEAD\n")
-				for line in self.forSquadLead:
-					if line != "" or "\n":
-						vFile.write(f"{line}\n\n")
-
-				vFile.write("\n\nTO PLATOON LEAD\n")
-				for line in self.forPlatLead:
-					if line != "" or "\n":
-						vFile.write(f"{line}\n\n")
+			if Settings.Commander.bCompressFeedback:
+				vFile = gzip.open(filePath, "wt", encoding="utf-8", newline="")
+			else:
+				vFile = open(filePath, "w", encoding="utf-8", newline="")
+
+			with vFile:
+				if Settings.Commander.feedbackExportFormat == "csv":
+					vAttributes = [attribute for attribute, heading, bIsPS2Only in OpFeedback.sections if bIncludePS2 or not bIsPS2Only]
+					vWriter = csv.writer(vFile)
+					vWriter.writerow([heading for attribute, heading, bIsPS2Only in OpFeedback.sections if attribute in vAttributes])
+					vWriter.writerows([getattr(entry, attribute) for attribute in vAttributes] for entry in self.entries.values())
+
+				else:
+					for heading, feedback in self.IterSections(bIncludePS2):
+						vFile.write(f"{heading}\n")
+						for text in feedback:
+							vFile.write(f"{text}\n\n")
+						vFile.write("\n\n")
 			
 			return filePath 
 
-		except OSError:
-			botUtils.BotPrinter.LogError("Unable to save a the file!")
+		except OSError as vError:
+			botUtils.BotPrinter.LogErrorExc("Unable to save the feedback file!", vError)
 			return ""
 
 
@@ -576,16 +729,110 @@ class ForFunVehicleDeath:
 #############################################################
 # CONTINENT TRACKER
 
+@dataclass(frozen=True)
+class TrackedWorld:
+	"""# Tracked World
+	A world watched by the continent tracker, and where its messages are sent.
+	"""
+	worldID:int
+	name:str
+	"""Display name; shown in messages when more than one world is tracked."""
+
+	continentChannelID:int
+	"""Channel continent lock & unlock messages are sent to."""
+
+	facilityChannelID:int
+	"""Channel outfit facility capture messages are sent to."""
+
+
+
+@dataclass(frozen=True, slots=True)
+class PS2FacilityInfo:
+	"""# PS2 Facility Info
+	Minimal metadata of a facility, held locally by the continent tracker."""
+	name:str
+	facilityType:str
+	zoneID:int
+
+
+
+@dataclass(slots=True)
+class ContinentWorldState:
+	"""# Continent World State
+	The continent tracker's state for one world.
+	"""
+	world:TrackedWorld
+
+	continents:dict[int, ContinentStatus]
+	"""Zone ID : `Continent Status`."""
+
+	mostRecentEventTime:datetime = None
+	"""The most recent continent update time."""
+
+	facilityDigest:Message = None
+	"""The facility capture digest message currently being edited."""
+
+	facilityDigestStart:datetime = None
+	"""When the current digest message was posted."""
+
+	facilityDigestLines:list[str] = field(default_factory=list)
+	"""Capture lines of the current digest; lines past `facilityDigestPosted` are not yet posted."""
+
+	facilityDigestPosted:int = 0
+	"""Number of digest lines included in the posted message."""
+
+	facilityDigestTask:object = None
+	"""The pending `asyncio.Task` posting the digest, if any."""
+
+
+
 @dataclass
-class WarpgateCapture:
-	"""# Warpgate Capture
-	Holds the warpgate facility ID, Zone(Continent) ID and the ID of the 'capturing' faction.
-	Used to compare other warpgate captures to determine if the continent has opened.
-	Not needed for contient closure as that event is working on Daybreak's side.
+class ContinentTrackerStats:
+	"""# Continent Tracker Stats
+	Connection counters for the continent tracker's event stream.
 	"""
-	warpgateID:int
+	reconnectCount:int = 0
+	"""Number of successful reconnects."""
+
+	failedReconnects:int = 0
+	"""Number of reconnect attempts where the new client failed to come up."""
+
+	lastGapSeconds:float = 0
+	"""Seconds without messages before the most recent reconnect."""
+
+	totalGapSeconds:float = 0
+	"""Total seconds without messages across all reconnects."""
+
+	duplicateEvents:int = 0
+	"""Number of duplicate events dropped."""
+
+	lastReconnect:datetime = None
+	"""Time of the most recent successful reconnect."""
+
+
+
+@dataclass
+class ContinentEvent:
+	"""# Continent Event
+	An event read from the continent history log.
+	"""
+	eventType:PS2ContEventType
+	worldID:int
 	zoneID:int
-	factionID:int
+	eventTime:datetime
+
+	facilityID:int = None
+	"""Facility events only."""
+
+	outfitID:int = None
+	"""Facility events only.  The outfit awarded the capture, 0 if none."""
+
+	oldFactionID:int = None
+	"""Facility events only."""
+
+	newFactionID:int = None
+	"""Facility events only."""
+
 
 
 @dataclass
@@ -607,6 +854,12 @@ class ContinentStatus:
 	
 	Will be NONE on first run."""
 
+	warpgateFactions:dict[int, int] = field(default_factory=dict)
+	"""Warpgate facility ID : owning faction ID.  Set from the map snapshot and facility control events."""
+
+	bWarpgatesLocked:bool = None
+	"""The locked state implied by the warpgates when last reconciled, or `None` if not yet known."""
+
 
 	def SetLocked(self, p_isLocked:bool, p_datetime:datetime = None):
 		"""# Set Locked
@@ -628,6 +881,30 @@ class ContinentStatus:
 			self.lastEventTime = p_datetime
 
 
+	def SetWarpgateFaction(self, p_facilityID:int, p_factionID:int):
+		"""# Set Warpgate Faction
+		Sets the owning faction of one of this continents warpgates.
+
+		## RETURNS
+		The locked state implied by the warpgates, or `None` if not all warpgate owners are known.
+		"""
+		self.warpgateFactions[p_facilityID] = p_factionID
+		return self.GetWarpgateLockState()
+
+
+	def GetWarpgateLockState(self):
+		"""# Get Warpgate Lock State
+		A continent is locked when all its warpgates are owned by one faction, and open otherwise.
+
+		## RETURNS
+		`bool` locked state, or `None` if not all warpgate owners are known.
+		"""
+		if len(self.warpgateFactions) < len(self.warpgateIDs):
+			return None
+
+		return len( set(self.warpgateFactions.values()) ) == 1
+
+
 
 
 	#############################################################
@@ -643,9 +920,32 @@ class SchedulerOpInfo:
 	eventName: str = ""
 	date: datetime = None
 	managingUser:str = ""
+	confidence:float = 0.0 # 0-1 match confidence between eventName and matchingOp.
 	bCanPost:bool = False
 
 
+@dataclass
+class OpsRefreshReport:
+	"""# OPS REFRESH REPORT:
+	
+	What a refresh of the live ops did; returned by `OperationManager.RefreshOps`.
+	"""
+	updated: int = 0
+	removed: int = 0
+	failedRemovals: list[str] = field(default_factory=list) # File names of outdated ops which failed to be removed.
+	failedUpdates: list[str] = field(default_factory=list) # File names of ops whose message failed to update.
+	skipped: int = 0 # Ops left unchanged (not stale, when only refreshing stale ops).
+
+	def __str__(self) -> str:
+		vReportStr = f"{self.updated} updated, {self.removed} outdated removed, {self.skipped} unchanged"
+		if len(self.failedRemovals):
+			vReportStr += f", failed to remove: {', '.join(self.failedRemovals)}"
+		if len(self.failedUpdates):
+			vReportStr += f", failed to update: {', '.join(self.failedUpdates)}"
+		return vReportStr
+
+
+
 class OpsStatus(IntEnum):
 	"""
 	# OPS STATUS
@@ -1011,7 +1311,7 @@ class OperationData:
 		vIDList = [playerID for role in self.roles if self.roles.__len__() != 0 for playerID in role.players]
 		vIDList = vIDList + self.reserves
 		
-		botUtils.BotPrinter.Debug(f"PARTICIPANT IDS: {vIDList}")
+		botUtils.BotPrinter.Debug("PARTICIPANT IDS: %s", vIDList)
 
 		return vIDList
 
@@ -6,10 +6,16 @@ If critical settings are invalid, prevents the bot from running.
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
+
 from discord import Role, SelectOption, Guild
 from discord.ext.commands import Bot
-from botData.settings import BotSettings, NewUsers, Commander, UserLib, Roles, Channels
-from botUtils import BotPrinter as BUPrint
+from botData.settings import BotSettings, NewUsers, Commander, UserLib, Roles, Channels, ContinentTrack
+from botUtils import BotPrinter
+
+BUPrint = BotPrinter.GetLogger("sanityCheck")
+
 
 class BadChannelError(Exception):
 	"""
@@ -46,25 +52,64 @@ class SanityCheck():
 	If botSettings.bEnableDebug` is true, this only prints warnings.
 	"""
 
+	lastPassedHash: str = None
+	"""Hash of the settings & guild state when the checks last passed; the checks are skipped while it's unchanged."""
+
+
 	async def CheckAll(p_botRef:Bot):
 		"""
 		# CHECK ALL
 		Runs all check functions.
+
+		The result is cached, so reconnects (which call `on_ready` again) only re-check if the settings or guild have changed.
 		"""
+		vHash = None
+		vGuild = p_botRef.get_guild(BotSettings.discordGuild)
+		if vGuild != None:
+			vHash = SanityCheck.GetStateHash(p_botRef, vGuild)
+			if vHash == SanityCheck.lastPassedHash:
+				BUPrint.Debug("Settings & guild unchanged since last sanity check, skipping.")
+				return
+
 		if BotSettings.bDebugEnabled:
 			BUPrint.Info("\n\nATTENTION: Debug is enabled.  Sanity check will only inform of invalid values\n\n")
 		else:
 			BUPrint.Info("Performing settings sanity check...")
 
 		await SanityCheck.CheckGuild(p_botRef)
-		await SanityCheck.CheckRoles(p_botRef)
-		await SanityCheck.CheckChannels(p_botRef)
+		await asyncio.gather(
+			SanityCheck.CheckRoles(p_botRef),
+			SanityCheck.CheckChannels(p_botRef)
+		)
+
+		SanityCheck.lastPassedHash = vHash
 
 		if not BotSettings.bDebugEnabled:
 			BUPrint.Info("	-> Settings Sanity Check Passed!")
 
 
 
+	def GetStateHash(p_botRef:Bot, p_guild:Guild) -> str:
+		"""
+		# GET STATE HASH
+		Returns a hash of everything the checks depend on: the relevant settings, the guilds roles & channels, and the presence of the admin users.
+		"""
+		vState = (
+			BotSettings.bDebugEnabled,
+			BotSettings.botFeatures,
+			Commander.bAutoMoveVCEnabled,
+			{name: value for name, value in vars(Roles).items() if not name.startswith("__")},
+			{name: value for name, value in vars(Channels).items() if not name.startswith("__")},
+			ContinentTrack.trackedWorlds,
+			sorted((role.id, role.name) for role in p_guild.roles),
+			sorted(channel.id for channel in p_guild.channels),
+			[p_botRef.get_user(adminID) != None for adminID in Roles.roleRestrict_ADMIN]
+		)
+
+		return hashlib.sha256(repr(vState).encode()).hexdigest()
+
+
+
 	async def CheckGuild(p_botRef:Bot):
 		BUPrint.Info("Sanity Checking Guild...")
 
@@ -84,7 +129,7 @@ class SanityCheck():
 		BUPrint.Info("Sanity Checking Roles...")
 
 		guild = p_botRef.get_guild(BotSettings.discordGuild)
-		allRoles = guild.roles
+		allRoles = SanityCheck.GetRoleLookup(guild)
 		botFeatures = BotSettings.botFeatures
 		bFailedCheck = False
 
@@ -156,28 +201,31 @@ class SanityCheck():
 
 
 
-	def RoleInRoles(p_roleNameOrID:str, p_RolesList:list[Role]):
+	def GetRoleLookup(p_guild:Guild) -> dict[int|str, Role]:
+		"""
+		# GET ROLE LOOKUP
+		Returns a map of both the ID and name of each role in the guild, to the role; for use with `RoleInRoles`.
+		"""
+		vLookup: dict[int|str, Role] = {role.name: role for role in p_guild.roles}
+		vLookup.update({role.id: role for role in p_guild.roles})
+		return vLookup
+
+
+	def RoleInRoles(p_roleNameOrID:str|int, p_roleLookup:dict[int|str, Role]):
 		"""
-		Checks if role is in list of roles.
+		Checks if role is in the role lookup, from `GetRoleLookup`.
 
 		roleName or ID can be provided.
 
 		Returns TRUE if found. False if not.
 		"""
-		BUPrint.Debug(f"Checking role: {p_roleNameOrID}")
-
-		for role in p_RolesList:
-			if role.name == p_roleNameOrID:
-				return True
+		BUPrint.Debug("Checking role: %s", p_roleNameOrID)
 
-			try:
-				if p_roleNameOrID.isnumeric():
-					if role.id == int(p_roleNameOrID):
-						return True
-			except AttributeError:
-				if role.id == int(p_roleNameOrID):
-					return True
+		if p_roleNameOrID in p_roleLookup:
+			return True
 
+		if isinstance(p_roleNameOrID, str) and p_roleNameOrID.isnumeric():
+			return int(p_roleNameOrID) in p_roleLookup
 
 		return False
 
@@ -246,11 +294,12 @@ class SanityCheck():
 
 
 		if botFeatures.continentTracker:
-			if not SanityCheck.ChannelExists(vGuild, Channels.ps2ContinentNotifID, "PS2 Continent Notifications"):
-				bFailedCheck = True
+			for world in ContinentTrack.trackedWorlds:
+				if not SanityCheck.ChannelExists(vGuild, world.continentChannelID, f"PS2 Continent Notifications ({world.name})"):
+					bFailedCheck = True
 
-			if not SanityCheck.ChannelExists(vGuild, Channels.ps2FacilityControlID, "PS2 Facility Control"):
-				bFailedCheck = True
+				if not SanityCheck.ChannelExists(vGuild, world.facilityChannelID, f"PS2 Facility Control ({world.name})"):
+					bFailedCheck = True
 
 
 		if bFailedCheck:
@@ -76,6 +76,48 @@ class BotSettings:
 	"""# Debug Enabled: set to false during live use to reduce console clutter.
 	"""
 
+	bLogAsJSON = False
+	"""# Log as JSON: When true, console output is written as one JSON object per line, for log collectors.
+	"""
+
+	logLevels:tuple = ()
+	"""# Log Levels: (subsystem, level) pairs, setting the minimum level shown for a subsystem regardless of `bDebugEnabled`.
+	EG: `(("commander.events", "INFO"), ("continentTracker", "DEBUG"))`
+	"""
+
+	bMetricsEnabled = True
+	"""# Metrics Enabled: When true, the bots metrics are served as OpenMetrics text at `http://metricsHost:metricsPort/metrics`.
+	Metrics are always collected and shown by `/admin metrics`.
+	"""
+
+	metricsHost = "127.0.0.1"
+	"""# Metrics Host: Address the metrics are served on.  Keep this local unless the port is otherwise protected.
+	"""
+
+	metricsPort = 9108
+	"""# Metrics Port: Port the metrics are served on.
+	"""
+
+	profileMaxSeconds = 120
+	"""# Profile Max Seconds: The longest profile `/admin profile` may run.
+	"""
+
+	profileSampleInterval = 0.005
+	"""# Profile Sample Interval: Seconds between stack samples while profiling.
+	"""
+
+	loopLagInterval = 0.5
+	"""# Loop Lag Interval: Seconds between event loop lag measurements.
+	"""
+
+	loopLagThreshold = 0.25
+	"""# Loop Lag Threshold: Seconds the event loop may be blocked before the blocking stack is logged.
+	"""
+
+	slowListenerThreshold = 1.0
+	"""# Slow Listener Threshold: Seconds a timed listener (eg. `VoiceStateChanged`) may take before it's logged as slow.
+	"""
+
 	bShowSettingsOnStartup = True
 	"""# Show Settings on Startup: When true, the bots settings are displayed in the console.
 	"""
@@ -101,6 +143,11 @@ class BotSettings:
 	When true, values are sanity checked on bot start, recommended to stay on.
 	If Debug is enabled, this prints out any invalid entries, else it prevents bot from continuing."""
 
+	bAlwaysSyncCommands = False
+	"""# Always Sync Commands: When true, the command tree is synced on every startup.
+	When false, it's only synced when the commands have changed since the last sync.
+	"""
+
 
 	pickleProtocol = pickle.HIGHEST_PROTOCOL
 	"""# Pickle Protocol: 
@@ -302,6 +349,12 @@ class Channels:
 	ID of voice chat users are moved into after an event is over."""
 
 	
+	chatOverwriteBatchDelay = 1.5
+	"""# Chat Overwrite Batch Delay:
+	Seconds to wait before applying member permission changes to a voice-linked text channel.
+	Changes made within this time are applied in a single edit."""
+
+
 	protectedCategoriesID = [
 		744907524418961438, # Welcome
 		710470871214587955, # Important Channels
@@ -389,6 +442,16 @@ class NewUsers:
 	"""# New Account Warning:
 	Warn when a joining users account is less than this many months old."""
 
+
+	censusTimeout = 5
+	"""# Census Timeout:
+	Seconds to wait for the census when checking a joining users character.  On timeout the name is accepted unverified, and the join request warns of it."""
+
+
+	characterCacheSeconds = 300
+	"""# Character Cache Seconds:
+	Seconds a character lookup (including a name not being found) is cached, so repeated attempts at a name don't query the census again."""
+
 	
 	ruleMsgID = 913206262248923146
 	"""# Rule Message ID:
@@ -415,6 +478,23 @@ class Commander:
 	"""# Tracking is Enabled: 
 	When true, the PS2 tracker is used for PS2 events."""
 
+	graphWorkers:int = 1
+	"""# Graph Workers
+	Number of worker processes used to render debrief graphs."""
+
+	debriefGraphMetrics:tuple = ()
+	"""# Debrief Graph Metrics
+	Metrics which are also given their own graph in the debrief, in addition to the graph of all metrics.
+	Valid metrics: `kills`, `deaths`, `revives`, `captured`, `defended`, `activeParticipants`."""
+
+	feedbackExportFormat:str = "txt"
+	"""# Feedback Export Format
+	Format of saved event feedback files: `txt` or `csv` (one row per user)."""
+
+	bCompressFeedback:bool = False
+	"""# Compress Feedback
+	When true, saved event feedback files are gzip compressed."""
+
 	
 	markedPresent = botData.dataObjects.PS2EventAttended.InGameOnly
 	"""# Marked Present: 
@@ -465,6 +545,12 @@ class Commander:
 	Interval in seconds a new data point for event tracking is set."""
 
 
+	jobMisfireGrace = 60
+	"""# Job Misfire Grace:
+	Seconds a missed scheduled commander job (reminders, intervals) may still run late. Missed runs are coalesced into one.
+	Auto-starts instead may run late up until the ops start time, so they catch up after a restart."""
+
+
 	defaultChannels = botData.dataObjects.DefaultChannels(
 		# Text Channels: Persistent text channels that are always created.
 		textChannels= [],
@@ -504,6 +590,10 @@ class Commander:
 	connIcon_ps2Offline = "🔴"
 	connIcon_ps2Invalid = "❌" # Users who have an invalid/non-matching PS2 name
 	connIcon_ps2Recruit = "🚼" # Shown when user is a recruit (requires User Library)
+
+	facilityFeedMaxEntries:int = 100
+	"""# Facility Feed Max Entries
+	The number of most recent facility captures & defences kept in an events facility feed."""
 	
 
 
@@ -528,10 +618,18 @@ class SignUps:
 	"""# Auto Parse Timeout:
 	The number of seconds before the view and message for an auto-parse message is removed."""
 
+	autoParseMinConfidence = 0.3
+	"""# Auto Parse Min Confidence:
+	Minimum match confidence (0-1) between a schedule event and a default op before it is offered for posting."""
+
 	
 	bAutoRemoveOutdated = True
 	"""# Auto Remove Outdated: 
 	On startup, or any call to Refresh Ops; if the event date is before the current date, remove it. """
+
+	refreshConcurrency = 4
+	"""# Refresh Concurrency:
+	Maximum number of live op messages updated at once when refreshing ops (on startup, or after a reconnect)."""
 	
 	
 	signupCategory = "SIGN UP"
@@ -596,6 +694,11 @@ class UserLib:
 	The interval the checking task is set to.  If `unloadAfter` is not set, this task is not added."""
 
 
+	entryCreationBatchSize = 100
+	"""# Entry Creation Batch Size:
+	Number of entries `create_missing_entries` writes at a time (off the event loop), between progress updates."""
+
+
 	bEnableSpecialUsers = True
 	"""# Enable Special Users: 
 	when true, user viewer checks for a matching ID .txt file.
@@ -721,10 +824,19 @@ class ContinentTrack:
 	Settings pertaining to the behaviour of the Planetside 2 Continent Tracker.
 	"""
 
-	worldID: int = 13
-	"""# World ID
-	The ID of the world to watch.
-	Obtained from: https://github.com/leonhard-s/auraxium/blob/master/tests/data/rest/datatype_payloads/world.json
+	trackedWorlds: tuple = (
+		botData.dataObjects.TrackedWorld(
+			worldID = 13,
+			name = "Cobalt",
+			continentChannelID = Channels.ps2ContinentNotifID,
+			facilityChannelID = Channels.ps2FacilityControlID
+		),
+	)
+	"""# Tracked Worlds
+	The worlds to watch, and the channels each worlds messages are sent to.  All worlds share one event stream subscription.
+	The first world is the primary world: used for commander alerts, and as the default world for commands.
+
+	World IDs obtained from: https://github.com/leonhard-s/auraxium/blob/master/tests/data/rest/datatype_payloads/world.json
 	"""
 
 
@@ -750,37 +862,72 @@ class ContinentTrack:
 	When true, the facility control capture monitors for facilities who are captured by the specified outfit."""
 
 
-	facilityMonitorOutfitID: int = 37569919291875540
-	"""# Facility Monitor Outfit ID
-	The ID of the outfit who's facility captures should be monitored.
+	facilityMonitorOutfitIDs: tuple = (37569919291875540,)
+	"""# Facility Monitor Outfit IDs
+	The IDs of the outfits who's facility captures should be monitored.
+	The first outfit is the default for the captures command.
 	"""
 
+	facilityDigestWindow: int = 900
+	"""# Facility Digest Window
+	Seconds after a capture digest message is posted that further captures are edited into it.  After this, a new message is posted."""
+
+	facilityDigestDelay: float = 5
+	"""# Facility Digest Delay
+	Seconds captures are collected before the digest message is posted or edited, so a burst of captures is a single edit."""
+
+	facilityMetadataMaxAge: int = 7
+	"""# Facility Metadata Max Age
+	Days the saved facility names & types are used for before being refreshed from the Census API."""
 
-	antiSpamMinimalTime:relativedelta = relativedelta(minutes=5)
-	""" Anti Spam minimal time
-	When a continent update occurs within this time period, the anti-spam counter is raised."""
+
+	antiSpamPeriod:int = 300
+	"""# Anti Spam: Period
+	Seconds over which the allowed posts are regained.  Each channel & message type is limited separately."""
 
 	antiSpamAllowedPosts = 3
 	"""# Anti Spam: Allowed Posts
-	The number of update messages allowed within the relative time period before anti-spam is enabled.
+	The number of update messages allowed within the period before anti-spam is enabled.
 	"""
 
+	bAntiSpamDigest:bool = True
+	"""# Anti Spam: Digest
+	When true, updates limited by anti-spam are merged and posted as one message once the limit allows.
+	When false, limited updates are not posted."""
 
-	reconnectionTime:time = time(hour=6, minute=00, tzinfo=timezone.utc)
-	"""# Reconnection Time
-	To avoid issues of the tracker ceasing to function until its reconnected, it's 'reconnected' every day.
-	
-	Reconnection involves closing the old client, recreation of triggers, then the recreation of the loop task.
-	"""
 
+	heartbeatTimeout:int = 90
+	"""# Heartbeat Timeout
+	Seconds without any message (events or the ~30 second heartbeat) from the event stream before the tracker is considered disconnected and reconnects."""
+
+	livenessCheckInterval:int = 30
+	"""# Liveness Check Interval
+	Seconds between each check of the event stream's heartbeat age."""
+
+	reconnectBackoffMin:int = 5
+	"""# Reconnect Backoff Min
+	Seconds to wait before retrying a failed reconnect.  Doubled after each consecutive failure."""
+
+	reconnectBackoffMax:int = 300
+	"""# Reconnect Backoff Max
+	The maximum seconds to wait between reconnect attempts."""
+
+	eventDedupWindow:int = 120
+	"""# Event Dedup Window
+	Seconds a received event is remembered for.  Duplicate events within this window (eg, from both clients during a reconnect) are dropped."""
 
-	bSaveOnShutdown:bool = True
-	"""# Save On Shutdown
+
+	bSaveHistory:bool = True
+	"""# Save History
 	When true:
-	-the continent objects are saved on bot shutdown
-	-Saved objects are restored on bot startup.
+	-continent and facility changes are logged to the continent history as they occur.
+	-continent statuses are restored from the history on bot startup.
 	"""
 
+	historyMaxResults:int = 20
+	"""# History Max Results
+	The maximum number of events shown by the history commands."""
+
 
 dataclass(frozen=True)
 class ForFun:
@@ -875,6 +1022,26 @@ class Directories:
 	"""# Runtime Configurable:
 	Directory for files which can be edited during runtime for bot functionality."""
 
+	chatLinksFile = f"{prefixDir}chatLinks.bin"
+	"""# Chat Links File:
+	File storing the voice channel -> linked text channel IDs, used to rebuild the links on startup."""
+
+	scheduledJobsFile = f"{prefixDir}scheduledJobs.bin"
+	"""# Scheduled Jobs File:
+	File storing persistent scheduled jobs (operation auto-starts), so they survive restarts."""
+
+	continentHistoryFile = f"{prefixDir}continentHistory.db"
+	"""# Continent History File:
+	SQLite database logging continent and facility changes."""
+
+	facilityMetadataFile = f"{prefixDir}facilityMetadata.bin"
+	"""# Facility Metadata File:
+	File storing the name & type of every facility, used by the continent tracker's facility monitor."""
+
+	commandHashFile = f"{prefixDir}commandHash.txt"
+	"""# Command Hash File:
+	File storing the hash of the last synced command tree, so an unchanged tree isn't re-synced on startup."""
+
 	lockFileAffix = ".LOCK"
 	"""# Lock File Affix:
 	Name of the affix to use for lock files."""
@@ -1012,5 +1179,5 @@ class Messages:
 	When a user uses a continent command and there's no collected data yet."""
 
 	
-	facilityOutfitCapture = "TDKD secured _DATA !"
-	"""Facility Outfit Capture:  Message for when the continent tracker sends a message for a facility capture.  `_DATA` is replaced with the facility info."""
\ No newline at end of file
+	facilityOutfitCapture = "_OUTFIT secured _DATA !"
+	"""Facility Outfit Capture:  Message for when the continent tracker sends a message for a facility capture.  `_OUTFIT` is replaced with the outfit tag, `_DATA` with the facility info."""
\ No newline at end of file
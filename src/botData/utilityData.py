@@ -131,4 +131,21 @@ class PS2ContMessageType(Enum):
 	"""Post a Simple message; containing just the continent and its new status."""
 
 	Detailed = 20
-	"""Post a detailed message; contains all current continent statuses."""
\ No newline at end of file
+	"""Post a detailed message; contains all current continent statuses."""
+
+
+
+class PS2ContEventType(Enum):
+	"""# PS2 Continent Event Type
+	The type of an event in the continent history log.
+
+	Values are stored in the log; do not change existing values.
+	"""
+	Lock = 1
+	"""A continent locked."""
+
+	Unlock = 2
+	"""A continent opened."""
+
+	Facility = 3
+	"""A facility changed faction."""
\ No newline at end of file
@@ -0,0 +1,357 @@
+"""
+BOT METRICS
+In-process counters, gauges and histograms, to show how the bot behaves under load.
+
+Metrics are created once (typically at module level) through `BotMetrics`, and updated where the work happens.
+They are served as OpenMetrics text on a local port, and summarised by the `/admin metrics` command.
+"""
+from __future__ import annotations
+
+import functools
+import inspect
+import time
+from typing import Callable
+
+from aiohttp import web
+
+from botData.settings import BotSettings
+from botUtils import BotPrinter
+
+BUPrint = BotPrinter.GetLogger("metrics")
+
+
+def EscapeLabel(p_value) -> str:
+	"""# ESCAPE LABEL
+	Returns the value escaped for use as an OpenMetrics label value."""
+	return str(p_value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+
+class Metric():
+	"""
+	# METRIC
+	Base of each metric type; holds the values of each label set.
+	"""
+	metricType = "unknown"
+
+	def __init__(self, p_name:str, p_help:str, p_labelNames:tuple[str, ...] = ()) -> None:
+		self.name = p_name
+		self.help = p_help
+		self.labelNames = p_labelNames
+		self.values: dict[tuple, float] = {}
+		"""Label values : value."""
+
+
+	def GetLabelString(self, p_labels:tuple, p_extra:str = "") -> str:
+		"""# GET LABEL STRING
+		Returns the labels formatted for a sample line; empty if there are none."""
+		vPairs = [f'{name}="{EscapeLabel(value)}"' for name, value in zip(self.labelNames, p_labels)]
+		if p_extra != "":
+			vPairs.append(p_extra)
+
+		if len(vPairs) == 0:
+			return ""
+
+		return "{" + ",".join(vPairs) + "}"
+
+
+	def GetSamples(self) -> list[str]:
+		"""# GET SAMPLES
+		Returns the sample lines of the metric."""
+		return [f"{self.name}{self.GetLabelString(labels)} {value}" for labels, value in self.values.items()]
+
+
+	def GetSummary(self, p_uptimeMinutes:float) -> list[str]:
+		"""# GET SUMMARY
+		Returns a short, human readable line for each label set."""
+		return [f"{self.name}{self.GetLabelString(labels)}: {value:g}" for labels, value in self.values.items()]
+
+
+
+class Counter(Metric):
+	"""
+	# COUNTER
+	A value that only increases.
+	"""
+	metricType = "counter"
+
+	def Inc(self, p_amount:float = 1, p_labels:tuple = ()):
+		"""# INC
+		Increases the counter for the labels."""
+		self.values[p_labels] = self.values.get(p_labels, 0) + p_amount
+
+
+	def GetSamples(self) -> list[str]:
+		return [f"{self.name}_total{self.GetLabelString(labels)} {value}" for labels, value in self.values.items()]
+
+
+	def GetSummary(self, p_uptimeMinutes:float) -> list[str]:
+		return [f"{self.name}{self.GetLabelString(labels)}: {value:g} ({value / max(p_uptimeMinutes, 1):.2f}/min)" for labels, value in self.values.items()]
+
+
+
+class Gauge(Metric):
+	"""
+	# GAUGE
+	A value that can go up and down.
+	"""
+	metricType = "gauge"
+
+	def Set(self, p_value:float, p_labels:tuple = ()):
+		"""# SET
+		Sets the gauge for the labels."""
+		self.values[p_labels] = p_value
+
+
+	def Inc(self, p_amount:float = 1, p_labels:tuple = ()):
+		"""# INC
+		Changes the gauge for the labels by the amount; may be negative."""
+		self.values[p_labels] = self.values.get(p_labels, 0) + p_amount
+
+
+
+class Histogram(Metric):
+	"""
+	# HISTOGRAM
+	Counts observed values (typically durations, in seconds) into buckets.
+	"""
+	metricType = "histogram"
+	defaultBuckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+	def __init__(self, p_name:str, p_help:str, p_labelNames:tuple[str, ...] = (), p_buckets:tuple[float, ...] = None) -> None:
+		super().__init__(p_name, p_help, p_labelNames)
+		self.buckets = p_buckets if p_buckets != None else Histogram.defaultBuckets
+		self.bucketCounts: dict[tuple, list[int]] = {}
+		"""Label values : Count of each bucket (not cumulative), followed by the +Inf bucket."""
+		self.sums: dict[tuple, float] = {}
+
+
+	def Observe(self, p_value:float, p_labels:tuple = ()):
+		"""# OBSERVE
+		Adds a value to the histogram for the labels."""
+		if p_labels not in self.bucketCounts:
+			self.bucketCounts[p_labels] = [0] * (len(self.buckets) + 1)
+			self.sums[p_labels] = 0
+
+		vIndex = len(self.buckets)
+		for index, bound in enumerate(self.buckets):
+			if p_value <= bound:
+				vIndex = index
+				break
+
+		self.bucketCounts[p_labels][vIndex] += 1
+		self.sums[p_labels] += p_value
+
+
+	def Time(self, p_labels:tuple = ()) -> HistogramTimer:
+		"""# TIME
+		Returns a context manager which observes the time spent within it."""
+		return HistogramTimer(self, p_labels)
+
+
+	def GetQuantile(self, p_labels:tuple, p_quantile:float) -> float:
+		"""# GET QUANTILE
+		Returns the upper bound of the bucket containing the quantile; an estimate."""
+		vCounts = self.bucketCounts[p_labels]
+		vTarget = sum(vCounts) * p_quantile
+		vTotal = 0
+		for index, count in enumerate(vCounts):
+			vTotal += count
+			if vTotal >= vTarget:
+				return self.buckets[index] if index < len(self.buckets) else float("inf")
+
+		return float("inf")
+
+
+	def GetSamples(self) -> list[str]:
+		vSamples = []
+		for labels, counts in self.bucketCounts.items():
+			vCumulative = 0
+			for bound, count in zip(self.buckets + ("+Inf",), counts):
+				vCumulative += count
+				vBound = f'le="{bound}"'
+				vSamples.append(f"{self.name}_bucket{self.GetLabelString(labels, vBound)} {vCumulative}")
+
+			vSamples.append(f"{self.name}_count{self.GetLabelString(labels)} {vCumulative}")
+			vSamples.append(f"{self.name}_sum{self.GetLabelString(labels)} {self.sums[labels]}")
+
+		return vSamples
+
+
+	def GetSummary(self, p_uptimeMinutes:float) -> list[str]:
+		vLines = []
+		for labels, counts in self.bucketCounts.items():
+			vCount = sum(counts)
+			vLines.append(
+				f"{self.name}{self.GetLabelString(labels)}: {vCount} ({vCount / max(p_uptimeMinutes, 1):.2f}/min) | "
+				f"mean {self.sums[labels] / vCount:.3f}s | p95 <= {self.GetQuantile(labels, 0.95)}s"
+			)
+
+		return vLines
+
+
+
+class HistogramTimer():
+	"""
+	# HISTOGRAM TIMER
+	Context manager which observes the time spent within it; returned by `Histogram.Time`.
+	"""
+	def __init__(self, p_histogram:Histogram, p_labels:tuple) -> None:
+		self.histogram = p_histogram
+		self.labels = p_labels
+		self.start = 0
+
+
+	def __enter__(self):
+		self.start = time.perf_counter()
+		return self
+
+
+	def __exit__(self, p_excType, p_excValue, p_traceback):
+		self.histogram.Observe(time.perf_counter() - self.start, self.labels)
+		return False
+
+
+
+class BotMetrics():
+	"""
+	# BOT METRICS
+	Registry of all metrics, and the local OpenMetrics endpoint.
+	"""
+	metrics: dict[str, Metric] = {}
+	startTime = time.monotonic()
+	serverRunner: web.AppRunner = None
+
+
+	def Register(p_metric:Metric) -> Metric:
+		"""# REGISTER
+		Adds the metric to the registry, or returns the existing metric of the same name."""
+		return BotMetrics.metrics.setdefault(p_metric.name, p_metric)
+
+
+	def Counter(p_name:str, p_help:str, p_labelNames:tuple[str, ...] = ()) -> Counter:
+		"""# COUNTER
+		Creates (or gets) a counter."""
+		return BotMetrics.Register(Counter(p_name, p_help, p_labelNames))
+
+
+	def Gauge(p_name:str, p_help:str, p_labelNames:tuple[str, ...] = ()) -> Gauge:
+		"""# GAUGE
+		Creates (or gets) a gauge."""
+		return BotMetrics.Register(Gauge(p_name, p_help, p_labelNames))
+
+
+	def Histogram(p_name:str, p_help:str, p_labelNames:tuple[str, ...] = (), p_buckets:tuple[float, ...] = None) -> Histogram:
+		"""# HISTOGRAM
+		Creates (or gets) a histogram."""
+		return BotMetrics.Register(Histogram(p_name, p_help, p_labelNames, p_buckets))
+
+
+	def Timed(p_histogram:Histogram, *p_labels) -> Callable:
+		"""# TIMED
+		Decorator which observes the duration of each call of a function or coroutine function in the histogram."""
+		def Decorator(p_function:Callable):
+			if inspect.iscoroutinefunction(p_function):
+				@functools.wraps(p_function)
+				async def TimedCoroutine(*args, **kwargs):
+					with p_histogram.Time(p_labels):
+						return await p_function(*args, **kwargs)
+
+				return TimedCoroutine
+
+			@functools.wraps(p_function)
+			def TimedFunction(*args, **kwargs):
+				with p_histogram.Time(p_labels):
+					return p_function(*args, **kwargs)
+
+			return TimedFunction
+
+		return Decorator
+
+
+	def GetUptimeMinutes() -> float:
+		return (time.monotonic() - BotMetrics.startTime) / 60
+
+
+	def Render() -> str:
+		"""# RENDER
+		Returns all metrics in the OpenMetrics text format."""
+		vLines = []
+		for metric in BotMetrics.metrics.values():
+			vLines.append(f"# TYPE {metric.name} {metric.metricType}")
+			vLines.append(f"# HELP {metric.name} {metric.help}")
+			vLines.extend(metric.GetSamples())
+
+		vLines.append("# EOF")
+		return "\n".join(vLines) + "\n"
+
+
+	def GetSummary() -> str:
+		"""# GET SUMMARY
+		Returns a human readable summary of all metrics with values, with rates per minute of uptime."""
+		vUptime = BotMetrics.GetUptimeMinutes()
+		vLines = [f"Uptime: {vUptime:.0f} minutes"]
+		for metric in BotMetrics.metrics.values():
+			vLines.extend(metric.GetSummary(vUptime))
+
+		return "\n".join(vLines)
+
+
+	async def HandleRequest(p_request:web.Request) -> web.Response:
+		return web.Response(
+			body=BotMetrics.Render().encode(),
+			headers={"Content-Type": "application/openmetrics-text; version=1.0.0; charset=utf-8"}
+		)
+
+
+	async def StartServer():
+		"""# START SERVER
+		Starts serving the metrics on the configured local port, if enabled."""
+		if not BotSettings.bMetricsEnabled or BotMetrics.serverRunner != None:
+			return
+
+		vApp = web.Application()
+		vApp.router.add_get("/metrics", BotMetrics.HandleRequest)
+
+		BotMetrics.serverRunner = web.AppRunner(vApp, access_log=None)
+		await BotMetrics.serverRunner.setup()
+
+		try:
+			await web.TCPSite(BotMetrics.serverRunner, BotSettings.metricsHost, BotSettings.metricsPort).start()
+		except OSError as vError:
+			BUPrint.LogErrorExc("Unable to start the metrics server.", vError)
+			await BotMetrics.StopServer()
+			return
+
+		BUPrint.Info("Serving metrics on http://%s:%d/metrics", BotSettings.metricsHost, BotSettings.metricsPort)
+
+
+	async def StopServer():
+		"""# STOP SERVER
+		Stops the metrics server, if running."""
+		if BotMetrics.serverRunner != None:
+			await BotMetrics.serverRunner.cleanup()
+			BotMetrics.serverRunner = None
+
+
+	def InstrumentDiscordHTTP(p_bot):
+		"""# INSTRUMENT DISCORD HTTP
+		Times every Discord API request made by the bot, by method and route.
+		Routes are the templates (eg `/channels/{channel_id}/messages/{message_id}`), so message edits are `PATCH` of that route."""
+		vRequest = p_bot.http.request
+
+		if getattr(vRequest, "bIsInstrumented", False):
+			return
+
+		@functools.wraps(vRequest)
+		async def TimedRequest(route, *args, **kwargs):
+			with discordRequests.Time((route.method, route.path)):
+				return await vRequest(route, *args, **kwargs)
+
+		TimedRequest.bIsInstrumented = True
+		p_bot.http.request = TimedRequest
+
+
+
+discordRequests = BotMetrics.Histogram("discord_request_seconds", "Duration of Discord API requests.", ("method", "route"))
+censusRequests = BotMetrics.Histogram("census_request_seconds", "Duration of Census API requests.", ("source",))
@@ -0,0 +1,159 @@
+"""
+BOT PROFILER
+On-demand, time-boxed profiling of the event loop, for diagnosing lag on a running bot.
+
+A sampling thread records the event loop thread's stack at a fixed interval, which is output in the collapsed stack format used by flamegraph tools.
+While profiling, asyncio debug mode is enabled so callbacks slower than a threshold are recorded.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+from botUtils import BotPrinter
+
+BUPrint = BotPrinter.GetLogger("profiler")
+
+
+class ProfileResult():
+	"""
+	# PROFILE RESULT
+	The output of a profiling session.
+	"""
+	def __init__(self) -> None:
+		self.stacks: Counter[str] = Counter()
+		"""Collapsed stack (root first, `;` separated) : Sample count."""
+		self.sampleCount = 0
+		self.duration = 0.0
+		self.slowCallbacks: list[str] = []
+
+
+	def GetCollapsed(self) -> str:
+		"""# GET COLLAPSED
+		Returns the samples in the collapsed stack format (`frame;frame;frame count` per line)."""
+		return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common()) + "\n"
+
+
+	def GetTopFrames(self, p_count:int = 5) -> list[tuple[str, int]]:
+		"""# GET TOP FRAMES
+		Returns the frames most often at the top of the stack, with their sample count."""
+		vFrames: Counter[str] = Counter()
+		for stack, count in self.stacks.items():
+			vFrames[stack.rsplit(";", 1)[-1]] += count
+
+		return vFrames.most_common(p_count)
+
+
+
+class SlowCallbackHandler(logging.Handler):
+	"""
+	# SLOW CALLBACK HANDLER
+	Records the slow callback warnings asyncio logs in debug mode.
+	"""
+	def __init__(self, p_result:ProfileResult) -> None:
+		super().__init__(logging.WARNING)
+		self.result = p_result
+
+
+	def emit(self, p_record:logging.LogRecord):
+		vMessage = p_record.getMessage()
+		if vMessage.startswith("Executing "):
+			self.result.slowCallbacks.append(f"{time.strftime('%H:%M:%S', time.localtime(p_record.created))} {vMessage}")
+
+
+
+class BotProfiler():
+	"""
+	# BOT PROFILER
+	Profiles the event loop; only one profile may run at a time.
+	"""
+	bIsRunning = False
+
+
+	def GetFrameName(p_frame) -> str:
+		"""# GET FRAME NAME
+		Returns the function name & location of a frame, for use in a collapsed stack."""
+		vCode = p_frame.f_code
+		return f"{vCode.co_name} ({os.path.basename(vCode.co_filename)}:{vCode.co_firstlineno})"
+
+
+	def Sample(p_threadID:int, p_interval:float, p_stopEvent:threading.Event, p_result:ProfileResult):
+		"""# SAMPLE
+		Run in the sampling thread; records the stack of the thread until the stop event is set."""
+		while not p_stopEvent.wait(p_interval):
+			vFrame = sys._current_frames().get(p_threadID)
+			if vFrame == None:
+				continue
+
+			vStack = []
+			while vFrame != None:
+				vStack.append(BotProfiler.GetFrameName(vFrame))
+				vFrame = vFrame.f_back
+
+			vStack.reverse()
+			p_result.stacks[";".join(vStack)] += 1
+			p_result.sampleCount += 1
+
+
+	async def Profile(p_seconds:float, p_interval:float, p_slowThreshold:float) -> ProfileResult:
+		"""# PROFILE
+		Samples the event loop for the duration.  Must be called from the event loop.
+
+		## PARAMETERS
+		- `p_seconds`: Duration of the profile.
+		- `p_interval`: Seconds between samples.
+		- `p_slowThreshold`: Callbacks taking longer than this many seconds are recorded.
+
+		## RETURNS
+		The `ProfileResult`, or `None` if a profile is already running.
+		"""
+		if BotProfiler.bIsRunning:
+			return None
+
+		BotProfiler.bIsRunning = True
+		vResult = ProfileResult()
+
+		vLoop = asyncio.get_running_loop()
+		bWasDebug = vLoop.get_debug()
+		vPreviousThreshold = vLoop.slow_callback_duration
+
+		vAsyncioLogger = logging.getLogger("asyncio")
+		vSlowHandler = SlowCallbackHandler(vResult)
+		vAsyncioLogger.addHandler(vSlowHandler)
+
+		vStopEvent = threading.Event()
+		vSampler = threading.Thread(
+			target=BotProfiler.Sample,
+			args=(threading.get_ident(), p_interval, vStopEvent, vResult),
+			name="BotProfiler",
+			daemon=True
+		)
+
+		BUPrint.Info("Profiling event loop for %s seconds.", p_seconds)
+		vStart = time.perf_counter()
+
+		try:
+			vLoop.slow_callback_duration = p_slowThreshold
+			vLoop.set_debug(True)
+			vSampler.start()
+
+			await asyncio.sleep(p_seconds)
+
+		finally:
+			vStopEvent.set()
+			await asyncio.to_thread(vSampler.join)
+
+			vLoop.set_debug(bWasDebug)
+			vLoop.slow_callback_duration = vPreviousThreshold
+			vAsyncioLogger.removeHandler(vSlowHandler)
+
+			vResult.duration = time.perf_counter() - vStart
+			BotProfiler.bIsRunning = False
+
+		BUPrint.Info("Profile complete: %d samples, %d slow callbacks.", vResult.sampleCount, len(vResult.slowCallbacks))
+		return vResult
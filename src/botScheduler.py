@@ -0,0 +1,155 @@
+"""
+BOT SCHEDULER
+The single scheduler shared by the bot: operation auto-starts, and commander reminders & intervals.
+
+Auto-starts are held in a persistent (pickled) job store, so they survive restarts.
+Commander jobs reference live objects and are held in memory, using ids prefixed per commander.
+"""
+
+import os
+import pickle
+from datetime import timezone
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.jobstores.memory import MemoryJobStore
+from apscheduler.jobstores.base import JobLookupError
+from apscheduler.job import Job
+
+from botData.settings import BotSettings, Directories
+from botData.settings import Commander as CommanderSettings
+from botUtils import BotPrinter
+
+BUPrint = BotPrinter.GetLogger("scheduler")
+
+
+class PickleJobStore(MemoryJobStore):
+	"""
+	# PICKLE JOB STORE
+	A memory job store which saves its jobs to file on each change, and loads them when started.
+	Jobs added must be serialisable: a module level function & picklable arguments.
+	"""
+	def __init__(self, p_filePath:str):
+		super().__init__()
+		self.filePath = p_filePath
+
+
+	def start(self, scheduler, alias):
+		super().start(scheduler, alias)
+
+		if not os.path.exists(self.filePath):
+			return
+
+		try:
+			with open(self.filePath, "rb") as vFile:
+				vJobStates:list[dict] = pickle.load(vFile)
+		except (OSError, pickle.UnpicklingError, EOFError) as vError:
+			BUPrint.LogErrorExc("Unable to load scheduled jobs", vError)
+			return
+
+		for jobState in vJobStates:
+			try:
+				vJob = Job.__new__(Job)
+				vJob.__setstate__(jobState)
+				vJob._scheduler = scheduler
+				vJob._jobstore_alias = alias
+				super().add_job(vJob)
+			except (LookupError, ValueError, ImportError) as vError:
+				BUPrint.LogErrorExc(f"Unable to restore scheduled job: {jobState.get('id')}", vError)
+
+		BUPrint.Info(f"Scheduler: Restored {len(self._jobs)} persistent jobs.")
+
+
+	def add_job(self, job:Job):
+		job.__getstate__() # Raises before adding if the job can't be serialised.
+		super().add_job(job)
+		self.SaveJobs()
+
+
+	def update_job(self, job:Job):
+		super().update_job(job)
+		self.SaveJobs()
+
+
+	def remove_job(self, job_id):
+		super().remove_job(job_id)
+		self.SaveJobs()
+
+
+	def remove_all_jobs(self):
+		super().remove_all_jobs()
+		self.SaveJobs()
+
+
+	def shutdown(self):
+		# The memory store clears its jobs on shutdown; do so without saving, so the file is kept for next start.
+		super().remove_all_jobs()
+
+
+	def SaveJobs(self):
+		"""# SAVE JOBS
+		Writes the current job states to file, replacing the previous file once written."""
+		vTempPath = f"{self.filePath}.tmp"
+		try:
+			with open(vTempPath, "wb") as vFile:
+				pickle.dump([job.__getstate__() for job, timestamp in self._jobs], vFile, BotSettings.pickleProtocol)
+			os.replace(vTempPath, self.filePath)
+		except (OSError, pickle.PickleError) as vError:
+			BUPrint.LogErrorExc("Unable to save scheduled jobs", vError)
+
+
+
+class BotScheduler():
+	"""
+	# BOT SCHEDULER
+	Holds the shared scheduler.  All functions are static.
+
+	Missed jobs are coalesced into a single run, and run if within their misfire grace time.
+	"""
+	persistentStore = "persistent"
+	scheduler = AsyncIOScheduler(
+		timezone=timezone.utc,
+		jobstores={
+			"default": MemoryJobStore(),
+			persistentStore: PickleJobStore(Directories.scheduledJobsFile)
+		},
+		job_defaults={
+			"coalesce": True,
+			"misfire_grace_time": CommanderSettings.jobMisfireGrace
+		}
+	)
+
+
+	def Start(bPaused:bool = False):
+		"""# START
+		Starts the scheduler, if not already running.
+		Start paused if persistent jobs require data not yet loaded; then call `Resume`."""
+		if not BotScheduler.scheduler.running:
+			BotScheduler.scheduler.start(paused=bPaused)
+
+
+	def Resume():
+		"""# RESUME
+		Resumes job processing, if paused."""
+		BotScheduler.scheduler.resume()
+
+
+	def RemoveJob(p_jobID:str, p_jobStore:str = None) -> bool:
+		"""# REMOVE JOB
+		Removes the job if it exists.
+
+		## RETURNS
+		`bool`: True if a job was removed.
+		"""
+		try:
+			BotScheduler.scheduler.remove_job(p_jobID, p_jobStore)
+			return True
+		except JobLookupError:
+			return False
+
+
+	def RemoveJobsWithPrefix(p_prefix:str, p_jobStore:str = None):
+		"""# REMOVE JOBS WITH PREFIX
+		Removes all jobs whose ID starts with the prefix."""
+		for job in BotScheduler.scheduler.get_jobs(p_jobStore):
+			if job.id.startswith(p_prefix):
+				BotScheduler.RemoveJob(job.id, p_jobStore)
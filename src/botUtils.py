@@ -1,4 +1,5 @@
 import os
+import bisect
 import sys
 import datetime
 import time
@@ -7,6 +8,11 @@ from botData.settings import BotSettings, CommandRestrictionLevels, Directories,
 from botData.dataObjects import EntryRetention
 import botData.utilityData as UtilityData
 import traceback
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import copy
+import json
 import discord
 from discord.ext import commands
 # from botData import OperationData
@@ -35,30 +41,80 @@ class BotPrinter():
 	"""
 	BOT PRINTER
 	Convenience class containing functions to print various information to console (and/or file).
+
+	Messages are sent through the `logging` module, to the `bot` logger or a subsystem logger (see `GetLogger`).
+	Arguments are formatted lazily, `%` style, only if the message is shown: `Debug("Found %s files", len(files))`.
+	Output is written by a `QueueListener` thread, so logging never blocks the event loop; call `Setup` on startup and `Shutdown` on exit.
 	"""
+	logger = logging.getLogger("bot")
+	queueListener: QueueListener = None
+
+	def Setup():
+		"""# SETUP
+		Configures the bot loggers from settings and starts the output thread."""
+		if BotPrinter.queueListener != None:
+			return
+
+		vFormatter = JSONLogFormatter() if BotSettings.bLogAsJSON else ConsoleLogFormatter()
+
+		vOutHandler = logging.StreamHandler(sys.stdout)
+		vOutHandler.addFilter(lambda record: record.levelno < logging.ERROR)
+		vErrHandler = logging.StreamHandler(sys.stderr)
+		vErrHandler.setLevel(logging.ERROR)
+		for handler in (vOutHandler, vErrHandler):
+			handler.setFormatter(vFormatter)
+
+		vQueue = queue.SimpleQueue()
+		BotPrinter.queueListener = QueueListener(vQueue, vOutHandler, vErrHandler, respect_handler_level=True)
+
+		BotPrinter.logger.handlers.clear()
+		BotPrinter.logger.addHandler(BotQueueHandler(vQueue))
+		BotPrinter.logger.propagate = False
+		BotPrinter.logger.setLevel(logging.DEBUG if BotSettings.bDebugEnabled else logging.INFO)
+
+		for subsystem, level in BotSettings.logLevels:
+			BotPrinter.GetLogger(subsystem).logger.setLevel(level)
+
+		BotPrinter.queueListener.start()
+
+
+	def Shutdown():
+		"""# SHUTDOWN
+		Writes any queued messages and stops the output thread."""
+		if BotPrinter.queueListener != None:
+			BotPrinter.queueListener.stop()
+			BotPrinter.queueListener = None
+
+
+	def GetLogger(p_subsystem:str) -> "SubsystemPrinter":
+		"""# GET LOGGER
+		Returns a printer for a subsystem; its messages are labelled with, and may be filtered by, the subsystem name.
+		Has the same functions as `BotPrinter`, so modules can use it in its place."""
+		return SubsystemPrinter(logging.getLogger(f"bot.{p_subsystem}"))
+
 
 	@staticmethod
-	def Debug(p_string):
+	def Debug(p_string, *p_args):
 		"""
 		DEBUG
 		Prints a pre-formatted message to console IF ShowDebug is enabled.
 		"""
-		if(BotSettings.bDebugEnabled):
-			print(f"{UtilityData.ConsoleStyles.timeStyle}[{datetime.datetime.now()}] {p_string}{UtilityData.ConsoleStyles.reset} ")
+		if BotPrinter.logger.isEnabledFor(logging.DEBUG):
+			BotPrinter.logger.debug(p_string, *p_args, stacklevel=2)
 
 
 	@staticmethod
-	def Info(p_string):
+	def Info(p_string, *p_args):
 		"""
 		INFO
 		Similar to debug, but doesn't depend on ShowDebug to show.
 		Should ideally only be used for displaying status as to not flood the console.
 		"""
-		print(f"{UtilityData.ConsoleStyles.timeStyle}[{datetime.datetime.now()}]{UtilityData.ConsoleStyles.reset} {p_string}")
+		BotPrinter.logger.info(p_string, *p_args, stacklevel=2)
 
 
 	@staticmethod
-	def LogError(p_string:str, p_titleStr:str = ""):
+	def LogError(p_string:str, p_titleStr:str = "", *p_args):
 		"""
 		LOG ERROR
 		Displays an error to console.
@@ -66,16 +122,112 @@ class BotPrinter():
 		p_titleString: String shown in alternate colour.
 		p_string : The message to show.
 		"""
-		print(f"{UtilityData.ConsoleStyles.timeStyle}[{datetime.datetime.now()}]{UtilityData.ConsoleStyles.reset} {UtilityData.ConsoleStyles.colourWarn}ERROR | {p_titleStr}{UtilityData.ConsoleStyles.reset} {UtilityData.ConsoleStyles.ColourInfo}{p_string}{UtilityData.ConsoleStyles.reset}", file=sys.stderr)
+		BotPrinter.logger.error(p_string, *p_args, extra={"titleStr": p_titleStr}, stacklevel=2)
 
 
 	@staticmethod
-	def LogErrorExc(p_string: str, p_exception: Exception):
+	def LogErrorExc(p_string: str, p_exception: Exception, *p_args):
 		"""
 		Same as LOG ERROR, with addition of Exception parameter.
 		"""
-		print(f"{UtilityData.ConsoleStyles.timeStyle}[{datetime.datetime.now()}]{UtilityData.ConsoleStyles.reset} {UtilityData.ConsoleStyles.colourWarn}ERROR:{UtilityData.ConsoleStyles.reset} {UtilityData.ConsoleStyles.ColourInfo}{p_string} | {UtilityData.ConsoleStyles.reset}{ traceback.print_exc(limit=3)}", file=sys.stderr)
+		BotPrinter.logger.error(p_string, *p_args, exc_info=p_exception, stacklevel=2)
+
+
+
+class SubsystemPrinter():
+	"""
+	SUBSYSTEM PRINTER
+	A `BotPrinter` for a subsystem logger; created by `BotPrinter.GetLogger`.
+	"""
+	def __init__(self, p_logger:logging.Logger) -> None:
+		self.logger = p_logger
+
+
+	def Debug(self, p_string, *p_args):
+		if self.logger.isEnabledFor(logging.DEBUG):
+			self.logger.debug(p_string, *p_args, stacklevel=2)
+
+
+	def Info(self, p_string, *p_args):
+		self.logger.info(p_string, *p_args, stacklevel=2)
+
+
+	def LogError(self, p_string:str, p_titleStr:str = "", *p_args):
+		self.logger.error(p_string, *p_args, extra={"titleStr": p_titleStr}, stacklevel=2)
+
+
+	def LogErrorExc(self, p_string: str, p_exception: Exception, *p_args):
+		self.logger.error(p_string, *p_args, exc_info=p_exception, stacklevel=2)
+
+
+
+class BotQueueHandler(QueueHandler):
+	"""
+	BOT QUEUE HANDLER
+	Queues records for the output thread, leaving formatting (including exceptions) to the output formatter.
+	"""
+	def prepare(self, p_record:logging.LogRecord) -> logging.LogRecord:
+		# Arguments are merged now, so later changes to them aren't reflected.
+		vRecord = copy.copy(p_record)
+		vRecord.msg = p_record.getMessage()
+		vRecord.args = None
+		return vRecord
+
+
+
+class ConsoleLogFormatter(logging.Formatter):
+	"""
+	CONSOLE LOG FORMATTER
+	Formats log records in the bots console style; subsystem messages are prefixed with the subsystem.
+	"""
+	def format(self, p_record:logging.LogRecord) -> str:
+		vStyles = UtilityData.ConsoleStyles
+		vTime = datetime.datetime.fromtimestamp(p_record.created)
+		vMessage = p_record.getMessage()
+
+		if p_record.name != BotPrinter.logger.name:
+			vMessage = f"[{p_record.name.removeprefix('bot.')}] {vMessage}"
+
+		if p_record.levelno < logging.INFO:
+			return f"{vStyles.timeStyle}[{vTime}] {vMessage}{vStyles.reset} "
+
+		if p_record.levelno < logging.ERROR:
+			return f"{vStyles.timeStyle}[{vTime}]{vStyles.reset} {vMessage}"
+
+		vString = f"{vStyles.timeStyle}[{vTime}]{vStyles.reset} {vStyles.colourWarn}ERROR | {getattr(p_record, 'titleStr', '')}{vStyles.reset} {vStyles.ColourInfo}{vMessage}{vStyles.reset}"
+		if p_record.exc_info:
+			vString += f"\n{self.formatException(p_record.exc_info)}"
+
+		return vString
+
 
+	def formatException(self, p_excInfo) -> str:
+		# Limited, as the full trace is rarely useful and floods the console.
+		return "".join(traceback.format_exception(*p_excInfo, limit=3)).rstrip()
+
+
+
+class JSONLogFormatter(ConsoleLogFormatter):
+	"""
+	JSON LOG FORMATTER
+	Formats log records as one JSON object per line, for log collectors.
+	"""
+	def format(self, p_record:logging.LogRecord) -> str:
+		vEntry = {
+			"time": datetime.datetime.fromtimestamp(p_record.created, datetime.timezone.utc).isoformat(),
+			"level": p_record.levelname,
+			"logger": p_record.name,
+			"message": p_record.getMessage(),
+			"location": f"{p_record.module}.{p_record.funcName}:{p_record.lineno}"
+		}
+
+		if getattr(p_record, "titleStr", "") != "":
+			vEntry["title"] = p_record.titleStr
+
+		if p_record.exc_info:
+			vEntry["exception"] = self.formatException(p_record.exc_info)
+
+		return json.dumps(vEntry, default=str)
 
 
 
@@ -141,11 +293,18 @@ class FilesAndFolders():
 			elif pEndsWith == "":
 				vDataFiles.append(file)
 
-		BotPrinter.Debug(f"Files ending with: {pEndsWith} In: {pDir} found:\n{vDataFiles}")
+		BotPrinter.Debug("Files ending with: %s In: %s found:\n%s", pEndsWith, pDir, vDataFiles)
 		return vDataFiles
 
 
 
+	def GetFilesQuiet(pDir: str, pEndsWith: str = "", pStartsWith: str = ""):
+		"""# Get Files Quiet
+		As `GetFiles`, without logging the found list; for frequently called functions.
+		Optionally also filters by prefix."""
+		return [file for file in os.listdir(pDir) if file.endswith(pEndsWith) and file.startswith(pStartsWith)]
+
+
 	def CreateFolderPath(p_folderPath:str):
 		"""# Create Folder Path
 		Creates the specified folder(s) if it doesn't already exist."""
@@ -276,6 +435,137 @@ class FilesAndFolders():
 		return True
 
 
+
+class FileCatalogue():
+	"""
+	# FILE CATALOGUE
+	A cached listing of files within a directory, with a prefix & trigram index for ranked searching.
+
+	The directory is polled by modification time on access; the listing and index are only rebuilt when it changes.
+	Intended for autocomplete handlers, which are called on every keystroke.
+	The modification time may not change for writes within its resolution, so the bot's own additions & removals should force a refresh.
+	"""
+	def __init__(self, p_directory:str, p_endsWith:str = "", p_startsWith:str = "", p_extraEntries:list[str] = None) -> None:
+		self.directory = p_directory
+		self.endsWith = p_endsWith
+		self.startsWith = p_startsWith
+		self.extraEntries:list[str] = p_extraEntries if p_extraEntries != None else [] # Non-file entries always present (eg, "Custom")
+		self.files:list[str] = []
+		self.labels:dict[str, str] = {} # Entry : lowercase display label.
+		self.prefixes:list[tuple[str, str]] = [] # Sorted (label from each word start, entry); searched by bisect.
+		self.trigrams:dict[str, set[str]] = {} # Trigram : Entries containing it.
+		self.dirTime = None
+		self.version = 0 # Incremented each time the listing changes.
+
+
+	def GetLabel(self, p_entry:str):
+		"""# GET LABEL
+		Returns the display label of an entry; the filename without the catalogue prefix & extension."""
+		if p_entry in self.extraEntries:
+			return p_entry
+		return p_entry.removeprefix(self.startsWith).removesuffix(self.endsWith)
+
+
+	def Refresh(self, p_force:bool = False) -> bool:
+		"""# REFRESH
+		Rebuilds the listing & index if the directory has changed, or if forced.
+		When forced, the index is only rebuilt if the listing differs.
+
+		## RETURNS
+		`bool`: True if the listing was rebuilt.
+		"""
+		try:
+			vDirTime = os.stat(self.directory).st_mtime_ns
+		except OSError:
+			vDirTime = None
+
+		if not p_force and vDirTime == self.dirTime and self.version != 0:
+			return False
+
+		vFiles = FilesAndFolders.GetFilesQuiet(self.directory, self.endsWith, self.startsWith) if vDirTime != None else []
+		self.dirTime = vDirTime
+		if vFiles == self.files and self.version != 0:
+			return False
+
+		self.files = vFiles
+		self.labels = {}
+		self.trigrams = {}
+		vPrefixes:list[tuple[str, str]] = []
+		for entry in self.extraEntries + self.files:
+			vLabel = self.GetLabel(entry).lower()
+			self.labels[entry] = vLabel
+			vPrefixes.append((vLabel, entry))
+			for index in range(len(vLabel) - 2):
+				self.trigrams.setdefault(vLabel[index:index+3], set()).add(entry)
+
+			for index in range(len(vLabel) - 1):
+				if vLabel[index] in " _-":
+					vPrefixes.append((vLabel[index+1:], entry))
+
+		self.prefixes = sorted(vPrefixes)
+		self.version += 1
+		BotPrinter.Debug("Catalogue rebuilt: %s (%d files)", self.directory, len(self.files))
+		return True
+
+
+	def GetFiles(self) -> list[str]:
+		"""# GET FILES
+		Returns the cached filenames (without extra entries)."""
+		self.Refresh()
+		return list(self.files)
+
+
+	def Search(self, p_query:str, p_limit:int = 25) -> list[str]:
+		"""# SEARCH
+		Returns up to `p_limit` entries matching the query, best first:
+		Label prefix, then word prefix, then substring, then by shared trigrams.
+		Queries shorter than a trigram only match by prefix.
+		"""
+		self.Refresh()
+		vQuery = p_query.lower().strip()
+
+		if vQuery == "":
+			return list(self.labels)[:p_limit]
+
+		vScores:dict[str, float] = {}
+		for index in range(bisect.bisect_left(self.prefixes, (vQuery,)), len(self.prefixes)):
+			vPrefix, entry = self.prefixes[index]
+			if not vPrefix.startswith(vQuery):
+				break
+			vScores[entry] = max(vScores.get(entry, 0), 4 if len(vPrefix) == len(self.labels[entry]) else 3)
+
+		# Substrings contain every trigram of the query, so only entries sharing trigrams are checked.
+		vQueryTrigrams = {vQuery[index:index+3] for index in range(len(vQuery) - 2)}
+		vTrigramCounts:dict[str, int] = {}
+		for trigram in vQueryTrigrams:
+			for entry in self.trigrams.get(trigram, ()):
+				vTrigramCounts[entry] = vTrigramCounts.get(entry, 0) + 1
+
+		for entry, count in vTrigramCounts.items():
+			if entry in vScores:
+				continue
+			if count == len(vQueryTrigrams) and vQuery in self.labels[entry]:
+				vScores[entry] = 2
+			else:
+				vScores[entry] = count / len(vQueryTrigrams)
+
+		# Require at least half the trigrams to match for fuzzy-only results.
+		vResults = [entry for entry, score in vScores.items() if score >= 0.5]
+		vResults.sort(key=lambda entry: (-vScores[entry], self.labels[entry]))
+		return vResults[:p_limit]
+
+
+	def GetChoices(self, p_query:str, p_limit:int = 25, bStripValue:bool = False) -> list[discord.app_commands.Choice]:
+		"""# GET CHOICES
+		Returns the search results as autocomplete choices, using the entry label as the name.
+		If `bStripValue`, the value is the label instead of the full entry."""
+		return [
+			discord.app_commands.Choice(name=self.GetLabel(entry), value=self.GetLabel(entry) if bStripValue else entry)
+			for entry in self.Search(p_query, p_limit)
+		]
+
+
+
 def GetGuildNF(p_botRef: commands.Bot) -> discord.Guild:
 	"""
 	# GET GUILD: No Fetch.
@@ -468,24 +758,34 @@ def SplitStrToSegments(p_string:str, p_limit:int = 1024, p_maxSegments: int = 0)
 	currentSegment = ""
 	for currentLine in strAsArray:
 
-		if len(currentSegment) + len(currentLine) > p_limit:
-			segments.append(f"{currentSegment}")
-
-			if len(segments) == p_maxSegments:
-				break
+		# Lines longer than the limit are split, so no segment exceeds it.
+		while len(currentLine) >= p_limit:
+			if currentSegment != "":
+				segments.append(currentSegment)
+				currentSegment = ""
+			segments.append(currentLine[:p_limit])
+			currentLine = currentLine[p_limit:]
 
+		if len(currentSegment) + len(currentLine) >= p_limit:
+			segments.append(f"{currentSegment}")
 			currentSegment = f"{currentLine}\n"
 
 		else:
 			currentSegment += f"{currentLine}\n"
-			
-	# Make sure to append the currently active segment, otherwise its omitted
-	segments.append(currentSegment)
 
-	if len(segments) == 0 and len(currentSegment) != 0:
-		return currentSegment
+		if p_maxSegments and len(segments) >= p_maxSegments:
+			break
 	else:
-		return segments
+		# Make sure to append the currently active segment, otherwise its omitted
+		segments.append(currentSegment)
+
+	# Discord rejects empty messages, so segments are trimmed and any left empty (eg, a lone newline) are dropped.
+	segments = [segment.lstrip("\n").rstrip() for segment in segments]
+	segments = [segment for segment in segments if segment != ""]
+
+	if p_maxSegments:
+		return segments[:p_maxSegments]
+	return segments
 	
 
 
@@ -596,6 +896,11 @@ def PrintSettings(bGetOnly = False):
 	vString += f"	> UserLib Dir:	{Directories.userLibrary}\n"
 	vString += f"	> RecruitsDir:	{Directories.userLibraryRecruits}\n"
 	vString += f"	> RuntimeDir :	{Directories.runtimeConfigurable}\n"
+	vString += f"	> Chat Links :	{Directories.chatLinksFile}\n"
+	vString += f"	> Sched. Jobs:	{Directories.scheduledJobsFile}\n"
+	vString += f"	> Cont. Hist.:	{Directories.continentHistoryFile}\n"
+	vString += f"	> Facilities :	{Directories.facilityMetadataFile}\n"
+	vString += f"	> Cmd. Hash  :	{Directories.commandHashFile}\n"
 	vString += f"	> LockFile Affix:	{Directories.lockFileAffix} | Retries: {Directories.lockFileRetry}\n"
 	vString += f"	> Feedback Prefix:	{Directories.feedbackPrefix}\n"
 	vString += f"	> Clean Temp Every:	{Directories.cleanTempEvery} hours ({Directories.cleanTempEvery/24} days)\n"
@@ -616,6 +921,10 @@ def PrintSettings(bGetOnly = False):
 
 	vString += "\nGENERAL BOT SETTINGS\n"
 	vString += f"	> [{BotSettings.bDebugEnabled}] Debug Enabled \n"
+	vString += f"	> [{BotSettings.bLogAsJSON}] Log as JSON | Subsystem levels: {BotSettings.logLevels}\n"
+	vString += f"	> [{BotSettings.bMetricsEnabled}] Metrics endpoint:	{BotSettings.metricsHost}:{BotSettings.metricsPort}\n"
+	vString += f"	> Profiling: max {BotSettings.profileMaxSeconds}s | sample interval {BotSettings.profileSampleInterval}s\n"
+	vString += f"	> Loop watchdog: every {BotSettings.loopLagInterval}s | lag threshold {BotSettings.loopLagThreshold}s | slow listener {BotSettings.slowListenerThreshold}s\n"
 	token = BotSettings.discordToken[:5] # Always hide most of the token; shows JUST the first 5 characters.
 	vString += f"	> DiscordToken:	{token}...\n"
 	vString += f"	> DiscordGuild:	{BotSettings.discordGuild}\n"
@@ -629,6 +938,7 @@ def PrintSettings(bGetOnly = False):
 	else:
 		vString += f"	> Error Output:	{BotSettings.errorOutput}\n"
 	vString += f"	> [{BotSettings.bCheckValues}] Sanity Check Values\n"
+	vString += f"	> [{BotSettings.bAlwaysSyncCommands}] Always Sync Commands\n"
 	vString += f"\n	> Force Role Restrictions: {BotSettings.bForceRoleRestrictions}\n"
 	vString += f"	> Level 0:	{Roles.roleRestrict_level_0}\n"
 	vString += f"	> Level 1:	{Roles.roleRestrict_level_1}\n"
@@ -654,6 +964,7 @@ def PrintSettings(bGetOnly = False):
 	vString += f"	> Rules:	{Channels.ruleID}\n"
 	vString += f"	> Gate:		{Channels.gateID}\n"
 	vString += f"	> Voice Fallback:{Channels.voiceFallback}\n"
+	vString += f"	> Chat Overwrite Batch Delay:	{Channels.chatOverwriteBatchDelay}s\n"
 	vString += f"	> Event Moveback:{Channels.eventMovebackID}\n"
 	vString += f"	> Protected Categories:\n		> {Channels.protectedCategoriesID}\n"
 	vString += f"	> Quotes:	{Channels.quoteID}\n"
@@ -683,14 +994,18 @@ def PrintSettings(bGetOnly = False):
 	vString += f"	> [{NewUsers.bPurgeGate}] Purge Gate\n"
 	vString += f"\n	> Warnings: Discord Account age: {NewUsers.newAccntWarn} months\n"
 	vString += f"	> Warnings: Outfit Rank (Ord): {NewUsers.outfitRankWarn}\n"
+	vString += f"	> Census: timeout {NewUsers.censusTimeout}s | character cache {NewUsers.characterCacheSeconds}s\n"
 
 
 
 	vString += "\nOP COMMANDER SETTINGS\n"
 	vString += f"	> [{Commander.bAutoStartEnabled}] Auto Start\n"
 	vString += f"	> Auto prestart:	{Commander.autoPrestart} minutes\n"
+	vString += f"	> Job misfire grace:	{Commander.jobMisfireGrace} seconds\n"
 	vString += f"	> [{Commander.bTrackingIsEnabled}] Tracking Enabled\n"
 	vString += f"	> Tracking Interval:	{Commander.dataPointInterval} seconds\n"
+	vString += f"	> Graph Workers:	{Commander.graphWorkers} | Per-metric graphs: {Commander.debriefGraphMetrics}\n"
+	vString += f"	> Feedback Export:	{Commander.feedbackExportFormat} | [{Commander.bCompressFeedback}] Compressed\n"
 	vString += f"	> Marked Present:	{Commander.markedPresent.name}\n"
 	vString += f"	> [{Commander.bAutoAlertsEnabled}] Auto Alerts\n"
 	vString += f"	> Auto Alert count:	{Commander.autoAlertCount}\n"
@@ -702,23 +1017,31 @@ def PrintSettings(bGetOnly = False):
 	vString += "\nCONTINENT TRACKER SETTINGS\n"
 	vString += f"	> [{BotSettings.botFeatures.continentTracker}] Enabled\n"
 	if BotSettings.botFeatures.continentTracker:
-		vString += f"	> [{ContinentTrack.bSaveOnShutdown}] Save on Shutdown\n"
-		vString += f"	> World ID: {ContinentTrack.worldID}\n"
-		vString += f"	> ContinentTracker Reconnection time: {ContinentTrack.reconnectionTime}\n"
+		vString += f"	> [{ContinentTrack.bSaveHistory}] Save History (Max results: {ContinentTrack.historyMaxResults})\n"
+		for world in ContinentTrack.trackedWorlds:
+			vString += f"	> World: {world.name} ({world.worldID}) | Continent Channel: {world.continentChannelID} | Facility Channel: {world.facilityChannelID}\n"
+		vString += f"	> Heartbeat timeout: {ContinentTrack.heartbeatTimeout}s (checked every {ContinentTrack.livenessCheckInterval}s)\n"
+		vString += f"	> Reconnect backoff: {ContinentTrack.reconnectBackoffMin}s - {ContinentTrack.reconnectBackoffMax}s\n"
+		vString += f"	> Event dedup window: {ContinentTrack.eventDedupWindow}s\n"
 		vString += f"	> Message type on LOCK events: {ContinentTrack.contLockMessageType.name}\n"
 		vString += f"	> Message type on OPEN events: {ContinentTrack.contUnlockMessageType.name}\n"
 		vString += f"	> Anti-Spam: Allowed posts: {ContinentTrack.antiSpamAllowedPosts}\n"
-		vString += f"	> Anti-Spam: Minimal interval time: {ContinentTrack.antiSpamMinimalTime}\n"
+		vString += f"	> Anti-Spam: Period: {ContinentTrack.antiSpamPeriod}s\n"
+		vString += f"	> [{ContinentTrack.bAntiSpamDigest}] Anti-Spam: Digest limited updates\n"
 		vString += f"	> [{ContinentTrack.bAlertCommanders}] Alert Commanders\n"
 		vString += f"	> [{ContinentTrack.bMonitorFacilities}] Monitor Facility Captures\n"
 		if ContinentTrack.bMonitorFacilities:
-			vString += f"	> Outfit to monitor: {ContinentTrack.facilityMonitorOutfitID}\n"
+			vString += f"	> Outfits to monitor: {ContinentTrack.facilityMonitorOutfitIDs}\n"
+			vString += f"	> Capture digest: {ContinentTrack.facilityDigestWindow}s window | {ContinentTrack.facilityDigestDelay}s batch delay\n"
+			vString += f"	> Facility metadata max age: {ContinentTrack.facilityMetadataMaxAge} days\n"
 
 
 	vString += "\nSIGN UP SETTINGS\n"
 	vString += f"	> [{SignUps.bAutoParseSchedule}] Parse Schedule\n"
 	vString += f"	> Parse Schedule timeout: {SignUps.autoParseTimeout}\n"
+	vString += f"	> Parse Schedule min confidence: {SignUps.autoParseMinConfidence}\n"
 	vString += f"	> [{SignUps.bAutoRemoveOutdated}] Autoremove Outdated\n"
+	vString += f"	> Refresh Concurrency: {SignUps.refreshConcurrency}\n"
 	vString += f"	> Signup Cat  : {SignUps.signupCategory}\n"
 	vString += f"	> Resign Icon : {SignUps.resignIcon}\n" 
 	vString += f"	> Reserve Icon: {SignUps.reserveIcon}\n"
@@ -746,6 +1069,7 @@ def PrintSettings(bGetOnly = False):
 	vString += f"	> Library Data Memory Retention: {UserLib.entryRetention.name}\n"
 	if UserLib.entryRetention == EntryRetention.unloadAfter:
 		vString += f"		> Unload After: {UserLib.entryRetention_unloadAfter} | Check Interval {UserLib.entryRetention_checkInterval}\n"
+	vString += f"	> Entry Creation Batch Size: {UserLib.entryCreationBatchSize}\n"
 	vString += f"	> [{UserLib.sleeperRules.bIsEnabled}] Inactivity Check\n"
 	if UserLib.sleeperRules.bIsEnabled:
 		vString += f"	> {UserLib.sleeperRules}" # __repr__ return has a new line at the end.
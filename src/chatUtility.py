@@ -1,10 +1,18 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
+import asyncio
+import os
+import pickle
 import botUtils
-from botUtils import BotPrinter as BUPrint
+from botUtils import BotPrinter
 from botUtils import ChannelPermOverwrites
 import botData.settings as Settings
+from voiceRouter import VoiceRouter
+from loopWatchdog import LoopWatchdog
+
+BUPrint = BotPrinter.GetLogger("chatUtility")
+
 
 class ChatUtilityCog(commands.GroupCog, name="chatutils", description="Handles voice & text channel linking; and provides utility commands"):
 	"""
@@ -15,6 +23,9 @@ class ChatUtilityCog(commands.GroupCog, name="chatutils", description="Handles v
 	def __init__(self, p_botRef):
 		self.botRef:commands.Bot = p_botRef
 		self.adminLevel = Settings.CommandLimit.chatUtilities
+		self.pendingOverwrites:dict[int, dict[discord.Member, bool]] = {} # Text channel ID : {Member : bCanView}
+		self.overwriteTasks:dict[int, asyncio.Task] = {} # Text channel ID : pending ApplyOverwrites task.
+		VoiceRouter.chatHandler = self.VoiceStateChanged
 		BUPrint.Info("COG: Chat Monitor loaded!")
 
 
@@ -114,99 +125,200 @@ class ChatUtilityCog(commands.GroupCog, name="chatutils", description="Handles v
 
 
 
-	@commands.Cog.listener("on_voice_state_update")
+	@commands.Cog.listener("on_ready")
+	async def RebuildChannelLinks(self):
+		"""
+		# REBUILD CHANNEL LINKS: Listener
+		Rebuilds the voice -> text channel links from the saved file, discarding links whose channels no longer exist.
+		Unsaved `-chat` channels are matched to their voice channel by name & category once here, instead of on each event.
+		Linked text channels for voice channels which emptied while the bot was offline are removed.
+		"""
+		vGuild = await botUtils.GetGuild(self.botRef)
+		VoiceRouter.linkedTextChannels.clear()
+
+		for voiceID, textID in self.LoadChannelLinks().items():
+			vVoiceChn = vGuild.get_channel(voiceID)
+			vTextChn = vGuild.get_channel(textID)
+			if vVoiceChn != None and vTextChn != None:
+				VoiceRouter.LinkTextChannel(vVoiceChn, vTextChn)
+
+		vLinkedTextIDs = [textChn.id for textChn in VoiceRouter.linkedTextChannels.values()]
+		vUnlinkedChats = {
+			(textChn.category_id, textChn.name): textChn
+			for textChn in vGuild.text_channels
+			if textChn.name.endswith("-chat") and textChn.id not in vLinkedTextIDs
+		}
+		for voiceChn in vGuild.voice_channels:
+			if voiceChn.id in VoiceRouter.linkedTextChannels:
+				continue
+			vTextChn = vUnlinkedChats.get( (voiceChn.category_id, self.GetTextChannelName(voiceChn)) )
+			if vTextChn != None:
+				VoiceRouter.LinkTextChannel(voiceChn, vTextChn)
+
+		for voiceID, textChn in list(VoiceRouter.linkedTextChannels.items()):
+			if len(vGuild.get_channel(voiceID).members) == 0:
+				VoiceRouter.UnlinkTextChannel(voiceID)
+				try:
+					await textChn.delete(reason="Linked voice channel emptied while bot was offline.")
+				except (discord.Forbidden, discord.NotFound, discord.HTTPException):
+					BUPrint.Debug(f"Unable to remove stale linked channel: {textChn.name}")
+
+		self.SaveChannelLinks()
+		BUPrint.Info(f"Chat Utility: {len(VoiceRouter.linkedTextChannels)} voice-linked text channels found.")
+
+
+
+	@LoopWatchdog.TimedListener("ChatUtility.VoiceStateChanged")
 	async def VoiceStateChanged(self, p_member:discord.Member, p_before:discord.VoiceState, p_after:discord.VoiceState):
 		"""
-		# VOICE STATE CHANGED: Listener
+		# VOICE STATE CHANGED
+		Called by the `VoiceRouter` when a member joins, leaves or swaps voice channels.
 		Handles creation & deletion of channels relating to voice chats.
 		"""
-		# First check if user is joining or leaving
-		bUserJoined = bool( p_before.channel == None)
-		bUserSwappedChannels:bool = False
-		
-		if not bUserJoined and p_before.channel != None and p_after.channel != None:
-			bUserSwappedChannels = bool( p_before.channel != p_after.channel )
+		if p_after.channel != None:
+			await self.UserJoinedChannel(p_member, p_after.channel)
 
-			if not bUserSwappedChannels:
-				BUPrint.Debug("User just updated mute settings, ignoring...")
-				return
+		if p_before.channel != None:
+			await self.UserLeftChannel(p_member, p_before.channel)
 
-		vGuild = await botUtils.GetGuild(self.botRef)
-		vTextChn:discord.TextChannel = None
-		vVoiceChn:discord.VoiceChannel = None
 
-		# Get channel name
-		if bUserJoined or bUserSwappedChannels:
-			vVoiceChn = p_after.channel
-		else:
-			vVoiceChn = p_before.channel
 
-		# Find existing channel
-		vTextChn = self.GetTextChannel(vGuild, vVoiceChn)
-		
-		# First user to join?
-		if (bUserJoined or bUserSwappedChannels) and vTextChn == None:
-			try:
-				vTextChn = await vGuild.create_text_channel(
-					name=f"{vVoiceChn.name}-chat",
-					category=vVoiceChn.category,
-					overwrites=ChannelPermOverwrites.invisible
-				)
-				await vTextChn.set_permissions(p_member, read_messages=True, send_messages=True)
-
-
-			except discord.errors.Forbidden as error:
-				BUPrint.LogErrorExc("Invalid permissions to create channel!", error)
-				return
-			except discord.errors.HTTPException as error:
-				BUPrint.LogErrorExc("Unable to create channel", error)
-				return
-
-		elif bUserJoined or bUserSwappedChannels:
-			await vTextChn.set_permissions(p_member, read_messages=True,send_messages=True)
-
-		# Apply userLeft to old channel.
-		if bUserSwappedChannels:
-			await self.UserLeftChannel(vGuild, p_member, p_before.channel)
+	async def UserJoinedChannel(self, p_member:discord.Member, p_channel:discord.VoiceChannel):
+		"""
+		# USER JOINED CHANNEL
+		Creates the linked text channel if the user is first to join, with their overwrite applied on creation.
+		Otherwise, queues their overwrite.
+		"""
+		vTextChn = VoiceRouter.GetLinkedTextChannel(p_channel.id)
+
+		if vTextChn != None:
+			self.QueueOverwrite(vTextChn, p_member, True)
+			return
+
+		vOverwrites = dict(ChannelPermOverwrites.invisible)
+		vOverwrites[p_member] = discord.PermissionOverwrite(read_messages=True, send_messages=True)
+		try:
+			vTextChn = await p_channel.guild.create_text_channel(
+				name=self.GetTextChannelName(p_channel),
+				category=p_channel.category,
+				overwrites=vOverwrites
+			)
+
+		except discord.errors.Forbidden as error:
+			BUPrint.LogErrorExc("Invalid permissions to create channel!", error)
+			return
+		except discord.errors.HTTPException as error:
+			BUPrint.LogErrorExc("Unable to create channel", error)
+			return
+
+		VoiceRouter.LinkTextChannel(p_channel, vTextChn)
+		self.SaveChannelLinks()
+
+
+
+	async def UserLeftChannel(self, p_member:discord.Member, p_channel:discord.VoiceChannel):
+		"""
+		# USER LEFT CHANNEL
+		Removes text channel If associated voice channel is empty.
+		If not empty, queues the members overwrite removal.
+		"""
+		vTextChn = VoiceRouter.GetLinkedTextChannel(p_channel.id)
+		if vTextChn == None:
 			return
-		elif not bUserSwappedChannels and bUserJoined:
+
+		if len(p_channel.members) != 0:
+			self.QueueOverwrite(vTextChn, p_member, False)
 			return
 
+		VoiceRouter.UnlinkTextChannel(p_channel.id)
+		self.SaveChannelLinks()
+
+		self.pendingOverwrites.pop(vTextChn.id, None)
+		vTask = self.overwriteTasks.pop(vTextChn.id, None)
+		if vTask != None:
+			vTask.cancel()
+
+		try:
+			await vTextChn.delete()
+		except discord.errors.NotFound:
+			BUPrint.Debug("Not found, presumably removed by Commander.")
+		except (discord.Forbidden, discord.HTTPException) as error:
+			BUPrint.LogErrorExc("Unable to remove linked text channel", error)
 
-	# If code reaches here, user has left:		
-		# Get channel, possibly redundant.
-		vVoiceChn = vGuild.get_channel(vVoiceChn.id)
-		await self.UserLeftChannel(vGuild, p_member, vVoiceChn)
 
 
-	
-	def GetTextChannel(self, p_guild:discord.Guild, p_voiceChn:discord.VoiceChannel):
+	def QueueOverwrite(self, p_textChannel:discord.TextChannel, p_member:discord.Member, p_bCanView:bool):
 		"""
-		# GET TEXT CHANNEL
-		Returns the discord.TextChannel with matching name.
+		# QUEUE OVERWRITE
+		Queues a member overwrite for the text channel.  
+		Queued overwrites are applied together after `chatOverwriteBatchDelay`.
 		"""
-		convertedChanName = p_voiceChn.name.lower().replace(" ", "-")
-		for textChan in p_guild.text_channels:
-			if textChan.name.lower() == f"{convertedChanName}-chat":
-				if textChan.category == p_voiceChn.category:
-					return textChan
+		self.pendingOverwrites.setdefault(p_textChannel.id, {})[p_member] = p_bCanView
+
+		if p_textChannel.id not in self.overwriteTasks:
+			self.overwriteTasks[p_textChannel.id] = asyncio.create_task( self.ApplyOverwrites(p_textChannel) )
 
 
-	async def UserLeftChannel(self, p_guild:discord.Guild, p_member:discord.Member, p_channel:discord.VoiceChannel):
+
+	async def ApplyOverwrites(self, p_textChannel:discord.TextChannel):
 		"""
-		# USER LEFT CHANNEL
-		Removes text channel If associated voice channel is empty.
-		If not empty, sets permissions.
+		# APPLY OVERWRITES
+		Applies all queued member overwrites to the text channel in a single edit.
 		"""
+		await asyncio.sleep(Settings.Channels.chatOverwriteBatchDelay)
+		self.overwriteTasks.pop(p_textChannel.id, None)
+		vPending = self.pendingOverwrites.pop(p_textChannel.id, {})
+		if len(vPending) == 0:
+			return
 
-		vTextChan = self.GetTextChannel(p_guild, p_channel)
+		vOverwrites = dict(p_textChannel.overwrites)
+		for member, bCanView in vPending.items():
+			vOverwrites[member] = discord.PermissionOverwrite(read_messages=bCanView, send_messages=bCanView)
 
-		if len(p_channel.members) == 0:
-			if vTextChan != None:
-				try:
-					await vTextChan.delete()
-				except discord.errors.NotFound:
-					BUPrint.Debug("Not found, presumably removed by Commander.")
+		try:
+			await p_textChannel.edit(overwrites=vOverwrites)
+			BUPrint.Debug(f"Applied {len(vPending)} overwrites to {p_textChannel.name}")
+		except discord.errors.NotFound:
+			BUPrint.Debug("Not found, presumably removed by Commander.")
+		except (discord.Forbidden, discord.HTTPException) as error:
+			BUPrint.LogErrorExc("Unable to apply overwrites to linked text channel", error)
 
-		else:
-			await vTextChan.set_permissions(p_member, read_messages=False, send_messages=False)
\ No newline at end of file
+
+
+	def GetTextChannelName(self, p_voiceChn:discord.VoiceChannel):
+		"""
+		# GET TEXT CHANNEL NAME
+		Returns the name of the linked text channel for the voice channel, as discord would store it.
+		"""
+		return f"{p_voiceChn.name.lower().replace(' ', '-')}-chat"
+
+
+
+	def SaveChannelLinks(self):
+		"""
+		# SAVE CHANNEL LINKS
+		Saves the voice -> text channel IDs to file.
+		"""
+		vLinks = {voiceID: textChn.id for voiceID, textChn in VoiceRouter.linkedTextChannels.items()}
+		try:
+			with open(Settings.Directories.chatLinksFile, "wb") as vFile:
+				pickle.dump(vLinks, vFile, Settings.BotSettings.pickleProtocol)
+		except (OSError, pickle.PickleError) as vError:
+			BUPrint.LogErrorExc("Unable to save chat links", vError)
+
+
+
+	def LoadChannelLinks(self) -> dict[int, int]:
+		"""
+		# LOAD CHANNEL LINKS
+		Returns the saved voice -> text channel IDs, or an empty dict if none are saved.
+		"""
+		if not os.path.exists(Settings.Directories.chatLinksFile):
+			return {}
+
+		try:
+			with open(Settings.Directories.chatLinksFile, "rb") as vFile:
+				return pickle.load(vFile)
+		except (OSError, pickle.UnpicklingError, EOFError) as vError:
+			BUPrint.LogErrorExc("Unable to load chat links", vError)
+			return {}
@@ -0,0 +1,183 @@
+"""
+CONTINENT HISTORY
+An append-only log of continent lock, unlock and facility events, stored in SQLite.
+
+Each event is committed as it happens, so the history (and the continent states derived from it) survive crashes.
+Current continent states are kept in a small table updated alongside the log, so they can be read without scanning it.
+"""
+
+import sqlite3
+from datetime import datetime, timezone
+
+from botData.dataObjects import ContinentEvent
+from botData.utilityData import PS2ContEventType
+from botUtils import BotPrinter
+
+BUPrint = BotPrinter.GetLogger("continentTracker.history")
+
+
+class ContinentHistory():
+	"""
+	# CONTINENT HISTORY
+	Writes to and queries the continent history log.
+
+	Times are stored as POSIX timestamps.
+	"""
+	schema = """
+		CREATE TABLE IF NOT EXISTS events (
+			id INTEGER PRIMARY KEY,
+			eventTime REAL NOT NULL,
+			eventType INTEGER NOT NULL,
+			worldID INTEGER NOT NULL,
+			zoneID INTEGER NOT NULL,
+			facilityID INTEGER,
+			outfitID INTEGER,
+			oldFactionID INTEGER,
+			newFactionID INTEGER
+		);
+		CREATE INDEX IF NOT EXISTS eventsByTime ON events (eventTime);
+		CREATE INDEX IF NOT EXISTS eventsByWorld ON events (worldID, eventType, eventTime);
+		CREATE INDEX IF NOT EXISTS eventsByOutfit ON events (outfitID, eventTime) WHERE outfitID IS NOT NULL;
+
+		CREATE TABLE IF NOT EXISTS zoneStates (
+			worldID INTEGER NOT NULL,
+			zoneID INTEGER NOT NULL,
+			bIsLocked INTEGER NOT NULL,
+			eventTime REAL NOT NULL,
+			PRIMARY KEY (worldID, zoneID)
+		);
+	"""
+
+	eventColumns = "eventType, worldID, zoneID, eventTime, facilityID, outfitID, oldFactionID, newFactionID"
+
+
+	def __init__(self, p_filePath:str) -> None:
+		self.connection = sqlite3.connect(p_filePath)
+		# WAL: Appends don't block reads, and committed events survive a crash.
+		self.connection.execute("PRAGMA journal_mode=WAL")
+		self.connection.execute("PRAGMA synchronous=NORMAL")
+		self.connection.executescript(ContinentHistory.schema)
+		BUPrint.Debug(f"Continent history opened: {p_filePath}")
+
+
+	def Close(self):
+		"""# CLOSE
+		Closes the connection to the log."""
+		self.connection.close()
+
+
+	def LogContinent(self, p_worldID:int, p_zoneID:int, p_isLocked:bool, p_eventTime:datetime):
+		"""# LOG CONTINENT
+		Appends a lock or unlock event, and updates the zones current state."""
+		vEventType = PS2ContEventType.Lock if p_isLocked else PS2ContEventType.Unlock
+		vTimestamp = p_eventTime.timestamp()
+
+		try:
+			with self.connection:
+				self.connection.execute(
+					"INSERT INTO events (eventTime, eventType, worldID, zoneID) VALUES (?, ?, ?, ?)",
+					(vTimestamp, vEventType.value, p_worldID, p_zoneID)
+				)
+				self.connection.execute(
+					"INSERT OR REPLACE INTO zoneStates (worldID, zoneID, bIsLocked, eventTime) VALUES (?, ?, ?, ?)",
+					(p_worldID, p_zoneID, int(p_isLocked), vTimestamp)
+				)
+		except sqlite3.Error as vError:
+			BUPrint.LogErrorExc("Unable to log continent event.", vError)
+
+
+	def LogFacility(self, p_worldID:int, p_zoneID:int, p_facilityID:int, p_outfitID:int, p_oldFactionID:int, p_newFactionID:int, p_eventTime:datetime):
+		"""# LOG FACILITY
+		Appends a facility control event."""
+		try:
+			with self.connection:
+				self.connection.execute(
+					"INSERT INTO events (eventTime, eventType, worldID, zoneID, facilityID, outfitID, oldFactionID, newFactionID) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+					(p_eventTime.timestamp(), PS2ContEventType.Facility.value, p_worldID, p_zoneID, p_facilityID, p_outfitID, p_oldFactionID, p_newFactionID)
+				)
+		except sqlite3.Error as vError:
+			BUPrint.LogErrorExc("Unable to log facility event.", vError)
+
+
+	def GetZoneStates(self, p_worldID:int) -> dict[int, tuple[bool, datetime]]:
+		"""# GET ZONE STATES
+		## RETURNS
+		Zone ID : (is locked, time of last change), for each zone of the world with a logged change.
+		"""
+		vRows = self.connection.execute(
+			"SELECT zoneID, bIsLocked, eventTime FROM zoneStates WHERE worldID = ?",
+			(p_worldID,)
+		).fetchall()
+
+		return {zoneID: (bool(bIsLocked), self.ToDatetime(eventTime)) for zoneID, bIsLocked, eventTime in vRows}
+
+
+	def GetOldestLock(self, p_worldID:int) -> tuple[int, datetime]|None:
+		"""# GET OLDEST LOCK
+		## RETURNS
+		(Zone ID, lock time) of the currently locked zone which has been locked longest, or `None` if no zones are locked.
+		"""
+		vRow = self.connection.execute(
+			"SELECT zoneID, eventTime FROM zoneStates WHERE worldID = ? AND bIsLocked = 1 ORDER BY eventTime LIMIT 1",
+			(p_worldID,)
+		).fetchone()
+
+		if vRow == None:
+			return None
+
+		return (vRow[0], self.ToDatetime(vRow[1]))
+
+
+	def GetRecentEvents(self, p_worldID:int, p_limit:int, p_eventTypes:list[PS2ContEventType] = None) -> list[ContinentEvent]:
+		"""# GET RECENT EVENTS
+		## PARAMETERS
+		- `p_worldID`: The world of the events.
+		- `p_limit`: The maximum number of events to return.
+		- `p_eventTypes`: Event types to include.  When `None`, lock and unlock events are returned.
+
+		## RETURNS
+		The most recent events, newest first.
+		"""
+		if p_eventTypes == None:
+			p_eventTypes = [PS2ContEventType.Lock, PS2ContEventType.Unlock]
+
+		vPlaceholders = ", ".join("?" * len(p_eventTypes))
+		vRows = self.connection.execute(
+			f"SELECT {ContinentHistory.eventColumns} FROM events WHERE worldID = ? AND eventType IN ({vPlaceholders}) ORDER BY eventTime DESC LIMIT ?",
+			(p_worldID, *[eventType.value for eventType in p_eventTypes], p_limit)
+		).fetchall()
+
+		return [self.ToEvent(row) for row in vRows]
+
+
+	def GetOutfitCaptures(self, p_outfitID:int, p_limit:int) -> list[ContinentEvent]:
+		"""# GET OUTFIT CAPTURES
+		## RETURNS
+		The most recent facility captures awarded to the outfit, newest first.
+		"""
+		vRows = self.connection.execute(
+			f"SELECT {ContinentHistory.eventColumns} FROM events WHERE outfitID = ? AND eventType = ? ORDER BY eventTime DESC LIMIT ?",
+			(p_outfitID, PS2ContEventType.Facility.value, p_limit)
+		).fetchall()
+
+		return [self.ToEvent(row) for row in vRows]
+
+
+	@staticmethod
+	def ToDatetime(p_timestamp:float) -> datetime:
+		return datetime.fromtimestamp(p_timestamp, timezone.utc)
+
+
+	@staticmethod
+	def ToEvent(p_row:tuple) -> ContinentEvent:
+		eventType, worldID, zoneID, eventTime, facilityID, outfitID, oldFactionID, newFactionID = p_row
+		return ContinentEvent(
+			eventType=PS2ContEventType(eventType),
+			worldID=worldID,
+			zoneID=zoneID,
+			eventTime=ContinentHistory.ToDatetime(eventTime),
+			facilityID=facilityID,
+			outfitID=outfitID,
+			oldFactionID=oldFactionID,
+			newFactionID=newFactionID
+		)
@@ -7,10 +7,14 @@ from dateutil import relativedelta
 
 from botData.settings import Channels, ForFun
 
-from botUtils import BotPrinter as BUPrint
+from botUtils import BotPrinter
+from loopWatchdog import LoopWatchdog
 
 from random import choice, shuffle
 
+BUPrint = BotPrinter.GetLogger("forFun")
+
+
 class ForFunCog(commands.Cog, name="for fun", description="Isolated fun elements not tied to other features."):
 	def __init__(self, p_botRef):
 		self.botRef:commands.Bot = p_botRef
@@ -31,6 +35,7 @@ class ForFunCog(commands.Cog, name="for fun", description="Isolated fun elements
 
 
 
+	@LoopWatchdog.TimedListener("SendMorningGreeting")
 	async def SendMorningGreeting(self, p_message:Message):
 		if p_message.author == self.botRef.user:
 			return
@@ -0,0 +1,142 @@
+"""
+LOOP WATCHDOG
+Measures event loop lag, and reports what was blocking the loop when it stalls.
+
+A heartbeat task on the loop measures how late it wakes each interval.
+A watcher thread checks the heartbeat; when it's overdue, the loop is blocked, so the loop thread's stack is captured and logged while it still shows the blocking code.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import sys
+import threading
+import time
+import traceback
+from typing import Callable
+
+from botData.settings import BotSettings
+from botMetrics import BotMetrics
+from botUtils import BotPrinter
+
+BUPrint = BotPrinter.GetLogger("watchdog")
+
+loopLag = BotMetrics.Histogram("event_loop_lag_seconds", "How late the event loop ran the watchdog heartbeat.", p_buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5))
+loopStalls = BotMetrics.Counter("event_loop_stalls", "Times the event loop was blocked for longer than the lag threshold.")
+listenerDurations = BotMetrics.Histogram("listener_seconds", "Duration of timed event listeners.", ("listener",))
+slowListeners = BotMetrics.Counter("slow_listeners", "Listener calls slower than the slow listener threshold.", ("listener",))
+
+
+class LoopWatchdog():
+	"""
+	# LOOP WATCHDOG
+	Started on setup, and stopped on shutdown.
+	"""
+	heartbeatTask: asyncio.Task = None
+	watcherThread: threading.Thread = None
+	stopEvent = threading.Event()
+
+	loop: asyncio.AbstractEventLoop = None
+	loopThreadID = 0
+	lastBeat = 0.0
+	"""Monotonic time of the last heartbeat."""
+
+
+	def Start():
+		"""# START
+		Starts the heartbeat & watcher.  Must be called from the event loop."""
+		if LoopWatchdog.heartbeatTask != None:
+			return
+
+		LoopWatchdog.loop = asyncio.get_running_loop()
+		LoopWatchdog.loopThreadID = threading.get_ident()
+		LoopWatchdog.lastBeat = time.monotonic()
+		LoopWatchdog.stopEvent.clear()
+
+		LoopWatchdog.heartbeatTask = LoopWatchdog.loop.create_task(LoopWatchdog.Heartbeat())
+		LoopWatchdog.watcherThread = threading.Thread(target=LoopWatchdog.Watch, name="LoopWatchdog", daemon=True)
+		LoopWatchdog.watcherThread.start()
+
+
+	def Stop():
+		"""# STOP
+		Stops the heartbeat & watcher."""
+		LoopWatchdog.stopEvent.set()
+
+		if LoopWatchdog.heartbeatTask != None:
+			LoopWatchdog.heartbeatTask.cancel()
+			LoopWatchdog.heartbeatTask = None
+
+		LoopWatchdog.watcherThread = None
+
+
+	async def Heartbeat():
+		"""# HEARTBEAT
+		Sleeps for the interval, recording how late it wakes."""
+		while True:
+			vExpected = time.monotonic() + BotSettings.loopLagInterval
+			await asyncio.sleep(BotSettings.loopLagInterval)
+
+			vNow = time.monotonic()
+			loopLag.Observe(max(vNow - vExpected, 0))
+			LoopWatchdog.lastBeat = vNow
+
+
+	def Watch():
+		"""# WATCH
+		Run in the watcher thread; logs the loop threads stack once per stall."""
+		vReportedBeat = 0.0
+
+		while not LoopWatchdog.stopEvent.wait(BotSettings.loopLagInterval / 2):
+			vLastBeat = LoopWatchdog.lastBeat
+			vOverdue = time.monotonic() - vLastBeat - BotSettings.loopLagInterval
+
+			if vOverdue < BotSettings.loopLagThreshold or vLastBeat == vReportedBeat:
+				continue
+
+			vReportedBeat = vLastBeat
+			loopStalls.Inc()
+
+			vFrame = sys._current_frames().get(LoopWatchdog.loopThreadID)
+			vStack = "".join(traceback.format_stack(vFrame, limit=12)) if vFrame != None else "Unavailable"
+
+			BUPrint.LogError(
+				p_titleStr="EVENT LOOP BLOCKED",
+				p_string=f"Loop blocked for over {vOverdue:.2f}s, in task: {LoopWatchdog.GetCurrentTaskName()}\n{vStack}"
+			)
+
+
+	def GetCurrentTaskName() -> str:
+		"""# GET CURRENT TASK NAME
+		Returns the name & coroutine of the task the loop is running; called from the watcher thread, so only reads the current task."""
+		try:
+			vTask = asyncio.tasks._current_tasks.get(LoopWatchdog.loop)
+		except AttributeError:
+			return "Unknown"
+
+		if vTask == None:
+			return "None (callback)"
+
+		return f"{vTask.get_name()} ({vTask.get_coro().__qualname__})"
+
+
+	def TimedListener(p_name:str) -> Callable:
+		"""# TIMED LISTENER
+		Decorator for listener coroutines; records their duration, and logs calls slower than the slow listener threshold."""
+		def Decorator(p_function:Callable):
+			@functools.wraps(p_function)
+			async def TimedCoroutine(*args, **kwargs):
+				vStart = time.perf_counter()
+				try:
+					return await p_function(*args, **kwargs)
+				finally:
+					vDuration = time.perf_counter() - vStart
+					listenerDurations.Observe(vDuration, (p_name,))
+
+					if vDuration > BotSettings.slowListenerThreshold:
+						slowListeners.Inc(1, (p_name,))
+						BUPrint.Info("Slow listener: %s took %.2fs", p_name, vDuration)
+
+			return TimedCoroutine
+
+		return Decorator
@@ -15,11 +15,6 @@ from botUtils import FilesAndFolders
 from botUtils import BotPrinter as BUPrint
 from botData.settings import BotSettings
 
-FilesAndFolders.SetupFolders()
-
-ps2Bot = Bot()
-mainLoop = asyncio.new_event_loop()
-
 
 def HandleTerminateSignal(p_signal: signal, p_frame):
 	"""# Handle Terminate Signal
@@ -30,26 +25,34 @@ def HandleTerminateSignal(p_signal: signal, p_frame):
 	BUPrint.Info("Terminate Signal detected!  Raising KeyboardInterrupt to cleanly terminate.")
 	raise(KeyboardInterrupt)
 
-# Set up signal for SIGTERM, so the bot may be shutdown cleanly if ran via service, or for other termination calls.
-signal(SIGTERM, HandleTerminateSignal)
 
+# Guarded, as the graph process pool's forkserver re-imports this module as `__mp_main__`.
+if __name__ == "__main__":
+	BUPrint.Setup()
+	FilesAndFolders.SetupFolders()
+
+	ps2Bot = Bot()
+	mainLoop = asyncio.new_event_loop()
 
-asyncio.set_event_loop(mainLoop)
-asyncio_atexit.register(callback=ps2Bot.ExitCalled, loop=mainLoop)
+	# Set up signal for SIGTERM, so the bot may be shutdown cleanly if ran via service, or for other termination calls.
+	signal(SIGTERM, HandleTerminateSignal)
 
+	asyncio.set_event_loop(mainLoop)
+	asyncio_atexit.register(callback=ps2Bot.ExitCalled, loop=mainLoop)
 
-try:
-	mainLoop.create_task(ps2Bot.start(BotSettings.discordToken))
-	mainLoop.create_task(ps2Bot.setupContTracker())
-	mainLoop.run_forever()
+	try:
+		mainLoop.create_task(ps2Bot.start(BotSettings.discordToken))
+		mainLoop.create_task(ps2Bot.setupContTracker())
+		mainLoop.run_forever()
 
-except KeyboardInterrupt:
-	BUPrint.Info("Keyboard interrupt detected.")
-	pass
+	except KeyboardInterrupt:
+		BUPrint.Info("Keyboard interrupt detected.")
+		pass
 
-finally:
-	mainLoop.close()
-	BUPrint.Info("Bot shutdown complete.\n\nThe below error (task was destroyed but is pending) is a known, and unfixed discordpy issue.\nIt does not prevent the bot from shutting down cleanly and is safe to ignore.\n\n")
+	finally:
+		mainLoop.close()
+		BUPrint.Info("Bot shutdown complete.\n\nThe below error (task was destroyed but is pending) is a known, and unfixed discordpy issue.\nIt does not prevent the bot from shutting down cleanly and is safe to ignore.\n\n")
+		BUPrint.Shutdown()
 
 
 
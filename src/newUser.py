@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import discord
 from discord.ext import commands
-import auraxium
 
+import asyncio
+import aiohttp
+import time
 import datetime, dateutil.relativedelta
 
 # import botData.settings
@@ -13,9 +15,109 @@ from botData.settings import CommandLimit, Channels, Roles, Messages, BotSetting
 from botUtils import BotPrinter, GetDiscordTime, UserHasCommandPerms, GetGuild
 from botData.utilityData import Colours, DateFormat
 
-from botData.dataObjects import User, NewUserData
+from botData.dataObjects import User, NewUserData, PS2CharacterInfo
 from userManager import UserLibrary, LibraryViewer
 from roleManager import RoleManager
+from botMetrics import censusRequests
+
+
+class CensusUnavailableError(Exception):
+	"""
+	# EXCEPTION: CENSUS UNAVAILABLE
+	Raised when a character lookup fails or times out.
+	"""
+	def __init__(self, p_reason:str):
+		super().__init__(f"Unable to look up character: {p_reason}")
+
+
+
+class CharacterLookup():
+	"""
+	# CHARACTER LOOKUP
+	Looks up the PS2 characters of joining users, through one shared census client.
+
+	Each lookup is a single query, joining the characters outfit membership.
+	Results (including names not found) are cached briefly, so repeated attempts at a name don't query the census again.
+	"""
+	client = None
+	"""Shared `auraxium.Client`; created on first use."""
+	cache: dict[str, tuple[float, PS2CharacterInfo|None]] = {}
+	"""Lowercase character name : (Expiry, from `time.monotonic`, result)."""
+
+
+	def GetClient():
+		"""# GET CLIENT
+		Returns the shared client, creating it if needed."""
+		if CharacterLookup.client == None:
+			# Imported here so auraxium is only loaded on first use.
+			import auraxium
+			CharacterLookup.client = auraxium.Client(service_id=BotSettings.ps2ServiceID)
+
+		return CharacterLookup.client
+
+
+	async def Close():
+		"""# CLOSE
+		Closes the shared client, if open."""
+		if CharacterLookup.client != None:
+			await CharacterLookup.client.close()
+			CharacterLookup.client = None
+
+
+	async def Find(p_name:str) -> PS2CharacterInfo|None:
+		"""# FIND
+		Looks up a character by name.
+
+		## RETURNS
+		The character, or `None` if no character has the name.
+
+		Raises `CensusUnavailableError` if the census fails or doesn't respond within `NewUsers.censusTimeout`.
+		"""
+		vName = p_name.strip().lower()
+		vNow = time.monotonic()
+
+		vCached = CharacterLookup.cache.get(vName)
+		if vCached != None and vCached[0] > vNow:
+			BotPrinter.Debug("	-> Using cached character lookup.")
+			return vCached[1]
+
+		from auraxium.census import Query
+		from auraxium.errors import AuraxiumException
+
+		vQuery = Query("character", service_id=BotSettings.ps2ServiceID).add_term("name.first_lower", vName)
+		vQuery.show("character_id", "name.first", "battle_rank.value")
+		vQuery.create_join("outfit_member_extended").set_fields("character_id").set_inject_at("outfit_member").show("name", "alias", "rank", "rank_ordinal", "member_since")
+
+		try:
+			with censusRequests.Time(("newUser",)):
+				vPayload = await asyncio.wait_for(CharacterLookup.GetClient().request(vQuery), NewUserSettings.censusTimeout)
+		except asyncio.TimeoutError:
+			raise CensusUnavailableError("timed out")
+		except (AuraxiumException, aiohttp.ClientError, OSError, RuntimeError) as vError:
+			raise CensusUnavailableError(str(vError))
+
+		vResult = None
+		vCharacters = vPayload.get("character_list", [])
+		if len(vCharacters):
+			vCharacter = vCharacters[0]
+			vMember = vCharacter.get("outfit_member", {})
+			vResult = PS2CharacterInfo(
+				charID=int(vCharacter["character_id"]),
+				name=vCharacter["name"]["first"],
+				battleRank=int(vCharacter.get("battle_rank", {}).get("value", 0)),
+				outfitName=vMember.get("name", ""),
+				outfitAlias=vMember.get("alias", ""),
+				outfitRank=vMember.get("rank", ""),
+				outfitRankOrdinal=int(vMember.get("rank_ordinal", -1)),
+				memberSince=int(vMember.get("member_since", 0))
+			)
+
+		# Drop expired entries, so names tried once aren't kept.
+		CharacterLookup.cache = {name: entry for name, entry in CharacterLookup.cache.items() if entry[0] > vNow}
+		CharacterLookup.cache[vName] = (vNow + NewUserSettings.characterCacheSeconds, vResult)
+
+		return vResult
+
 
 
 class NewUser(commands.Cog):
@@ -25,6 +127,11 @@ class NewUser(commands.Cog):
 		self.newReq:NewUserRequest = NewUserRequest(p_userData=None)
 		self.newReq.vBotRef = pBot
 
+	async def cog_unload(self) -> None:
+		await CharacterLookup.Close()
+		return await super().cog_unload()
+
+
 	def GetUserData(self, p_id: str):
 		"""
 		Returns the `NewUserData` with matching user ID.
@@ -318,34 +425,38 @@ class PS2NameModal(discord.ui.Modal, title="Enter your PS2 Character name"):
 		"""
 		Returns true if the provided IGN is a valid character.
 		Function also fills the data object with items.
+
+		If the census is unavailable, the name is accepted unverified; the join request warns of it.
 		"""
 		BotPrinter.Debug(f"Checking player name for {pUser.display_name}: {pIGN}")
 
-		async with auraxium.Client() as ps2Client:
-			ps2Client.service_id = BotSettings.ps2ServiceID
-			player: auraxium.ps2.Character = await ps2Client.get_by_name(auraxium.ps2.Character, f"{pIGN}")
-			if player is not None:
-				BotPrinter.Debug("	-> Found IGN!")
-				self.userData.ps2CharObj = player
-				self.userData.ps2CharName = pIGN
-				self.userData.ps2CharID = player.id
-				vOutfit: auraxium.ps2.Outfit = await player.outfit()
-				
-				if vOutfit is None:
-					BotPrinter.Debug("	-> Player is not part of any Outfit!")
-					return True
-
-				else: # USER IS PART OF OUTFIT
-					# Check outfit rank
-					outfitPlayer:auraxium.ps2.OutfitMember = await player.outfit_member()
-					self.userData.ps2OutfitName = vOutfit.name
-					self.userData.ps2OutfitAlias = vOutfit.alias
-					self.userData.ps2OutfitCharObj = outfitPlayer
-					return True
-
-			else: 
-				BotPrinter.Debug("User does not have a valid PS2 character name")
-				return False
+		try:
+			vCharacter = await CharacterLookup.Find(pIGN)
+		except CensusUnavailableError as vError:
+			BotPrinter.LogErrorExc("Census unavailable, accepting character name unverified.", vError)
+			self.userData.ps2Character = None
+			self.userData.ps2CharName = pIGN
+			self.userData.ps2OutfitName = ""
+			self.userData.ps2OutfitAlias = ""
+			self.userData.bPS2Unverified = True
+			return True
+
+		if vCharacter is None:
+			BotPrinter.Debug("User does not have a valid PS2 character name")
+			return False
+
+		BotPrinter.Debug("	-> Found IGN!")
+		self.userData.ps2Character = vCharacter
+		self.userData.ps2CharName = vCharacter.name
+		self.userData.ps2CharID = vCharacter.charID
+		self.userData.ps2OutfitName = vCharacter.outfitName
+		self.userData.ps2OutfitAlias = vCharacter.outfitAlias
+		self.userData.bPS2Unverified = False
+
+		if not vCharacter.bInOutfit:
+			BotPrinter.Debug("	-> Player is not part of any Outfit!")
+
+		return True
 
 
 
@@ -362,11 +473,13 @@ class NewUserRequest():
 		self.requestMessage: discord.Message # The admin request message.
 
 	
-	def GenerateReports(self):
+	def GenerateReports(self, p_bHasLibraryEntry:bool = False):
 		"""
 		# GENERATE REPORTS
 
 		Creates and returns a list of embeds detailing the user who requested to join.
+
+		`p_bHasLibraryEntry`: The user has a library entry (checked beforehand, as it reads from disk).
 		"""
 	# USER INFO EMBED
 		embed_userInfo = discord.Embed(colour=Colours.userRequest.value, title=f"JOIN REQUEST: {self.userData.userObj.display_name}", description=f"User joined the server: {GetDiscordTime( pDate=self.userData.userObj.joined_at, pFormat=DateFormat.Dynamic)}")
@@ -377,15 +490,16 @@ class NewUserRequest():
 		embed_userInfo.add_field(name="Creation Date:", value=f"{GetDiscordTime(self.userData.userObj.created_at, DateFormat.DateTimeLong)}", inline=False)
 
 	# PS2 EMBED
-		if self.userData.ps2CharObj != None:
+		vCharacter = self.userData.ps2Character
+		if vCharacter != None:
 			embed_ps2 = discord.Embed(color=Colours.userRequest.value, title=f"PS2 CHARACTER")
-			embed_ps2.add_field(name="Character Name", value=f"{self.userData.ps2CharObj.data.name}")
-			embed_ps2.add_field(name="BattleRank", value=f"{self.userData.ps2CharObj.data.battle_rank.value}", inline=True)
-		if( self.userData.ps2OutfitCharObj != None ):
-			embed_ps2.add_field(name="Outfit", value=f"{self.userData.ps2OutfitName}", inline=True)
-			embed_ps2.add_field(name="Rank", value=f"{self.userData.ps2OutfitCharObj.rank}", inline=True)
-			joinDate = datetime.datetime.fromtimestamp(self.userData.ps2OutfitCharObj.member_since)
-			embed_ps2.add_field(name="Member Since", value=f"{GetDiscordTime(joinDate,DateFormat.DateTimeShort)}", inline=True)
+			embed_ps2.add_field(name="Character Name", value=f"{vCharacter.name}")
+			embed_ps2.add_field(name="BattleRank", value=f"{vCharacter.battleRank}", inline=True)
+			if vCharacter.bInOutfit:
+				embed_ps2.add_field(name="Outfit", value=f"{vCharacter.outfitName}", inline=True)
+				embed_ps2.add_field(name="Rank", value=f"{vCharacter.outfitRank}", inline=True)
+				joinDate = datetime.datetime.fromtimestamp(vCharacter.memberSince)
+				embed_ps2.add_field(name="Member Since", value=f"{GetDiscordTime(joinDate,DateFormat.DateTimeShort)}", inline=True)
 
 	# WARNINGS EMBED
 		embed_warnings = discord.Embed(colour=Colours.userWarnOkay.value, title="WARNINGS & CHECKS", description="Detailed warning checks are listed below.\n\n")
@@ -408,21 +522,24 @@ class NewUserRequest():
 			strOkay += f"> Discord Account is over {NewUserSettings.newAccntWarn} months old.\n\n"
 
 		# PS2 Invalid Char Name
-		if self.userData.ps2CharObj == None:
+		if self.userData.bPS2Unverified:
+			embed_warnings._colour = Colours.userWarning.value
+			strWarnings += f"PS2 CHARACTER NOT VERIFIED:\n> The census was unavailable; the character name *({self.userData.ps2CharName})* has not been checked.\n\n"
+		elif vCharacter == None:
 			embed_warnings._colour = Colours.userWarning.value
 			strWarnings += "NO VALID PS2 CHARACTER:\n> User has not provided a valid ps2 character\n\n"
 		else:
 			strOkay += "- Valid PS2 character provided\n\n"
 
 		# IMPERSONATION WARNING
-		if self.userData.ps2OutfitCharObj != None and self.userData.ps2OutfitCharObj.rank_ordinal < NewUserSettings.outfitRankWarn:
+		if vCharacter != None and vCharacter.bInOutfit and vCharacter.outfitRankOrdinal < NewUserSettings.outfitRankWarn:
 			embed_warnings._colour = Colours.userWarning.value
-			strWarnings += f"HIGH RANK USER:\n> Claiming a character with a high *({self.userData.ps2OutfitCharObj.rank_ordinal})* Outfit *({self.userData.ps2OutfitName})* Rank *({self.userData.ps2OutfitCharObj.rank})!*"
-		elif self.userData.ps2CharObj != None:
+			strWarnings += f"HIGH RANK USER:\n> Claiming a character with a high *({vCharacter.outfitRankOrdinal})* Outfit *({vCharacter.outfitName})* Rank *({vCharacter.outfitRank})!*"
+		elif vCharacter != None:
 			strOkay += "- Users claimed character is not a high ranking outfit member.\n"
 
 
-		if UserLibrary.HasEntry(self.userData.userObj.id):
+		if p_bHasLibraryEntry:
 			strOkay += "- User has been in the server previously.\n"
 
 		if strOkay == "":
@@ -434,13 +551,13 @@ class NewUserRequest():
 		embed_warnings.add_field(name="✅ CHECKS", value=strOkay, inline=False)
 
 		# RECRUIT SUGGESTION
-		if self.userData.ps2OutfitCharObj != None and self.userData.ps2OutfitAlias == "TDKD" and self.userData.ps2OutfitCharObj.rank == "Recruit":
+		if vCharacter != None and vCharacter.outfitAlias == "TDKD" and vCharacter.outfitRank == "Recruit":
 			embed_warnings.add_field(name="🆕 TDKD RECRUIT", value="This users ps2 character is a TDKD recruit.", inline=False)
 
 		vreturnList: list = []
 		vreturnList.append(embed_userInfo)
 
-		if self.userData.ps2CharObj != None:
+		if vCharacter != None:
 			vreturnList.append(embed_ps2)
 
 		vreturnList.append(embed_warnings)
@@ -464,7 +581,8 @@ class NewUserRequest():
 		vView.add_item(btn_reject)
 		vView.add_item(btn_ban)
 
-		self.requestMessage = await self.vRequestChannel.send(view=vView, embeds=self.GenerateReports())
+		bHasLibraryEntry = await asyncio.to_thread(UserLibrary.HasEntry, self.userData.userObj.id)
+		self.requestMessage = await self.vRequestChannel.send(view=vView, embeds=self.GenerateReports(bHasLibraryEntry))
 		BotPrinter.Debug("	-> New User Join Request sent!")
 
 
@@ -556,7 +674,7 @@ class NewUserRequest_btnAssignRole(discord.ui.Select):
 		if self.userData.ps2CharName != None:
 			vNewNick = ""
 			# Prepend any outfit tag if any and NOT TDKD
-			if self.userData.ps2OutfitCharObj != None and self.userData.ps2OutfitAlias != "TDKD":
+			if self.userData.ps2OutfitAlias != "" and self.userData.ps2OutfitAlias != "TDKD":
 				vNewNick += f"[{self.userData.ps2OutfitAlias}] "
 			vNewNick += f"{self.userData.ps2CharName}"
 
@@ -564,7 +682,7 @@ class NewUserRequest_btnAssignRole(discord.ui.Select):
 
 		# Cleanup Join Request Channel
 		vConfirmName: str = ""
-		if self.userData.ps2CharObj != None:
+		if self.userData.ps2CharName != "":
 			vConfirmName = self.userData.ps2CharName
 		else:
 			vConfirmName = self.userData.userObj.display_name
@@ -584,9 +702,9 @@ class NewUserRequest_btnAssignRole(discord.ui.Select):
 			if self.userData.ps2OutfitName != "":
 				vUserLibEntry.ps2Outfit = f"{self.userData.ps2OutfitName} {self.userData.ps2OutfitAlias}"
 
-			if self.userData.ps2OutfitCharObj != None:
-				vUserLibEntry.ps2OutfitRank = self.userData.ps2OutfitCharObj.rank
-				vUserLibEntry.ps2OutfitJoinDate = datetime.datetime.fromtimestamp(self.userData.ps2OutfitCharObj.member_since, datetime.timezone.utc)
+			if self.userData.ps2Character != None and self.userData.ps2Character.bInOutfit:
+				vUserLibEntry.ps2OutfitRank = self.userData.ps2Character.outfitRank
+				vUserLibEntry.ps2OutfitJoinDate = datetime.datetime.fromtimestamp(self.userData.ps2Character.memberSince, datetime.timezone.utc)
 
 			vUserLibEntry.bIsRecruit = self.userData.bIsRecruit
 
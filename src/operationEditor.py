@@ -17,9 +17,11 @@ from discord.ui import View, Button, Select
 from discord import Interaction, Message, ButtonStyle, SelectOption, Embed, NotFound
 from enum import Enum
 
-from botUtils import BotPrinter as BUPrint
+from botUtils import BotPrinter
 import copy
 
+BUPrint = BotPrinter.GetLogger("operations.editor")
+
 
 class OpEditor():
 	"""# Op Editor
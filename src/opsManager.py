@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os, copy
+import asyncio
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
@@ -12,28 +13,35 @@ import pickle
 import discord
 from discord.ext import commands
 from discord import app_commands
-import apscheduler.jobstores.base
 
 from botData.settings import Messages as botMessages
 from botData import settings as botSettings
 import botData.settings
 # import botData.operations as OpData
-from botData.dataObjects import OperationData, OpRoleData, OpsStatus, SchedulerOpInfo
+from botData.dataObjects import OperationData, OpRoleData, OpsStatus, SchedulerOpInfo, OpsRefreshReport
 from botData.utilityData import Colours, DateFormat
 
 import OpCommander.commander
 import OpCommander.autoCommander
+from botScheduler import BotScheduler
 
 import botUtils
 from botUtils import GetPOSIXTime, GetDiscordTime, EllipseStringToSize, EllipsiseStringArrayToSize
-from botUtils import BotPrinter as BUPrint
+from botUtils import BotPrinter
 
 import operationEditor
 
 from botModals.opsManagerModals import *
 import re
+from difflib import get_close_matches, SequenceMatcher
 
 import random
+from botMetrics import BotMetrics
+from loopWatchdog import LoopWatchdog
+
+BUPrint = BotPrinter.GetLogger("operations")
+
+opsMessageUpdates = BotMetrics.Histogram("ops_update_message_seconds", "Duration of operation message updates, including Discord requests.")
 
 
 class Operations(commands.GroupCog):
@@ -121,7 +129,7 @@ class Operations(commands.GroupCog):
 		vOpManager = OperationManager()
 		newOpsData.date = vDate
 
-		if vOpTypeStr not in botUtils.FilesAndFolders.GetFiles(botSettings.Directories.savedDefaultsDir, ".bin"):
+		if vOpTypeStr not in OperationManager.defaultsCatalogue.GetFiles():
 			# USER IS USING A NON-DEFAULT/CUSTOM
 			newOpsData.status = OpsStatus.editing
 
@@ -178,18 +186,8 @@ class Operations(commands.GroupCog):
 
 	@addopsevent.autocomplete('optype')
 	async def autocompleteOpTypes(self, pInteraction: discord.Interaction, pTypedStr: str):
-		choices: list = []
-		vDataFiles: list = ["Custom"]
-
-		vDataFiles = OperationManager.GetDefaultOpsAsList()
-
-		option: str
-		for option in vDataFiles:
-			if(pTypedStr.lower() in option.lower()):
-				# Add options matching current typed response to a list.
-				# Allows bypassing discords max 25 item limit on dropdown lists.
-				choices.append(discord.app_commands.Choice(name=option.replace(".bin", ""), value=option))
-		return choices
+		# Ranked & limited to discords max 25 item limit on dropdown lists.
+		return OperationManager.defaultsCatalogue.GetChoices(pTypedStr)
 
 
 
@@ -229,6 +227,7 @@ class Operations(commands.GroupCog):
 
 		else:
 			botUtils.FilesAndFolders.DeleteCorruptFile( botUtils.FilesAndFolders.GetOpFullPath(pOpsToEdit) )
+			OperationManager.RefreshCatalogue(False)
 			OperationManager.vLiveOps.remove(vLiveOpData)
 			await pInteraction.response.send_message("The operation you wished to edit was corrupt and has been removed.", ephemeral=True)
 			return
@@ -236,16 +235,8 @@ class Operations(commands.GroupCog):
 
 	@editopsevent.autocomplete("pOpsToEdit")
 	async def autocompleteFileList(self, pInteraction: discord.Interaction, pTypedStr: str):
-		choices: list = []
-		vDataFiles: list = OperationManager.GetOps()
-
-		option: str
-		for option in vDataFiles:
-			if(pTypedStr.lower() in option.lower()):
-				# Add options matching current typed response to a list.
-				# Allows bypassing discords max 25 item limit on dropdown lists.
-				choices.append(discord.app_commands.Choice(name=option.replace(".bin", ""), value=option.replace(".bin", "")))
-		return choices
+		# Ranked & limited to discords max 25 item limit on dropdown lists.
+		return OperationManager.liveOpsCatalogue.GetChoices(pTypedStr, bStripValue=True)
 
 
 
@@ -293,6 +284,7 @@ class Operations(commands.GroupCog):
 
 
 
+	@LoopWatchdog.TimedListener("CheckSchedule")
 	async def CheckSchedule(self, p_message:discord.Message):
 		if p_message.channel.id == botSettings.Channels.scheduleID:
 			if p_message.content.__len__() < 100:
@@ -324,7 +316,7 @@ class Operations(commands.GroupCog):
 				postableOpDatas.append(newOpData)
 				eventButtons.append( Btn_AutoPostEvent(newOpData) )
 
-				vMessage += f"Found: **{postableOp.eventName}**. Closest matching default: **{postableOp.matchingOp}**, with date: **{GetDiscordTime(postableOp.date, DateFormat.DateTimeShort)}**\n"
+				vMessage += f"Found: **{postableOp.eventName}**. Closest matching default: **{postableOp.matchingOp}** ({postableOp.confidence:.0%}), with date: **{GetDiscordTime(postableOp.date, DateFormat.DateTimeShort)}**\n"
 
 			if postableOpDatas.__len__() > 0:
 
@@ -394,121 +386,138 @@ class Btn_AutoPostAll(discord.ui.Button):
 
 
 class Parser():
-	def ParseSchedule(p_schedule:str) -> list[SchedulerOpInfo]:
-		"""# PARSE SCHEDULE:
-		The function to call to parse a schedule.
+	"""
+	# PARSER
+	Parses a posted schedule into `SchedulerOpInfo` objects.
 
-		## RETURNS
-		`list[OpInfo]`: A list of OpInfos for each day.
-		Op Info: A miniture dataclass of minimal data used to construct new events.
-		"""
-		dateSections = Parser.GetSections(p_schedule)
+	Default op names are held in an inverted word index, rebuilt only when the defaults directory changes.
+	The schedule itself is tokenised in a single pass of `scheduleGrammar`.
+	"""
+	scheduleGrammar = re.compile(
+		r"^[^\w\n•]*(?P<day>monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b"
+		r"|•[^\S\n]*(?P<event>[^\n<@]*)"
+		r"|<t:(?P<timestamp>\d+)(?::\w)?>"
+		r"|<@!?(?P<userID>\d+)>"
+		r"|@(?P<userName>[^\s<>]+)",
+		re.MULTILINE | re.IGNORECASE
+	)
+	wordPattern = re.compile(r"[^\W\d_]+")
 
-		dayOpInfos = []
-		for dayInfo in dateSections:
-			dayOpInfos += Parser.ParseDay(dayInfo)
-			# dayOpInfos.append(Parser.ParseDay(dateSections[len(dayOpInfos)]))
-		BUPrint.Debug(f"\n\nFinal Infos: \n{dayOpInfos}")
-		return dayOpInfos
+	defaultIndex: dict[str, set[str]] = {} # Word : Default op filenames containing it.
+	defaultWordCounts: dict[str, int] = {} # Default op filename : number of words in name.
+	defaultsVersion: int = -1 # Version of the defaults catalogue when the index was built.
 
 
+	def RefreshDefaultIndex(bForce:bool = False):
+		"""# REFRESH DEFAULT INDEX:
+		Rebuilds the word index of default op names if the defaults catalogue has changed since it was last built.
+		"""
+		vDefaultOps = OperationManager.defaultsCatalogue.GetFiles()
 
-	def ParseDay(pSection:str) -> list[SchedulerOpInfo]:
-		if pSection.__len__() < 20:
-			return []
+		if not bForce and OperationManager.defaultsCatalogue.version == Parser.defaultsVersion:
+			return
 
-		sectionStr = pSection
-		defaultOpNames = OperationManager.GetDefaultOpsAsList()
-		subSectionPositions = [item for item, char in enumerate(pSection) if "•" == char]
+		Parser.defaultIndex = {}
+		Parser.defaultWordCounts = {}
+		for defaultOp in vDefaultOps:
+			# Short words are skipped, as they are when matching.
+			vWords = set( word for word in Parser.wordPattern.findall(defaultOp.replace(".bin", "").lower()) if len(word) > 3 )
+			Parser.defaultWordCounts[defaultOp] = len(vWords)
+			for word in vWords:
+				Parser.defaultIndex.setdefault(word, set()).add(defaultOp)
 
-		returnList = []
+		Parser.defaultsVersion = OperationManager.defaultsCatalogue.version
+		BUPrint.Debug(f"Schedule parser: indexed {len(Parser.defaultWordCounts)} default ops.")
 
-		BUPrint.Debug(f"SUBSECTION POSITIONS: {subSectionPositions}")
 
-		index = 1
-		for position in subSectionPositions:
-			if position != subSectionPositions[-1]:
-				sectionStr = pSection[position:subSectionPositions[index]]
-				index += 1
-			else:
-				sectionStr = pSection[position:]
 
-			BUPrint.Debug(f"Curent Iteration Position: {position}\nOperating on section:{sectionStr}\n\n")
+	def ParseSchedule(p_schedule:str) -> list[SchedulerOpInfo]:
+		"""# PARSE SCHEDULE:
+		The function to call to parse a schedule.
+		Day headings are optional; partial weeks are accepted.  
+		If any day heading is present, bullets before the first are ignored.
 
+		## RETURNS
+		`list[OpInfo]`: A list of OpInfos for each event.
+		Op Info: A miniture dataclass of minimal data used to construct new events.
+		"""
+		Parser.RefreshDefaultIndex()
 
-			dayOpInfo = SchedulerOpInfo()
-			for line in sectionStr.split("\n"):
-				if line.__contains__("• "):
-					eventName = line.replace("• ", "")
-					eventName = eventName.replace(":", "")
-					eventName = "".join(char.lower() for char in eventName if not char.isnumeric())
+		vTokens = list( Parser.scheduleGrammar.finditer(p_schedule) )
+		bInDay = not any(token.lastgroup == "day" for token in vTokens)
 
-					dayOpInfo.eventName = eventName.replace("<t>", "")
-					eventNameWords = [word.lower() for word in eventName.split() if word.__len__() > 3]
+		returnList:list[SchedulerOpInfo] = []
+		vOpInfo:SchedulerOpInfo = None
 
-					closestMatch:str = ""
-					highestMatchWordCount = 0
+		for token in vTokens:
+			if token.lastgroup == "day":
+				bInDay = True
+				vOpInfo = None
 
-					for defaultOpName in defaultOpNames:
-						defaultOpWords = [word.lower() for word in defaultOpName.split()]
-						matchingWords = [word.lower() for word in defaultOpWords if word in eventNameWords]
-						
-						if matchingWords.__len__() > highestMatchWordCount and highestMatchWordCount < defaultOpWords.__len__():
-							highestMatchWordCount = matchingWords.__len__()
-							closestMatch = defaultOpName
-						else:
-							continue
+			elif not bInDay:
+				continue
 
-					if highestMatchWordCount != 0:
-						dayOpInfo.matchingOp = closestMatch
+			elif token.lastgroup == "event":
+				vOpInfo = SchedulerOpInfo( eventName=token.group("event").replace(":", "").strip() )
+				vOpInfo.matchingOp, vOpInfo.confidence = Parser.MatchDefault(vOpInfo.eventName)
+				returnList.append(vOpInfo)
 
+			elif vOpInfo == None:
+				continue
 
-					timeInLine = "".join(char for char in line if char.isnumeric())
-					if timeInLine.isnumeric():
-						dayOpInfo.date = datetime.fromtimestamp(int(timeInLine), timezone.utc)
+			elif token.lastgroup == "timestamp" and vOpInfo.date == None:
+				vOpInfo.date = datetime.fromtimestamp(int(token.group("timestamp")), timezone.utc)
 
+			elif token.lastgroup in ("userID", "userName") and vOpInfo.managingUser == "":
+				vOpInfo.managingUser = token.group(token.lastgroup)
 
-				if line.__contains__("@"):
-					managingUserStart = re.search("@", line).start()
-					dayOpInfo.managingUser = line[managingUserStart:].replace("@", "").replace(">", "")
 
-				
-				if dayOpInfo.matchingOp != "" and dayOpInfo.date != None:
-					dayOpInfo.bCanPost = True
-				
-				if dayOpInfo not in returnList:
-					returnList.append(dayOpInfo)
-					continue
-			
+		for opInfo in returnList:
+			opInfo.bCanPost = bool(
+				opInfo.matchingOp != "" 
+				and opInfo.date != None 
+				and opInfo.confidence >= botSettings.SignUps.autoParseMinConfidence
+			)
 
-		BUPrint.LogError(p_titleStr="RETURNED LIST", p_string=f"{returnList}")
+		BUPrint.Debug(f"\n\nFinal Infos: \n{returnList}")
 		return returnList
 
 
 
+	def MatchDefault(p_eventName:str):
+		"""# MATCH DEFAULT:
+		Finds the default op closest matching the event name using the word index.
+		Words not found in the index are fuzzy matched against indexed words, contributing their similarity.
 
-	def GetSections(pText:str):
-		"""# GET SECTIONS:
-		Returns a list of strings, containing each 'section' of the schedule."""
+		## RETURNS
+		`tuple[str, float]`: The matching default op filename (or empty string) and its confidence (0-1).
+		"""
+		vScores:dict[str, float] = {}
 
-		mondayPos = re.search("Monday", pText).start()
-		tuesPos = re.search("Tuesday", pText).start()
-		wedsPos = re.search("Wednesday", pText).start()
-		thursPos = re.search("Thursday", pText).start()
-		friPos = re.search("Friday", pText).start()
-		satPos = re.search("Saturday", pText).start()
-		sunPos = re.search("Sunday", pText).start()
+		for word in Parser.wordPattern.findall(p_eventName.lower()):
+			if len(word) <= 3:
+				continue
 
-		sections = []
-		sections.append(pText[mondayPos:tuesPos].strip())
-		sections.append(pText[tuesPos:wedsPos].strip())
-		sections.append(pText[wedsPos:thursPos].strip())
-		sections.append(pText[thursPos:friPos].strip())
-		sections.append(pText[friPos:satPos].strip())
-		sections.append(pText[satPos:sunPos].strip())
-		sections.append(pText[sunPos:].strip())
+			if word in Parser.defaultIndex:
+				vMatches = [(word, 1.0)]
+			else:
+				vMatches = [
+					(closeWord, SequenceMatcher(None, word, closeWord).ratio())
+					for closeWord in get_close_matches(word, Parser.defaultIndex.keys(), n=1, cutoff=0.8)
+				]
 
-		return sections
+			for matchedWord, similarity in vMatches:
+				for defaultOp in Parser.defaultIndex[matchedWord]:
+					vScores[defaultOp] = vScores.get(defaultOp, 0.0) + similarity
+
+		if len(vScores) == 0:
+			return "", 0.0
+
+		# Highest summed similarity first, then the proportion of the default name matched.
+		vBestMatch = max(vScores, key=lambda defaultOp: (vScores[defaultOp], vScores[defaultOp] / Parser.defaultWordCounts[defaultOp]))
+		vConfidence = min(1.0, vScores[vBestMatch] / max(1, Parser.defaultWordCounts[vBestMatch]))
+
+		return vBestMatch, vConfidence
 
 
 
@@ -525,6 +534,10 @@ class OperationManager():
 	vLiveOps: list[OperationData] = [] # List of Live Ops (botData.OperationData)
 	vLiveCommanders:list [OpCommander.commander.Commander] = []
 	vBotRef: commands.Bot = None
+	vStaleOps: set[str] = set() # File names of live ops whose message failed to update.
+	vChannelMessages: dict[int, set[str]] = {} # Signup channel ID : IDs of the bots own (op) messages in it.
+	defaultsCatalogue = botUtils.FileCatalogue(botSettings.Directories.savedDefaultsDir, ".bin", p_extraEntries=["Custom"])
+	liveOpsCatalogue = botUtils.FileCatalogue(botSettings.Directories.liveOpsDir, ".bin")
 	
 	def __init__(self):
 		# Only update lists on first object instantiation (or there's no ops and it occurs each time):
@@ -533,31 +546,114 @@ class OperationManager():
 
 
 
-	async def RefreshOps(self):
+	async def RefreshOps(self, p_onlyStale:bool = False) -> OpsRefreshReport:
 		"""
 		# REFRESH OPS
 
-		Recursively 'updates' all active live Ops so that views are refreshed and usable again.
+		Reconciles the live Ops: outdated ops are removed, and the remaining ones are 'updated' so that views are refreshed and usable again.
+		Works from a snapshot of the live ops, so removals don't cause others to be skipped.
+		
+		Removals & updates run concurrently, up to `SignUps.refreshConcurrency` at once; removals in the same channel run in turn, so the channel is only removed once it has no bot posts (see `ChannelHasBotPosts`).
+		Channels are only resolved for removals, and are never created for them.
+
+		## PARAMETERS:
+		`p_onlyStale`: Only update ops whose last message update failed.  Used after a reconnect, where views are still registered.
+
+		## RETURNS: `OpsRefreshReport`
 		"""
+		vReport = OpsRefreshReport()
+		vSnapshot: list[OperationData] = list(self.vLiveOps)
+
+		vRemovalsByChannel: dict[int, list[OperationData]] = {}
+		vOpsToUpdate: list[OperationData] = []
+
 		vOpData : OperationData
-		for vOpData in self.vLiveOps:
-			bRemoveOp = False
-			if botSettings.SignUps.bAutoRemoveOutdated:
-				dateNow = datetime.now(tz=timezone.utc)
-				if dateNow > vOpData.date:
-					bRemoveOp = True
-
-			if bRemoveOp:
+		for vOpData in vSnapshot:
+			if botSettings.SignUps.bAutoRemoveOutdated and datetime.now(tz=timezone.utc) > vOpData.date:
 				BUPrint.Info(f"OUTDATED EVENT: {vOpData.fileName}")
-				await self.RemoveOperation(vOpData)
+				vChannel = await self.AddNewLive_GetTargetChannel(p_opsData=vOpData, p_createMissing=False)
+				vChannelID = 0 if vChannel == None else vChannel.id
+				vRemovalsByChannel.setdefault(vChannelID, []).append(vOpData)
+
+			elif not p_onlyStale or vOpData.fileName in OperationManager.vStaleOps:
+				vOpsToUpdate.append(vOpData)
 
 			else:
+				vReport.skipped += 1
+
+		vLimiter = asyncio.Semaphore(botSettings.SignUps.refreshConcurrency)
+
+		async def RemoveOps(p_opsInChannel:list[OperationData]):
+			for opData in p_opsInChannel:
+				async with vLimiter:
+					if await self.RemoveOperation(opData):
+						vReport.removed += 1
+					else:
+						vReport.failedRemovals.append(opData.fileName)
+
+		async def RefreshOp(p_opData:OperationData):
+			async with vLimiter:
 				if botSettings.BotSettings.bDebugEnabled:
-					BUPrint.Info(f"Refreshing {vOpData}\n")
+					BUPrint.Info(f"Refreshing {p_opData}\n")
 				else:
-					BUPrint.Info(f"Refreshing {vOpData.fileName}")
-				
-				await self.UpdateMessage(vOpData)
+					BUPrint.Info(f"Refreshing {p_opData.fileName}")
+
+				await self.UpdateMessage(p_opData)
+				if p_opData.fileName in OperationManager.vStaleOps:
+					vReport.failedUpdates.append(p_opData.fileName)
+				else:
+					vReport.updated += 1
+
+		await asyncio.gather(
+			*[RemoveOps(opsInChannel) for opsInChannel in vRemovalsByChannel.values()],
+			*[RefreshOp(opData) for opData in vOpsToUpdate]
+		)
+
+		BUPrint.Info(f"Ops refreshed: {vReport}")
+		return vReport
+
+
+
+	def TrackMessage(p_channelID:int, p_messageID:str):
+		"""
+		# TRACK MESSAGE
+		Records an op message the bot has confirmed (posted, or fetched) in a signup channel.
+
+		Not called from instance
+		"""
+		if p_messageID != "":
+			OperationManager.vChannelMessages.setdefault(p_channelID, set()).add(p_messageID)
+
+
+	def UntrackMessage(p_channelID:int, p_messageID:str):
+		"""
+		# UNTRACK MESSAGE
+		Removes a tracked op message, once deleted (or replaced).
+
+		Not called from instance
+		"""
+		OperationManager.vChannelMessages.get(p_channelID, set()).discard(p_messageID)
+
+
+	async def ChannelHasBotPosts(self, p_channel:discord.TextChannel):
+		"""
+		# CHANNEL HAS BOT POSTS
+		Returns true if the bot has posts in the signup channel.
+
+		Op messages are tracked once the bot has posted or fetched them.
+		When every live op's message is tracked, only the tracked op messages count; other bot posts in the channel don't prevent its removal.
+		Otherwise, the channel history is checked for any bot post.
+		"""
+		vTrackedIDs = set().union(*OperationManager.vChannelMessages.values())
+		if all(opData.messageID in vTrackedIDs for opData in self.vLiveOps):
+			return len(OperationManager.vChannelMessages.get(p_channel.id, set())) != 0
+
+		BUPrint.Debug("	-> Not all live ops are tracked, checking channel history.")
+		async for message in p_channel.history():
+			if message.author == self.vBotRef.user:
+				return True
+
+		return False
 
 
 
@@ -567,8 +663,7 @@ class OperationManager():
 		
 		Not called from instance
 		"""
-		botUtils.BotPrinter.Debug("Getting Ops list...")
-		return botUtils.FilesAndFolders.GetFiles( botSettings.Directories.liveOpsDir, ".bin")
+		return OperationManager.liveOpsCatalogue.GetFiles()
 
 
 	
@@ -615,16 +710,19 @@ class OperationManager():
 	# Remove Message first.
 		if not bIsDefault: # Defaults have no message!
 			BUPrint.Debug("	-> Removing MESSAGE...")
-			vChannel: discord.TextChannel = await self.AddNewLive_GetTargetChannel(p_opsData=p_opData)
-			try:
-				vMessage: discord.Message = await vChannel.fetch_message(p_opData.messageID)
-				await vMessage.delete()
-			except discord.errors.Forbidden:
-				BUPrint.LogError("Unable to remove message!")
-				return False
-			except discord.errors.NotFound:
-				BUPrint.LogError("No message found.")
-				#don't return, since the message may have been manually removed.
+			vChannel: discord.TextChannel = await self.AddNewLive_GetTargetChannel(p_opsData=p_opData, p_createMissing=False)
+			if vChannel == None:
+				BUPrint.Debug("	-> Channel doesn't exist, no message to remove.")
+			else:
+				try:
+					vMessage: discord.Message = await vChannel.fetch_message(p_opData.messageID)
+					await vMessage.delete()
+				except discord.errors.Forbidden:
+					BUPrint.LogError("Unable to remove message!")
+					return False
+				except discord.errors.NotFound:
+					BUPrint.LogError("No message found.")
+					#don't return, since the message may have been manually removed.
 
 			# Remove OpData from LiveOps list
 			BUPrint.Debug("	-> Removing OpData from LiveOps...")
@@ -641,22 +739,14 @@ class OperationManager():
 							except ValueError:
 								BUPrint.Info("	-> Unable to remove OpData from Live list!")
 
-			# Remove channel if empty
-			chanMessages = [message async for message in vChannel.history()]
-			if ( len(chanMessages) == 0 ):
-				await vChannel.delete(reason="Auto removal of empty signup channel")
-		
-			else:
-				# Check to see if other messages are from the bot, if not, remove the channel.
-				message:discord.Message
-				bBotPostFound = False
-				for message in chanMessages:
-					if message.author == self.vBotRef.user:
-						bBotPostFound = True
-						break
-
-				if not bBotPostFound:
+			# Remove channel if the bot has no other posts in it.
+			if vChannel != None:
+				OperationManager.UntrackMessage(vChannel.id, p_opData.messageID)
+			if vChannel != None and not await self.ChannelHasBotPosts(vChannel):
+				try:
 					await vChannel.delete(reason="Auto removal of empty signup channel")
+				except discord.errors.NotFound:
+					BUPrint.Debug("	-> Channel already removed.")
 
 	# Remove File
 		BUPrint.Debug("	-> Removing FILE...")
@@ -668,20 +758,14 @@ class OperationManager():
 			BUPrint.Info("Unable to remove file!")
 			return False
 
+		OperationManager.RefreshCatalogue(bIsDefault)
+
 
 	# Remove Autostart entry if op status is not started.
 		if p_opData.status.value < OpsStatus.started.value:
 			BUPrint.Debug("	-> Removing scheduled AutoStart.")
-			try:
-				autoComCog: OpCommander.autoCommander.AutoCommander = self.vBotRef.get_cog("AutoCommander")
-				if autoComCog == None:
-					BUPrint.Info("Unable to get Auto Commander Cog to remove an auto-start.")
-					pass
-				
-				autoComCog.scheduler.remove_job(p_opData.messageID)
-			except apscheduler.jobstores.base.JobLookupError:
-				BUPrint.LogError(p_titleStr="Unable to remove scheduled event start", p_string="No matching ID found! (safe to ignore if bot booting; the job doesn't exist)")
-				pass
+			if not BotScheduler.RemoveJob(OperationManager.GetAutoStartID(p_opData), BotScheduler.persistentStore):
+				BUPrint.Debug("	-> No scheduled AutoStart to remove.")
 
 		BUPrint.Info("	-> OPERATION REMOVED!")
 		return True
@@ -719,7 +803,7 @@ class OperationManager():
 		"""
 		vDataFiles: list = ["Custom"]
 		# Merge custom list with list of actual default files.		
-		vDataFiles += botUtils.FilesAndFolders.GetFiles(botSettings.Directories.savedDefaultsDir, ".bin")
+		vDataFiles += OperationManager.defaultsCatalogue.GetFiles()
 
 		return vDataFiles
 
@@ -751,6 +835,7 @@ class OperationManager():
 		else:
 			vFilePath += f"{botSettings.Directories.liveOpsDir}{p_opsData.fileName}.bin"
 		BUPrint.Debug(f"Saving file: {vFilePath}")
+		bIsNewFile = not os.path.exists(vFilePath)
 		try:
 			botUtils.FilesAndFolders.GetLock(f"{vFilePath}{botSettings.Directories.lockFileAffix}")
 			with open(vFilePath, "wb") as vFile:
@@ -761,11 +846,28 @@ class OperationManager():
 			BUPrint.LogError("Failed to save Ops Data to file!")
 			botUtils.FilesAndFolders.ReleaseLock(f"{vFilePath}{botSettings.Directories.lockFileAffix}")
 			return False
-		
+
+		if bIsNewFile:
+			OperationManager.RefreshCatalogue(p_opsData.fileName == "")
+
 		# Save successful, return True.
 		return True
 
 
+
+	def RefreshCatalogue(p_isDefault:bool):
+		"""
+		# REFRESH CATALOGUE
+		Forces the defaults or live ops catalogue to refresh; called after the bot adds or removes an ops file.
+
+		Not called from instance
+		"""
+		if p_isDefault:
+			OperationManager.defaultsCatalogue.Refresh(p_force=True)
+		else:
+			OperationManager.liveOpsCatalogue.Refresh(p_force=True)
+
+
 	def LoadFromFile(p_opFilePath):
 		"""
 		# LOAD FROM FILE:
@@ -862,6 +964,7 @@ class OperationManager():
 			vMessage:discord.Message = await vChannel.send(content=p_opData.GetPingables(botUtils.GetGuildNF(self.vBotRef)), view=vView, embed=vEmbed)
 			p_opData.messageID = str(vMessage.id)
 			p_opData.jumpURL = vMessage.jump_url
+			OperationManager.TrackMessage(vChannel.id, p_opData.messageID)
 
 		except discord.HTTPException as vError:
 			BUPrint.LogErrorExc("Message did not send due to HTTP Exception.", vError)
@@ -874,7 +977,7 @@ class OperationManager():
 
 
 
-	async def AddNewLive_GetTargetChannel(self, p_opsData: OperationData):
+	async def AddNewLive_GetTargetChannel(self, p_opsData: OperationData, p_createMissing:bool = True):
 		"""
 		# GET TARGET CHANNEL:
 
@@ -882,10 +985,11 @@ class OperationManager():
 
 		## PARAMETERS: 
 		p_opsData: the ops data used to get the target channel.
+		p_createMissing: Create the channel if it doesn't exist.  When false, only existing channels are found.
 
 		## RETURN:
 		Existing or newly created channel.  
-		None on failure.
+		None on failure, or if missing and not created.
 		"""
 	
 		BUPrint.Debug("	-> Obtaining target channel...")
@@ -915,6 +1019,9 @@ class OperationManager():
 					return channel
 
 			else:
+				if not p_createMissing:
+					return None
+
 				BUPrint.Info(f"	-> No existing matching channel, creating channel: {p_opsData.targetChannel}")
 				try:
 					channel = await vGuild.create_text_channel(
@@ -928,7 +1035,7 @@ class OperationManager():
 		else:
 			BUPrint.Debug(f"	-> Target Ops Channel not specified")
 			channel = discord.utils.find(lambda items: items.name == p_opsData.name.lower().replace(" ", "-"), vGuild.text_channels)
-			if channel == None:
+			if channel == None and p_createMissing:
 				BUPrint.Debug("	-> No existing chanel, creating new one.")
 				channel = await vGuild.create_text_channel(
 								name=p_opsData.name,
@@ -1075,6 +1182,7 @@ class OperationManager():
 
 
 
+	@BotMetrics.Timed(opsMessageUpdates)
 	async def UpdateMessage(self, p_opData: OperationData):
 		"""
 		# UPDATE MESSAGE:
@@ -1084,6 +1192,9 @@ class OperationManager():
 		`p_opData`: The Opdata to regenerate a message with.
 		"""
 		BUPrint.Debug("Updating Op Message")
+		# Stays stale unless the update succeeds, so it's retried on reconnect.
+		OperationManager.vStaleOps.add(p_opData.fileName)
+
 		try:
 			vChannel: discord.TextChannel = await self.AddNewLive_GetTargetChannel(p_opsData=p_opData)
 		except Exception as error:
@@ -1097,13 +1208,17 @@ class OperationManager():
 			if p_opData.jumpURL == "":
 				p_opData.jumpURL = vMessage.jump_url
 
+			OperationManager.TrackMessage(vChannel.id, p_opData.messageID)
+
 		except discord.NotFound as error:
 				BUPrint.LogErrorExc("Message not found! Posting a new one...", error)
+				OperationManager.UntrackMessage(vChannel.id, p_opData.messageID)
 				if not await self.AddNewLive_PostOp(p_opData):
 					BUPrint.Info("Failed to add new message. Possibly corrupt data? Removing this Ops file!")
 					await self.RemoveOperation(p_opData)
 				else:
 					OperationManager.SaveToFile(p_opData)
+					OperationManager.vStaleOps.discard(p_opData.fileName)
 				return
 
 		except discord.Forbidden as error:
@@ -1117,6 +1232,7 @@ class OperationManager():
 		vView = await self.AddNewLive_GenerateView(p_opData)
 		
 		await vMessage.edit(content=p_opData.GetPingables(botUtils.GetGuildNF(self.vBotRef)), embed=vNewEmbed, view=vView)
+		OperationManager.vStaleOps.discard(p_opData.fileName)
 
 
 		# If the event has been pre-started, update the commanders participants and re-generate info & commander (for connections)
@@ -1179,21 +1295,43 @@ class OperationManager():
 	def RefreshAutostarts(self):
 		"""
 		# REFRESH AUTO-STARTS
-		Clears out the currently scheduled auto-starts, then uses the list of OpData's in the OperationManager to re-create the scheduled starts.
+		Brings the persistent auto-start jobs in line with the live ops: missing or outdated jobs are (re)scheduled, and jobs for ops that no longer exist are removed.
+		Unchanged jobs are left alone, so calling this repeatedly (eg, on reconnect) does not rebuild the schedule.
+
+		Resumes the shared scheduler afterwards; it starts paused until live ops are loaded.
 		"""
-		if not botSettings.Commander.bAutoStartEnabled:
+		if botSettings.Commander.bAutoStartEnabled:
+			vExpectedIDs = []
+			opData : OperationData
+			for opData in self.vLiveOps:
+				self.AddNewAutoStart(opData)
+				vExpectedIDs.append(OperationManager.GetAutoStartID(opData))
+
+			for job in BotScheduler.scheduler.get_jobs(BotScheduler.persistentStore):
+				if job.id not in vExpectedIDs:
+					BUPrint.Debug(f"Removing orphaned auto-start: {job.id}")
+					BotScheduler.RemoveJob(job.id, BotScheduler.persistentStore)
+
+		else:
 			BUPrint.Debug("Global Autostart setting is disabled. Not refreshing auto-starts.")
-			return
 
-		autoCommanderCog: OpCommander.autoCommander.AutoCommander = self.vBotRef.get_cog("AutoCommander")
-		if autoCommanderCog == None:
-			BUPrint.Info("Auto Commander Cog not found. Unable to continue.")
+		BotScheduler.Resume()
+
+
+	def GetAutoStartID(p_opData: OperationData):
+		"""
+		# GET AUTO START ID
+		Returns the scheduler job ID used for an operations auto-start.
+		"""
+		return f"autostart_{p_opData.messageID}"
 
-		autoCommanderCog.scheduler.remove_all_jobs()
 
-		opData : OperationData
-		for opData in self.vLiveOps:
-			self.AddNewAutoStart(opData)
+	def GetAutoStartTime(p_opData: OperationData):
+		"""
+		# GET AUTO START TIME
+		Returns the time an operation is auto-started; before the op date by the prestart time + 5 minute buffer.
+		"""
+		return p_opData.date - relativedelta(minutes=botSettings.Commander.autoPrestart + 5)
 
 
 	def ReconfigureAutoStart(self, p_opData: OperationData):
@@ -1210,41 +1348,21 @@ class OperationManager():
 			BUPrint.Debug("Autostart is globally disabled.")
 			return
 
-		startTime = p_opData.date - relativedelta(minutes=botSettings.Commander.autoPrestart + 5)
-
-		autoCommanderCog: OpCommander.autoCommander.AutoCommander = self.vBotRef.get_cog("AutoCommander")
-		if autoCommanderCog == None:
-			BUPrint.Info("Auto Commander Cog not found. Unable to continue.")
-
-
-		if not p_opData.options.bAutoStart:
-			vJob = autoCommanderCog.scheduler.get_job(p_opData.messageID)
-			if vJob != None:
-				try:
-					autoCommanderCog.scheduler.remove_job(p_opData.messageID)
-					return True
-				except apscheduler.jobstores.base.JobLookupError as vError:
-					BUPrint.LogErrorExc("Unable to remove scheduled job", vError)
-					return False
-
-		BUPrint.Info(f"Rescheduling autostart of {p_opData.name} to: {startTime}")
-
-		try:
-			autoCommanderCog.scheduler.reschedule_job(p_opData.messageID, None, "date", run_date=startTime)
-			return True
-
-		except apscheduler.jobstores.base.JobLookupError:
-			BUPrint.Info("Unable to reschedule autostart job: No Matching ID found. Creating new autostart entry")
-			self.AddNewAutoStart(p_opData)
-			return True
+		BUPrint.Info(f"Rescheduling autostart of {p_opData.name} to: {OperationManager.GetAutoStartTime(p_opData)}")
+		self.AddNewAutoStart(p_opData)
+		return True
 
 
 	def AddNewAutoStart(self, p_opdata: OperationData):
 		"""
 		# ADD NEW AUTO START
 
-		Adds an Operation to the scheduler to be automatically started.
+		Adds an Operation to the persistent scheduler to be automatically started.
+		Idempotent: an existing job at the same time is kept, a job at a different time is replaced, and a job for an op with auto-start disabled is removed.
+
+		Missed auto-starts (eg, the bot was offline) still run, up until the operations start time.
 		"""
+		vJobID = OperationManager.GetAutoStartID(p_opdata)
 
 		if not botSettings.Commander.bAutoStartEnabled:
 			BUPrint.Debug("Auto-Start is globally disabled.")
@@ -1252,19 +1370,32 @@ class OperationManager():
 
 		if not p_opdata.options.bAutoStart:
 			BUPrint.Debug(f"Operation {p_opdata.fileName} has auto-start disabled. Skipping")
+			BotScheduler.RemoveJob(vJobID, BotScheduler.persistentStore)
 			return
 
+		if p_opdata.date <= datetime.now(timezone.utc):
+			BUPrint.Debug(f"Operation {p_opdata.fileName} start time has passed. Skipping")
+			BotScheduler.RemoveJob(vJobID, BotScheduler.persistentStore)
+			return
 
-		autoCommanderCog: OpCommander.autoCommander.AutoCommander = self.vBotRef.get_cog("AutoCommander")
-		if autoCommanderCog == None:
-			BUPrint.Info("Auto Commander Cog not found. Unable to continue.")
-
+		startTime = OperationManager.GetAutoStartTime(p_opdata)
 
-		startTime = p_opdata.date - relativedelta(minutes=botSettings.Commander.autoPrestart + 5)
+		vExistingJob = BotScheduler.scheduler.get_job(vJobID, BotScheduler.persistentStore)
+		if vExistingJob != None and vExistingJob.trigger.run_date == startTime:
+			BUPrint.Debug(f"Auto-start for {p_opdata.fileName} is already scheduled.")
+			return
 
 		BUPrint.Info(f"Adding auto-start entry for: {p_opdata.fileName}, using message ID: {p_opdata.messageID} Scheduled for: {startTime}")
 
-		autoCommanderCog.scheduler.add_job( OpCommander.commander.StartCommander, "date", run_date=startTime, args=[p_opdata], id=p_opdata.messageID )
+		BotScheduler.scheduler.add_job(
+			OpCommander.commander.AutoStartCommander, "date",
+			run_date=startTime,
+			args=[p_opdata.messageID],
+			id=vJobID,
+			jobstore=BotScheduler.persistentStore,
+			replace_existing=True,
+			misfire_grace_time=int( (p_opdata.date - startTime).total_seconds() )
+		)
 
 
 
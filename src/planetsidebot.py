@@ -2,27 +2,37 @@
 @author Michael O'Donnell
 """
 
+import time
+importStart = time.perf_counter()
+
 import discord
 from discord.ext import commands
 import asyncio
+import importlib
+import hashlib
+import json
+import os
+import sys
+from typing import TYPE_CHECKING
 
 import botUtils
 from botUtils import BotPrinter as BUPrint
-import newUser
 from botData import settings
-import roleManager
-import opsManager
-from OpCommander.autoCommander import AutoCommander
-from OpCommander.autoCommander import CommanderCommands
-from OpCommander.commander import Commander
-from userManager import UserLibraryCog, UserLibraryAdminCog, UserLibrary, UserLib_RecruitValidationRequest
-from chatUtility import ChatUtilityCog
-from botAdmin import BotAdminCog
-from ps2ContinentTracker import ContinentTrackerCog
-from forFun import ForFunCog
+from botMetrics import BotMetrics
+from loopWatchdog import LoopWatchdog
 
 from botData.sanityChecker import SanityCheck
 
+if TYPE_CHECKING:
+    from opsManager import OperationManager
+    from userManager import UserLibraryAdminCog
+    from ps2ContinentTracker import ContinentTrackerCog
+
+# Feature cog modules are imported by LoadFeatureCog, only when their feature is enabled.
+
+startupPhases = BotMetrics.Gauge("startup_phase_seconds", "Duration of each phase of the last startup.", ("phase",))
+importEnd = time.perf_counter()
+
 
 class Bot(commands.Bot):
 
@@ -34,46 +44,114 @@ class Bot(commands.Bot):
             BUPrint.Info(f"Starting bot with settings:\n")
             botUtils.PrintSettings()
 
+        self.LogPhase("core imports", importStart, importEnd)
+
         self.vGuildObj: discord.Guild
-        self.vOpsManager = opsManager.OperationManager()
-        self.contTrackerCog: ContinentTrackerCog = None
+        self.vOpsManager: "OperationManager" = None # Set on ready, if Operations are enabled.
+        self.contTrackerCog: "ContinentTrackerCog" = None
+        self.bHasBeenReady = False # on_ready fires again after reconnects.
+        self.rolesHash: int = None # Hash of the guild roles when the channel permission overwrites were set up.
+
+
+    def LogPhase(self, p_phase:str, p_start:float, p_end:float = None):
+        """# LOG PHASE
+        Records & logs the duration of a startup phase, from its start (`time.perf_counter`) until its end, or now."""
+        vDuration = (p_end if p_end != None else time.perf_counter()) - p_start
+        startupPhases.Set(vDuration, (p_phase,))
+        BUPrint.Info("	> %s: %.2fs", p_phase, vDuration)
+
+
+    async def LoadFeatureCog(self, p_moduleName:str, p_cogName:str) -> commands.Cog:
+        """# LOAD FEATURE COG
+        Imports the module of a feature (if not already imported), and adds its cog.
+
+        ## RETURNS
+        The added cog.
+        """
+        if p_moduleName not in sys.modules:
+            vStart = time.perf_counter()
+            importlib.import_module(p_moduleName)
+            self.LogPhase(f"import {p_moduleName}", vStart)
+
+        vCog = getattr(sys.modules[p_moduleName], p_cogName)(self)
+        await self.add_cog(vCog)
+        return vCog
+
+
+    def GetCommandHash(self) -> str:
+        """# GET COMMAND HASH
+        Returns a hash of the guild and the signatures of its commands, as they'd be sent when syncing."""
+        vCommands = [command.to_dict(self.tree) for command in self.tree.get_commands(guild=self.vGuildObj)]
+        vPayload = json.dumps([self.vGuildObj.id, vCommands], sort_keys=True, default=str)
+
+        return hashlib.sha256(vPayload.encode()).hexdigest()
+
+
+    async def SyncCommandTree(self):
+        """# SYNC COMMAND TREE
+        Syncs the command tree to the guild, unless the commands are unchanged since the last sync."""
+        vHash = self.GetCommandHash()
+
+        if not settings.BotSettings.bAlwaysSyncCommands and os.path.exists(settings.Directories.commandHashFile):
+            with open(settings.Directories.commandHashFile, "r") as vFile:
+                if vFile.read().strip() == vHash:
+                    BUPrint.Info("	> Commands unchanged, skipping sync.")
+                    return
+
+        await self.tree.sync(guild=self.vGuildObj)
+
+        with open(settings.Directories.commandHashFile, "w") as vFile:
+            vFile.write(vHash)
+
+
 
     async def setup_hook(self):
 
         BUPrint.Info("Setting up hooks...")
+        vStart = time.perf_counter()
+        BotMetrics.InstrumentDiscordHTTP(self)
+        await BotMetrics.StartServer()
+        LoopWatchdog.Start()
         # Needed for later functions, which want a discord object instead of a plain string.
         self.vGuildObj = await botUtils.GetGuild(self)
+        self.LogPhase("hooks", vStart)
 
 # COGS	
+        vStart = time.perf_counter()
         if settings.BotSettings.botFeatures.NewUser:
-            await self.add_cog(newUser.NewUser(self))
+            await self.LoadFeatureCog("newUser", "NewUser")
 
         if settings.BotSettings.botFeatures.UserRoles:
-            await self.add_cog(roleManager.UserRoles(self))
+            await self.LoadFeatureCog("roleManager", "UserRoles")
+
+        if settings.BotSettings.botFeatures.Operations or settings.BotSettings.botFeatures.chatUtility:
+            await self.LoadFeatureCog("voiceRouter", "VoiceRouter")
 
         if settings.BotSettings.botFeatures.Operations:
-            await self.add_cog(opsManager.Operations(self))
-            await self.add_cog(AutoCommander(self))
-            await self.add_cog(CommanderCommands(self))
+            await self.LoadFeatureCog("opsManager", "Operations")
+            await self.LoadFeatureCog("OpCommander.autoCommander", "AutoCommander")
+            await self.LoadFeatureCog("OpCommander.autoCommander", "CommanderCommands")
 
         if settings.BotSettings.botFeatures.UserLibrary:
-            await self.add_cog(UserLibraryCog(self))
-            await self.add_cog(UserLibraryAdminCog(self))
+            await self.LoadFeatureCog("userManager", "UserLibraryCog")
+            await self.LoadFeatureCog("userManager", "UserLibraryAdminCog")
 
         if settings.BotSettings.botFeatures.chatUtility:
-            await self.add_cog(ChatUtilityCog(self))
+            await self.LoadFeatureCog("chatUtility", "ChatUtilityCog")
 
         if settings.BotSettings.botFeatures.ForFunCog:
-            await self.add_cog(ForFunCog(self))
+            await self.LoadFeatureCog("forFun", "ForFunCog")
 
         if settings.BotSettings.botFeatures.BotAdmin:
-            adminCog = BotAdminCog(self)
-            await self.add_cog(adminCog)
+            adminCog = await self.LoadFeatureCog("botAdmin", "BotAdminCog")
             adminCog.shutdownFunction = self.ExitCalled
+        self.LogPhase("cogs", vStart)
 
 
+        vStart = time.perf_counter()
         self.tree.copy_global_to(guild=self.vGuildObj)
-        await self.tree.sync(guild=self.vGuildObj)
+        await self.SyncCommandTree()
+        self.LogPhase("command tree", vStart)
 
 
 
@@ -83,34 +161,56 @@ class Bot(commands.Bot):
         Function checks if continent Tracker is enabled.
         """
         if settings.BotSettings.botFeatures.continentTracker:
-            self.contTrackerCog = ContinentTrackerCog(self)
-            self.contTrackerCog.CreateTriggers()
-            await self.add_cog(self.contTrackerCog)
+            self.contTrackerCog = await self.LoadFeatureCog("ps2ContinentTracker", "ContinentTrackerCog")
 
             BUPrint.Info("	> Connecting continent tracker client.")
-            await self.contTrackerCog.auraxClient.connect()            
+            self.contTrackerCog.StartClient()
+
+
+
+    def GetRolesHash(self) -> int:
+        """# GET ROLES HASH
+        Returns a hash of the guild roles, used to tell if the channel permission overwrites need setting up again."""
+        return hash(tuple(sorted((role.id, role.name) for role in self.vGuildObj.roles)))
 
 
 
     async def on_ready(self):
+        if self.bHasBeenReady:
+            await self.OnReconnectReady()
+            return
+
+        self.bHasBeenReady = True
+        vStart = time.perf_counter()
         if settings.BotSettings.bCheckValues:
             await SanityCheck.CheckAll(p_botRef=self)
+            self.LogPhase("sanity check", vStart)
+
+		# Objects with BOT refs; their modules are only imported if loaded by an enabled feature.
+        if settings.BotSettings.botFeatures.Operations:
+            import opsManager
+            from OpCommander.commander import Commander
+            opsManager.OperationManager.vBotRef = self
+            Commander.vBotRef = self
+            self.vOpsManager = opsManager.OperationManager()
 
-		# Objects with BOT refs
-        opsManager.OperationManager.vBotRef = self
-        Commander.vBotRef = self
-        UserLibrary.botRef = self
-        UserLib_RecruitValidationRequest.botRef = self
+        if "userManager" in sys.modules:
+            from userManager import UserLibrary, UserLib_RecruitValidationRequest
+            UserLibrary.botRef = self
+            UserLib_RecruitValidationRequest.botRef = self
 
 
         self.vGuildObj = await botUtils.GetGuild(self)
         await botUtils.ChannelPermOverwrites.Setup(self)
-        await self.vOpsManager.RefreshOps()
+        self.rolesHash = self.GetRolesHash()
  
 
-        # Setup existing Ops auto-starts:
-        if settings.Commander.bAutoAlertsEnabled:
+        # Refresh existing Ops, then sync their auto-starts & resume the shared scheduler:
+        if self.vOpsManager != None:
+            await self.vOpsManager.RefreshOps()
             self.vOpsManager.RefreshAutostarts()
+
+        self.LogPhase("ready", vStart)
         
         BUPrint.Info(f'\n\nBOT READY	|	{self.user.name} ({self.user.id}) on: {self.vGuildObj.name}\n')
 
@@ -125,6 +225,35 @@ class Bot(commands.Bot):
 
 
 
+    async def OnReconnectReady(self):
+        """# ON RECONNECT READY
+        Called instead of the startup in `on_ready` when it fires after a reconnect.
+        Views, scheduled jobs and settings are kept across reconnects, so only state which may have changed while disconnected is reconciled:
+        - Sanity check (cached; only re-checks if the guild changed).
+        - Channel permission overwrites, if the guild roles changed.
+        - Outdated ops, and ops whose message failed to update.
+        """
+        vStart = time.perf_counter()
+        BUPrint.Info("Reconnected, reconciling state...")
+
+        if settings.BotSettings.bCheckValues:
+            await SanityCheck.CheckAll(p_botRef=self)
+
+        self.vGuildObj = await botUtils.GetGuild(self)
+
+        vRolesHash = self.GetRolesHash()
+        if vRolesHash != self.rolesHash:
+            BUPrint.Info("	> Guild roles changed, setting up channel permission overwrites.")
+            await botUtils.ChannelPermOverwrites.Setup(self)
+            self.rolesHash = vRolesHash
+
+        if self.vOpsManager != None:
+            await self.vOpsManager.RefreshOps(p_onlyStale=True)
+
+        self.LogPhase("reconnect", vStart)
+
+
+
     async def ExitCalled(self):
         """
 		# EXIT CALLED
@@ -141,14 +270,30 @@ class Bot(commands.Bot):
         BUPrint.Info("Bot shutting down. Performing cleanup...")
         botUtils.FilesAndFolders.CleanupTemp()
 
-        BUPrint.Info(f"	> Ending {self.vOpsManager.vLiveCommanders.__len__()} running events...")
-        for liveOp in self.vOpsManager.vLiveCommanders:
-            try:
-                await liveOp.EndEvent()
-            except:
-                BUPrint.LogError(f"A problem occured while ending {liveOp.vOpData.name}.  Event may need to be removed manually.", "ERROR ENDING EVENT | ")
-                continue
+        if self.vOpsManager != None:
+            BUPrint.Info(f"	> Ending {self.vOpsManager.vLiveCommanders.__len__()} running events...")
+            for liveOp in self.vOpsManager.vLiveCommanders:
+                try:
+                    await liveOp.EndEvent()
+                except:
+                    BUPrint.LogError(f"A problem occured while ending {liveOp.vOpData.name}.  Event may need to be removed manually.", "ERROR ENDING EVENT | ")
+                    continue
+
+
+        # Only stopped if loaded by an enabled feature.
+        if "botScheduler" in sys.modules and sys.modules["botScheduler"].BotScheduler.scheduler.running:
+            BUPrint.Info("	> Stopping scheduler")
+            sys.modules["botScheduler"].BotScheduler.scheduler.shutdown(wait=False)
 
+        if "OpCommander.graphs" in sys.modules:
+            BUPrint.Info("	> Stopping graph workers")
+            sys.modules["OpCommander.graphs"].GraphMaker.Shutdown()
+
+        BUPrint.Info("	> Stopping loop watchdog")
+        LoopWatchdog.Stop()
+
+        BUPrint.Info("	> Stopping metrics server")
+        await BotMetrics.StopServer()
 
         BUPrint.Info("	> Ending task loops")
         if settings.BotSettings.botFeatures.UserLibrary:
@@ -160,13 +305,11 @@ class Bot(commands.Bot):
                 userLibAdmin.querySleeperTask.stop()
             
 
-        if settings.BotSettings.botFeatures.continentTracker:
+        if settings.BotSettings.botFeatures.continentTracker and self.contTrackerCog != None:
             BUPrint.Info("	> Closing continent tracker client")
+            self.contTrackerCog.CheckLiveness.stop()
             await self.contTrackerCog.auraxClient.close()
-            # await self.contTrackerCog.ReconnectClient.stop()
 
-            if settings.ContinentTrack.bSaveOnShutdown:
-                self.contTrackerCog.SaveContinentData()
                 
 
 
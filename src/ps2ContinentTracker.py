@@ -7,58 +7,211 @@ Booleans relating to a continent being open or closed should follow:
 FALSE - Open 	| TRUE - Closed
 """
 
-from botData.settings import BotSettings, ContinentTrack, Channels, CommandLimit, Messages, Directories
-from botData.dataObjects import CommanderStatus, WarpgateCapture, ContinentStatus
-from botUtils import BotPrinter as BUPrint, GetDiscordTime, UserHasCommandPerms, FilesAndFolders
-from botData.utilityData import PS2ZoneIDs, PS2WarpgateIDs, PS2ContMessageType
+from botData.settings import BotSettings, ContinentTrack, CommandLimit, Messages, Directories
+from botData.dataObjects import CommanderStatus, ContinentStatus, ContinentTrackerStats, ContinentWorldState, PS2FacilityInfo
+from botUtils import BotPrinter, GetDiscordTime, UserHasCommandPerms, FilesAndFolders, EllipsiseStringArrayToSize
+from botData.utilityData import PS2ZoneIDs, PS2WarpgateIDs, PS2ContMessageType, PS2ContEventType
 from discord.ext.commands import GroupCog, Bot
 from discord.ext import tasks
 from discord.app_commands import command, rename, Choice
-from discord import Interaction, Embed
+from discord import Interaction, Embed, NotFound, HTTPException
 from auraxium.event import EventClient, ContinentLock, Trigger, FacilityControl
 from auraxium.ps2 import Zone, MapRegion, World, Outfit
+from auraxium.census import Query
+from auraxium.errors import AuraxiumException
 from opsManager import OperationManager
-from datetime import datetime, timezone
+from rateLimiter import RateLimiter
+from continentHistory import ContinentHistory
+from botMetrics import BotMetrics, censusRequests
+from collections import OrderedDict
+from datetime import datetime, timezone, timedelta
+from functools import partial
+import aiohttp
 import asyncio
+import os
 import pickle
+import time
+
+BUPrint = BotPrinter.GetLogger("continentTracker")
+
+continentEvents = BotMetrics.Counter("continent_events", "Continent tracker events received.", ("world", "type"))
+continentDuplicates = BotMetrics.Counter("continent_duplicate_events", "Duplicate continent tracker events dropped.")
+continentReconnects = BotMetrics.Counter("continent_reconnects", "Continent tracker event stream reconnects.", ("result",))
+
+
+
+class TrackerEventClient(EventClient):
+	"""# Tracker Event Client
+	Event client which records the time of the last message received from the event stream.
+
+	Heartbeats are sent by the stream roughly every 30 seconds, so the age of the last message indicates whether the connection is alive.
+	"""
+	def __init__(self, *args, **kwargs):
+		super().__init__(*args, **kwargs)
+		self.lastMessageTime = time.monotonic()
+		"""Monotonic time of the last message received."""
+
+
+	def _process_payload(self, response:str) -> None:
+		self.lastMessageTime = time.monotonic()
+		super()._process_payload(response)
+
+
+	def GetMessageAge(self) -> float:
+		"""# Get Message Age
+		Returns the seconds since the last message was received."""
+		return time.monotonic() - self.lastMessageTime
+
+
 
 class ContinentTrackerCog(GroupCog, name="continents"):
 	def __init__(self, p_bot:Bot):
 		self.botRef = p_bot
-		self.auraxClient = EventClient(service_id=BotSettings.ps2ServiceID)
+		self.auraxClient = TrackerEventClient(service_id=BotSettings.ps2ServiceID)
+
+		self.announcementLimiter = RateLimiter("Continent Tracker", ContinentTrack.antiSpamAllowedPosts, ContinentTrack.antiSpamPeriod)
+		"""Rate limits announcements per channel & message type."""
+
+		self.worlds: dict[int, ContinentWorldState] = {
+			world.worldID: ContinentWorldState(world, self.CreateContinents())
+			for world in ContinentTrack.trackedWorlds
+		}
+		"""World ID : `Continent World State`.  The state of each tracked world."""
+
+		self.primaryWorld: ContinentWorldState = self.worlds[ContinentTrack.trackedWorlds[0].worldID]
+		"""The world used for commander alerts, and by default for commands."""
+
+		self.warpgateZones: dict[int, int] = {
+			warpgateID: zoneID
+			for zoneID, continent in self.primaryWorld.continents.items()
+			for warpgateID in continent.warpgateIDs
+		}
+		"""Warpgate facility ID : Zone ID.  Shared by all worlds."""
 
-		self.antiSpamUpdateCount = 0
-		"""Anti Spam update count:  When this count reaches a specified value, no new messages will be sent."""
+		self.recentEvents: OrderedDict[tuple, float] = OrderedDict()
+		"""(World ID, Zone ID, Facility ID, Timestamp) : Monotonic time received.  Events within the dedup window, oldest first."""
 
-		self.warpgateCaptures: list[WarpgateCapture] = []
-		"""List of `Warpgate Capture` objects."""
+		self.stats = ContinentTrackerStats()
+		"""Connection counters for the event stream."""
 
+		self.bReconnecting = False
+		"""True while a reconnect is in progress, to prevent concurrent reconnects."""
 
-		self.oshurStatus = ContinentStatus(PS2ZoneIDs.Oshur, PS2WarpgateIDs.oshur.value)
-		self.amerishStatus = ContinentStatus(PS2ZoneIDs.Amerish, PS2WarpgateIDs.amerish.value)
-		self.esamirStatus = ContinentStatus(PS2ZoneIDs.Esamir, PS2WarpgateIDs.esamir.value)
-		self.hossinStatus = ContinentStatus(PS2ZoneIDs.Hossin, PS2WarpgateIDs.hossin.value)
-		self.indarStatus = ContinentStatus(PS2ZoneIDs.Indar, PS2WarpgateIDs.indar.value)
+		self.history: ContinentHistory = None
+		"""Log of continent & facility changes.  `None` if disabled."""
+
+		self.monitoredOutfits: frozenset[int] = frozenset(ContinentTrack.facilityMonitorOutfitIDs)
+		"""IDs of outfits whose facility captures are announced."""
+
+		self.outfitTags: dict[int, str] = {}
+		"""Outfit ID : tag, of the monitored outfits.  Obtained on load."""
+
+		self.facilities: dict[int, PS2FacilityInfo] = {}
+		"""Facility ID : `PS2 Facility Info`.  Obtained on load, so captures are announced without a lookup."""
 
 		super().__init__()
 		BUPrint.Info("COG: ContinentTracker loaded.")
 
-		if ContinentTrack.bSaveOnShutdown:
-			BUPrint.Info("	> Loading saved continent data")
+		if ContinentTrack.bSaveHistory:
+			BUPrint.Info("	> Loading continent history")
+			self.history = ContinentHistory(Directories.continentHistoryFile)
 			self.LoadContinentData()
 
-		BUPrint.Debug("	> Starting auto reconnect task")
-		self.ReconnectClient.start()
+
+	async def cog_load(self):
+		if ContinentTrack.bMonitorFacilities:
+			await asyncio.gather(self.SeedContinents(), self.LoadFacilityMetadata(), self.LoadOutfitTags())
+		else:
+			await self.SeedContinents()
+
+
+	async def cog_unload(self):
+		self.announcementLimiter.Cancel()
+
+		if self.history != None:
+			self.history.Close()
 
 
 
 	@command(name="details", description="Posts a message of all continent statuses.")
-	async def GetOldestContinentLock(self, p_interaction:Interaction):
+	@rename(p_worldName="world")
+	async def GetOldestContinentLock(self, p_interaction:Interaction, p_worldName:str = None):
 		# HARDCODED ROLE USEAGE:
 		if not await UserHasCommandPerms(p_interaction.user, (CommandLimit.continentTracker), p_interaction):
 			return
 
-		await self.PostMessage_Long(p_interaction)
+		worldState = await self.GetWorldStateFromCommand(p_interaction, p_worldName)
+		if worldState == None:
+			return
+
+		await self.PostMessage_Long(worldState, p_interaction)
+
+
+
+	@command(name="history", description="Shows the most recent continent locks & unlocks.")
+	@rename(p_count="count", p_worldName="world")
+	async def ContinentHistoryCommand(self, p_interaction:Interaction, p_count:int = 10, p_worldName:str = None):
+		"""# Continent History Command
+		Command to show the most recent continent changes, and the longest locked continent.
+		"""
+		if not await UserHasCommandPerms(p_interaction.user, (CommandLimit.continentTracker), p_interaction):
+			return
+
+		if self.history == None:
+			await p_interaction.response.send_message("Continent history is disabled.", ephemeral=True)
+			return
+
+		worldState = await self.GetWorldStateFromCommand(p_interaction, p_worldName)
+		if worldState == None:
+			return
+
+		vEvents = self.history.GetRecentEvents( worldState.world.worldID, min(max(p_count, 1), ContinentTrack.historyMaxResults) )
+		vOldestLock = self.history.GetOldestLock(worldState.world.worldID)
+
+		vEmbed = Embed(title=f"CONTINENT HISTORY{self.GetWorldLabel(worldState, ' | ')}")
+
+		if vOldestLock != None:
+			vEmbed.add_field(name="Oldest Lock", value=f"**{PS2ZoneIDs(vOldestLock[0]).name}** | {GetDiscordTime(vOldestLock[1])}", inline=False)
+
+		vLines = [
+			f"**{PS2ZoneIDs(event.zoneID).name}** {'LOCKED' if event.eventType == PS2ContEventType.Lock else 'OPENED'} | {GetDiscordTime(event.eventTime)}"
+			for event in vEvents
+			if event.zoneID in worldState.continents
+		]
+		vEmbed.add_field(name="Recent Changes", value="\n".join(vLines) if vLines else "No changes logged.", inline=False)
+
+		await p_interaction.response.send_message(embed=vEmbed, ephemeral=True)
+
+
+
+	@command(name="captures", description="Shows the most recent facility captures by an outfit.")
+	@rename(p_outfitID="outfit_id", p_count="count")
+	async def OutfitCapturesCommand(self, p_interaction:Interaction, p_outfitID:str = None, p_count:int = 10):
+		"""# Outfit Captures Command
+		Command to show the most recent facility captures of an outfit.  Defaults to the monitored outfit.
+		"""
+		if not await UserHasCommandPerms(p_interaction.user, (CommandLimit.continentTracker), p_interaction):
+			return
+
+		if self.history == None:
+			await p_interaction.response.send_message("Continent history is disabled.", ephemeral=True)
+			return
+
+		try:
+			vOutfitID = ContinentTrack.facilityMonitorOutfitIDs[0] if p_outfitID == None else int(p_outfitID)
+		except ValueError:
+			await p_interaction.response.send_message("Invalid outfit ID given!", ephemeral=True)
+			return
+
+		vEvents = self.history.GetOutfitCaptures(vOutfitID, min(max(p_count, 1), ContinentTrack.historyMaxResults))
+
+		if len(vEvents) == 0:
+			await p_interaction.response.send_message("No captures logged for this outfit.", ephemeral=True)
+			return
+
+		vLines = [f"{self.GetFacilityLabel(event.facilityID)} | {GetDiscordTime(event.eventTime)}" for event in vEvents]
+
+		await p_interaction.response.send_message(content=f"**Captures by {self.outfitTags.get(vOutfitID, vOutfitID)}:**\n" + "\n".join(vLines), ephemeral=True)
 
 
 
@@ -72,15 +225,39 @@ class ContinentTrackerCog(GroupCog, name="continents"):
 
 		await p_interaction.response.defer(thinking=True, ephemeral=True)
 
-		await self.ReconnectClient()
+		if self.bReconnecting:
+			await p_interaction.edit_original_response(content="Continent Tracker is already reconnecting.")
+			return
+
+		if await self.ReconnectClient():
+			await p_interaction.edit_original_response(content="Continent Tracker reconnected")
+		else:
+			await p_interaction.edit_original_response(content="Continent Tracker failed to reconnect; the previous connection has been kept.  Automatic reconnects will continue to retry.")
+
+
+
+	@command(name="status", description="Shows the continent tracker connection status.")
+	async def TrackerStatus(self, p_interaction:Interaction):
+		"""# Tracker Status
+		Command to show the event stream connection counters.
+		"""
+		if not await UserHasCommandPerms(p_interaction.user, (CommandLimit.continentTrackerAdmin), p_interaction):
+			return
+
+		vLastReconnect = "Never" if self.stats.lastReconnect == None else GetDiscordTime(self.stats.lastReconnect)
+
+		vMessage = f"**Last message:** {self.auraxClient.GetMessageAge():.0f}s ago\n"
+		vMessage += f"**Reconnects:** {self.stats.reconnectCount} ({self.stats.failedReconnects} failed) | Last: {vLastReconnect}\n"
+		vMessage += f"**Gap:** {self.stats.lastGapSeconds:.0f}s last | {self.stats.totalGapSeconds:.0f}s total\n"
+		vMessage += f"**Duplicate events dropped:** {self.stats.duplicateEvents}"
 
-		await p_interaction.edit_original_response(content="Continent Tracker reconnected")
+		await p_interaction.response.send_message(content=vMessage, ephemeral=True)
 
 
 
 	@command(name="set", description="Manually sets the status of a continent.")
-	@rename(p_continentName="continent", p_isLocked="locked", p_timestamp="timestamp")
-	async def CommandSetContinentStatus(self, p_interaction:Interaction, p_continentName:str, p_isLocked:bool, p_timestamp:int):
+	@rename(p_continentName="continent", p_isLocked="locked", p_timestamp="timestamp", p_worldName="world")
+	async def CommandSetContinentStatus(self, p_interaction:Interaction, p_continentName:str, p_isLocked:bool, p_timestamp:int, p_worldName:str = None):
 		"""# Command: set Continent Status
 		Command related fuction to set a continents status.
 
@@ -104,13 +281,16 @@ class ContinentTrackerCog(GroupCog, name="continents"):
 			await p_interaction.response.send_message("Invalid timestamp given!", ephemeral=True)
 			return
 
+		worldState = await self.GetWorldStateFromCommand(p_interaction, p_worldName)
+		if worldState == None:
+			return
+
 		BUPrint.Info(f"Manually setting {p_continentName}...")
 
-		for continent in self.GetContinentsAsArray(False):
-			if continent.ps2Zone.name == p_continentName:
-				continent.SetLocked(p_isLocked, dateObj)
+		continent = worldState.continents[PS2ZoneIDs[p_continentName].value]
+		self.SetContinentIsLocked(worldState, p_isLocked, continent.ps2Zone.value, dateObj)
 
-				await p_interaction.response.send_message(f"{continent.ps2Zone.name} updated!", ephemeral=True)
+		await p_interaction.response.send_message(f"{continent.ps2Zone.name} updated!", ephemeral=True)
 
 		
 
@@ -137,111 +317,259 @@ class ContinentTrackerCog(GroupCog, name="continents"):
 
 
 
+	@GetOldestContinentLock.autocomplete("p_worldName")
+	@ContinentHistoryCommand.autocomplete("p_worldName")
+	@CommandSetContinentStatus.autocomplete("p_worldName")
+	async def AutoCompleteWorldName(self, p_interaction:Interaction, p_typedStr:str):
+		"""# Auto Complete: World Name
+		Autocomplete function for commands with a world parameter.
+		"""
+		return [
+			Choice(name=worldState.world.name, value=worldState.world.name)
+			for worldState in self.worlds.values()
+			if p_typedStr.lower() in worldState.world.name.lower()
+		]
+
+
+
+	async def GetWorldStateFromCommand(self, p_interaction:Interaction, p_worldName:str) -> ContinentWorldState:
+		"""# Get World State From Command
+		Returns the state of the named world, or the primary world if no name given.
+
+		Responds to the interaction and returns `None` if the name is invalid.
+		"""
+		if p_worldName == None:
+			return self.primaryWorld
+
+		for worldState in self.worlds.values():
+			if worldState.world.name.lower() == p_worldName.lower():
+				return worldState
 
-	@tasks.loop(time=ContinentTrack.reconnectionTime)
-	async def ReconnectClient(self):
+		await p_interaction.response.send_message("Invalid world name given!", ephemeral=True)
+		return None
+
+
+
+	def GetWorldLabel(self, p_worldState:ContinentWorldState, p_separator:str = ": ") -> str:
+		"""# Get World Label
+		Returns the worlds name with separator to label messages, or an empty string when only one world is tracked."""
+		if len(self.worlds) == 1:
+			return ""
+
+		return f"{p_separator}{p_worldState.world.name}"
+
+
+
+	@staticmethod
+	def CreateContinents() -> dict[int, ContinentStatus]:
+		"""# Create Continents
+		Returns a new Zone ID : `Continent Status` dict, with an entry for each continent."""
+		return {
+			zone.value: ContinentStatus(zone, PS2WarpgateIDs[zone.name.lower()].value)
+			for zone in PS2ZoneIDs if zone != PS2ZoneIDs.allIDs
+		}
+
+
+
+
+	def StartClient(self):
+		"""# Start Client
+		Creates the triggers on the current client, which connects it, and starts the liveness check.
+		"""
+		self.CreateTriggers()
+		self.auraxClient.lastMessageTime = time.monotonic()
+
+		if not self.CheckLiveness.is_running():
+			self.CheckLiveness.start()
+
+
+
+	@tasks.loop(seconds=ContinentTrack.livenessCheckInterval)
+	async def CheckLiveness(self):
+		"""# Check Liveness
+		Looped task which reconnects the client when no message, including heartbeats, has been received within the heartbeat timeout.
+		"""
+		vMessageAge = self.auraxClient.GetMessageAge()
+
+		if vMessageAge < ContinentTrack.heartbeatTimeout or self.bReconnecting:
+			return
+
+		BUPrint.Info(f"Continent Tracker: No messages for {vMessageAge:.0f}s, reconnecting...")
+		await self.ReconnectWithBackoff()
+
+
+
+	async def ReconnectWithBackoff(self):
+		"""# Reconnect with Backoff
+		Attempts to reconnect until successful, doubling the wait between each failed attempt up to the maximum.
+		"""
+		if self.bReconnecting:
+			return
+
+		vDelay = ContinentTrack.reconnectBackoffMin
+
+		while not await self.ReconnectClient():
+			BUPrint.Info(f"	>> Retrying reconnect in {vDelay}s.")
+			await asyncio.sleep(vDelay)
+			vDelay = min(vDelay * 2, ContinentTrack.reconnectBackoffMax)
+
+
+
+	async def ReconnectClient(self) -> bool:
 		"""# Reconnect Client
-		
 		Convenience function to reconnect the auraxium client;
-		 - Closes the current client.
-		 - Recreate client triggers (removes old ones if they exist).
-		 - Create new main loop task for aurax client.
+		 - Creates a new client with the tracker triggers.
+		 - Once the new client is connected, it replaces the current client, which is then closed.
+		 - Reconciles continent states, to catch up on events missed while disconnected.
 
-		
-		This may be called by a command, or from other functions in the event a `RuntimeError` is raised.
-
-		It is also a looped task, such that it gets called on a recurring basis and thus eliminate the disconnection issue.
+		The current client is kept until the new one is ready, so events are not missed during the switch.  
+		Events received by both clients are dropped by the dedup window.
 
 		It should NOT be confused for `ReconnectTracker`:  which is a command function that calls THIS function.
+
+		## RETURNS
+		- `TRUE`: The client reconnected.
+		- `FALSE`: The new client failed to connect, or a reconnect is already in progress.  The current client is kept.
 		"""
+		if self.bReconnecting:
+			return False
+
+		self.bReconnecting = True
 		BUPrint.Info("Reconnecting Auraxium Client...")
 
+		try:
+			vGapSeconds = self.auraxClient.GetMessageAge()
+			newClient = TrackerEventClient(service_id=BotSettings.ps2ServiceID)
 
-		BUPrint.Info("	>> Clearing current capture data")
-		self.warpgateCaptures.clear()
-		self.antiSpamUpdateCount = 0
+			BUPrint.Info("	>> Creating triggers on new client.")
+			self.CreateTriggers(newClient)
+
+			try:
+				await asyncio.wait_for(newClient.wait_ready(), ContinentTrack.heartbeatTimeout)
+			except asyncio.TimeoutError:
+				BUPrint.LogError(p_titleStr="Continent Tracker", p_string="New client did not connect in time.")
+				self.stats.failedReconnects += 1
+				continentReconnects.Inc(1, ("failed",))
+				await newClient.close()
+				return False
 
-		BUPrint.Info("	>> Closing current continent tracker.")
-		await self.auraxClient.close()
+			BUPrint.Info("	>> Closing previous client.")
+			oldClient = self.auraxClient
+			self.auraxClient = newClient
+			await oldClient.close()
 
-		mainLoop = asyncio.get_event_loop()
+			self.stats.reconnectCount += 1
+			continentReconnects.Inc(1, ("success",))
+			self.stats.lastGapSeconds = vGapSeconds
+			self.stats.totalGapSeconds += vGapSeconds
+			self.stats.lastReconnect = datetime.now(tz=timezone.utc)
 
-		BUPrint.Info("	>> Recreating triggers.")
-		self.CreateTriggers()
+			BUPrint.Info("	>> Reconciling continent states.")
+			await self.SeedContinents()
 
-		BUPrint.Info("	>> Recreating task loop.")
-		await mainLoop.create_task(self.auraxClient.connect())
+			BUPrint.Info(f"	>> Reconnect complete. ({vGapSeconds:.0f}s since last message)")
+			return True
 
-		BUPrint.Info("	>> Reconnect complete.")
+		finally:
+			self.bReconnecting = False
 
 
 
-	def CreateTriggers(self):
+	def CreateTriggers(self, p_client:EventClient = None):
 		"""# Create Triggers
 		Adds the continent lock and facility control triggers used for continent tracking.
 
 		Because Continent Unlock is not working on Daybreak's side, FacilityControl is also used for this purpose.
+
+		## PARAMETERS
+		- `p_client`: The client to add the triggers to.  When `None`, the current client is used.
 		"""
 		BUPrint.Info("	>> Creating triggers for continent tracker.")
 
+		if p_client == None:
+			p_client = self.auraxClient
+
 		try:
-			self.auraxClient.remove_trigger(keep_websocket_alive=True, trigger="CONTTRACK_Lock")
+			p_client.remove_trigger(keep_websocket_alive=True, trigger="CONTTRACK_Lock")
 		except (KeyError, ValueError):
 			BUPrint.Debug("No trigger for Continent Lock setup/found.")
 
 		try:
-			self.auraxClient.remove_trigger(keep_websocket_alive=True, trigger="CONTTRACK_Facility")
+			p_client.remove_trigger(keep_websocket_alive=True, trigger="CONTTRACK_Facility")
 		except (KeyError, ValueError):
 			BUPrint.Debug("No trigger for facility control setup/found.")
 
 
 
 		if ContinentTrack.contLockMessageType != PS2ContMessageType.NoMessage:
-			self.auraxClient.add_trigger(
+			p_client.add_trigger(
 				Trigger(
 					name="CONTTRACK_Lock",
 					event="ContinentLock",
-					worlds=[ContinentTrack.worldID],
+					worlds=list(self.worlds),
 					action=self.ContinentLockCallback
 				)
 			) # END: Add trigger- Continent Lock
 
 
-		self.auraxClient.add_trigger(
+		p_client.add_trigger(
 			Trigger(
 				name="CONTTRACK_Facility",
 				event="FacilityControl",
-				worlds=[ContinentTrack.worldID],
+				worlds=list(self.worlds),
 				action=self.FacilityControlCallback
 			)
 		) # END: Add Trigger: Facility Control
 
+
+
+	def IsDuplicateEvent(self, p_eventKey:tuple) -> bool:
+		"""# Is Duplicate Event
+		Checks the event against those received within the dedup window, and remembers it if new.
+
+		## PARAMETERS
+		- `p_eventKey`: (World ID, Zone ID, Facility ID, Timestamp) of the event.
+
+		## RETURNS
+		- `TRUE`: The event was already received, and should be ignored.
+		- `FALSE`: The event is new.
+		"""
+		vNow = time.monotonic()
+
+		while self.recentEvents:
+			if vNow - next(iter(self.recentEvents.values())) < ContinentTrack.eventDedupWindow:
+				break
+			self.recentEvents.popitem(last=False)
+
+		if p_eventKey in self.recentEvents:
+			self.stats.duplicateEvents += 1
+			continentDuplicates.Inc()
+			BUPrint.Debug("Dropped duplicate event %s", p_eventKey)
+			return True
+
+		self.recentEvents[p_eventKey] = vNow
+		return False
+
 	
 
 	async def ContinentLockCallback(self, p_event:ContinentLock):
 		"""# Continent Lock Callback
 		The function called when a Continent Lock event is sent."""
-		if p_event.world_id != ContinentTrack.worldID:
+		worldState = self.worlds.get(p_event.world_id)
+		if worldState == None:
 			return
+
+		continentEvents.Inc(1, (p_event.world_id, "lock"))
 		
 		if p_event.zone_id not in PS2ZoneIDs.allIDs.value:
 			return
-		
-		# Must be set before the below function; as the function updates the timestamps used by antiSpamCanPost resulting in a loop.
-		bCanPost = self.AntiSpamCanPost()
-
-		self.SetContinentIsLocked(True, p_event.zone_id)
 
-		# Spam guard	
-		if not bCanPost:
-			return		
+		if self.IsDuplicateEvent( (p_event.world_id, p_event.zone_id, 0, p_event.timestamp) ):
+			return
 
+		self.SetContinentIsLocked(worldState, True, p_event.zone_id)
 
-		if ContinentTrack.contLockMessageType == PS2ContMessageType.Simple:
-			await self.PostMessage_Short( self.GetContinentFromID(p_event.zone_id) )
-	
-		elif ContinentTrack.contLockMessageType == PS2ContMessageType.Detailed:
-			await self.PostMessage_Long()
+		await self.AnnounceContinent( worldState, self.GetContinentFromID(worldState, p_event.zone_id), ContinentTrack.contLockMessageType )
 
 
 
@@ -254,145 +582,363 @@ class ContinentTrackerCog(GroupCog, name="continents"):
 			Because the open event isn't working on Daybreak's side this is used instead.
 		- Outfit Facility Monitor; for alerting when the specified outfit captures a facility.
 		"""
-		if p_event.world_id != ContinentTrack.worldID:
+		worldState = self.worlds.get(p_event.world_id)
+		if worldState == None:
+			return
+
+		continentEvents.Inc(1, (p_event.world_id, "facility"))
+
+		if self.IsDuplicateEvent( (p_event.world_id, p_event.zone_id, p_event.facility_id, p_event.timestamp) ):
 			return
 
+		if self.history != None and p_event.old_faction_id != p_event.new_faction_id:
+			self.history.LogFacility(p_event.world_id, p_event.zone_id, p_event.facility_id, p_event.outfit_id, p_event.old_faction_id, p_event.new_faction_id, p_event.timestamp)
 
-		if p_event.facility_id in PS2WarpgateIDs.allIDs.value:
-			self.warpgateCaptures.append(
-				WarpgateCapture(
-					warpgateID=p_event.facility_id,
-					zoneID=p_event.zone_id,
-					factionID=p_event.new_faction_id
-				) # END - Warpgate Capture
-			) # END - Append wg capture.
 
-			await self.CheckWarpgates(p_event.zone_id)
+		if p_event.facility_id in self.warpgateZones:
+			await self.UpdateWarpgate(worldState, p_event.facility_id, p_event.new_faction_id)
 			return
 		
 
-		if ContinentTrack.bMonitorFacilities:
-			if p_event.outfit_id == ContinentTrack.facilityMonitorOutfitID:
-				BUPrint.Debug("Facility capture: Outfit ID matched")
-
-				try:
-					takenFacility:MapRegion = await MapRegion.get_by_facility_id(p_event.facility_id, self.auraxClient)
-
-				except RuntimeError as error:
-					# BUPrint.LogError(p_titleStr="Session closed.", p_string="Reconnecting client...")
-					# await self.ReconnectClient()
-					BUPrint.LogErrorExc("Error occured obtaining facility.", error)
-					return
-					
-					# Retry obtaining map region
-					# try:
-					# 	takenFacility:MapRegion = await MapRegion.get_by_facility_id(p_event.facility_id, self.auraxClient)
-					# except RuntimeError:
-					# 	BUPrint.Info("Failed to obtain map region after reconnecting client, aborting.")
-					# 	return
-
-				if takenFacility == None:
-					BUPrint.Debug("Invalid facility ID.")
-					return
-				
-				if p_event.old_faction_id != p_event.new_faction_id:
-					message = Messages.facilityOutfitCapture.replace("_DATA", f"{takenFacility.facility_name} | {takenFacility.facility_type} | {GetDiscordTime(p_event.timestamp)}")
-					BUPrint.Info(message)
-					try:
-						await self.botRef.get_channel(Channels.ps2FacilityControlID).send(message)
-
-					except: # Intentional catch all; too many possible causes.
-						BUPrint.LogError("Unable to post continent status message.", "EXCEPTION OCCURED")
-						
-			
+		if ContinentTrack.bMonitorFacilities and p_event.outfit_id in self.monitoredOutfits and p_event.old_faction_id != p_event.new_faction_id:
+			BUPrint.Debug("Facility capture: Outfit ID matched")
+			self.AddFacilityCapture(worldState, p_event)
 
 
 
+	def AddFacilityCapture(self, p_worldState:ContinentWorldState, p_event:FacilityControl):
+		"""# Add Facility Capture
+		Adds a monitored outfits capture to the worlds capture digest, and schedules the digest to be posted.
+		"""
+		message = Messages.facilityOutfitCapture.replace("_OUTFIT", str(self.outfitTags.get(p_event.outfit_id, p_event.outfit_id)))
+		message = message.replace("_DATA", f"{self.GetFacilityLabel(p_event.facility_id)} | {GetDiscordTime(p_event.timestamp)}")
+		BUPrint.Info(message)
 
-	
-	def GetContinentsAsArray(self, p_validOnly:bool = True) -> list[ContinentStatus]:
+		p_worldState.facilityDigestLines.append(message)
+
+		if p_worldState.facilityDigestTask == None:
+			p_worldState.facilityDigestTask = asyncio.create_task(self.PostFacilityDigest(p_worldState))
+
+
+
+	async def PostFacilityDigest(self, p_worldState:ContinentWorldState):
+		"""# Post Facility Digest
+		After the digest delay, posts the worlds pending captures; edited into the current digest message while within the digest window, else as a new message.
+		"""
+		await asyncio.sleep(ContinentTrack.facilityDigestDelay)
+
+		vNow = datetime.now(tz=timezone.utc)
+		vNewLines = p_worldState.facilityDigestLines[p_worldState.facilityDigestPosted:]
+		vContent = "\n".join(p_worldState.facilityDigestLines)
+
+		if p_worldState.facilityDigest == None or len(vContent) > 2000 \
+			or p_worldState.facilityDigestStart + timedelta(seconds=ContinentTrack.facilityDigestWindow) < vNow:
+			p_worldState.facilityDigest = None
+			p_worldState.facilityDigestLines = vNewLines
+			vContent = EllipsiseStringArrayToSize("\n".join(vNewLines), 2000)
+
+		p_worldState.facilityDigestPosted = len(p_worldState.facilityDigestLines)
+
+		try:
+			if p_worldState.facilityDigest != None:
+				await p_worldState.facilityDigest.edit(content=vContent)
+			else:
+				await self.SendFacilityDigest(p_worldState, vContent, vNow)
+
+		except NotFound:
+			BUPrint.Debug("Facility digest message was deleted, posting a new one.")
+			await self.SendFacilityDigest(p_worldState, vContent, vNow)
+
+		except HTTPException as vError:
+			BUPrint.LogErrorExc("Unable to post facility capture digest.", vError)
+
+		p_worldState.facilityDigestTask = None
+
+		# Captures added while posting.
+		if p_worldState.facilityDigestPosted < len(p_worldState.facilityDigestLines):
+			p_worldState.facilityDigestTask = asyncio.create_task(self.PostFacilityDigest(p_worldState))
+
+
+
+	async def SendFacilityDigest(self, p_worldState:ContinentWorldState, p_content:str, p_startTime:datetime):
+		"""# Send Facility Digest
+		Posts a new digest message to the worlds facility channel."""
+		facilityChannel = self.botRef.get_channel(p_worldState.world.facilityChannelID)
+
+		try:
+			p_worldState.facilityDigest = await facilityChannel.send(p_content)
+			p_worldState.facilityDigestStart = p_startTime
+
+		except (HTTPException, AttributeError) as vError:
+			BUPrint.LogErrorExc("Unable to post facility capture digest.", vError)
+
+
+
+	def GetFacilityLabel(self, p_facilityID:int) -> str:
+		"""# Get Facility Label
+		Returns the facility name & type from the local facility data, or its ID if unknown."""
+		facility = self.facilities.get(p_facilityID)
+
+		if facility == None:
+			return f"Facility {p_facilityID}"
+
+		return f"{facility.name} | {facility.facilityType}"
+
+
+
+	async def LoadFacilityMetadata(self):
+		"""# Load Facility Metadata
+		Loads the name & type of every facility from file.
+		When the file is missing or older than the max age, the data is obtained from the Census API in a single query, and saved.
+
+		Saved data is still used if the query fails.
+		"""
+		bIsFresh = False
+
+		if os.path.exists(Directories.facilityMetadataFile):
+			bIsFresh = time.time() - os.path.getmtime(Directories.facilityMetadataFile) < ContinentTrack.facilityMetadataMaxAge * 86400
+
+			try:
+				with open(Directories.facilityMetadataFile, "rb") as vFile:
+					vFacilityData: dict[int, tuple] = pickle.load(vFile)
+				self.facilities = {facilityID: PS2FacilityInfo(*data) for facilityID, data in vFacilityData.items()}
+
+			except (OSError, pickle.UnpicklingError, EOFError, TypeError) as vError:
+				BUPrint.LogErrorExc("Unable to load facility metadata.", vError)
+				bIsFresh = False
+
+		if bIsFresh:
+			BUPrint.Debug(f"Loaded {len(self.facilities)} facilities from file.")
+			return
+
+		query = Query("map_region", service_id=BotSettings.ps2ServiceID).limit(10000).show("facility_id", "facility_name", "facility_type", "zone_id")
+
+		try:
+			with censusRequests.Time(("facilityMetadata",)):
+				payload = await self.auraxClient.request(query)
+		except (AuraxiumException, aiohttp.ClientError, OSError, asyncio.TimeoutError, RuntimeError) as vError:
+			BUPrint.LogErrorExc("Unable to get facility metadata.", vError)
+			return
+
+		vFacilityData = {
+			int(region["facility_id"]): (region.get("facility_name", ""), region.get("facility_type", ""), int(region.get("zone_id", 0)))
+			for region in payload.get("map_region_list", [])
+			if "facility_id" in region
+		}
+		self.facilities = {facilityID: PS2FacilityInfo(*data) for facilityID, data in vFacilityData.items()}
+		BUPrint.Info(f"Obtained metadata of {len(self.facilities)} facilities.")
+
+		try:
+			with open(Directories.facilityMetadataFile, "wb") as vFile:
+				pickle.dump(vFacilityData, vFile, BotSettings.pickleProtocol)
+		except (OSError, pickle.PickleError) as vError:
+			BUPrint.LogErrorExc("Unable to save facility metadata.", vError)
+
+
+
+	async def LoadOutfitTags(self):
+		"""# Load Outfit Tags
+		Obtains the tags of the monitored outfits in a single query.  Outfits without a tag use their name."""
+		query = Query("outfit", service_id=BotSettings.ps2ServiceID, outfit_id=",".join(str(outfitID) for outfitID in self.monitoredOutfits))
+		query.show("outfit_id", "alias", "name")
+
+		try:
+			with censusRequests.Time(("outfitTags",)):
+				payload = await self.auraxClient.request(query)
+		except (AuraxiumException, aiohttp.ClientError, OSError, asyncio.TimeoutError, RuntimeError) as vError:
+			BUPrint.LogErrorExc("Unable to get monitored outfit tags.", vError)
+			return
+
+		for outfit in payload.get("outfit_list", []):
+			self.outfitTags[int(outfit["outfit_id"])] = outfit.get("alias") or outfit.get("name", outfit["outfit_id"])
+
+
+
+	def GetContinentsAsArray(self, p_worldState:ContinentWorldState, p_validOnly:bool = True) -> list[ContinentStatus]:
 		"""# Get Continents as Array
-		Returns an array containing all the continent status objects.
+		Returns an array containing all the continent status objects of the world.
 		
 		## PARAMETER:
 		- `p_validOnly`: When `True` (default), the resulting aray will only contain status objects that have been set.
 			
 			When `False`, returns all array items.  This is primarily for setter functions."""
-		
-		allContenents = [
-			self.amerishStatus,
-			self.esamirStatus,
-			self.hossinStatus,
-			self.indarStatus,
-			self.oshurStatus
-		]
-
 		if p_validOnly:
-			validList = [contStatus for contStatus in allContenents if contStatus.lastEventTime != None]
-			return validList
+			return [contStatus for contStatus in p_worldState.continents.values() if contStatus.lastEventTime != None]
 		else:
-			return allContenents
+			return list(p_worldState.continents.values())
 		
 
 
-	def SetContinentIsLocked(self, p_isLocked:bool, p_id:int):
+	def SetContinentIsLocked(self, p_worldState:ContinentWorldState, p_isLocked:bool, p_id:int, p_datetime:datetime = None, bLog:bool = True):
 		"""# Set Continent Is Locked
-		Sets the lock status of a continent.  The time of the un/lock is set on call of this function.
+		Sets the lock status of a continent.  The time of the un/lock is set on call of this function, unless given.
 
 		## PARMETERS
+		- p_worldState - The world of the continent.
 		- p_isLocked - The new locked status.
 		- p_id - Either a `WARPGATE` ID, or a `Continent` ID.
+		- p_datetime - Optional time of the un/lock.
+		- bLog - When true, the change is logged to the continent history (if enabled).
 		"""
 
-		BUPrint.Debug(f"Setting continent(zone/WG ID {p_id}) locked status({p_isLocked})")
+		BUPrint.Debug("Setting continent(world %s, zone/WG ID %s) locked status(%s)", p_worldState.world.worldID, p_id, p_isLocked)
 
-		if p_id in PS2WarpgateIDs.amerish.value or p_id == PS2ZoneIDs.Amerish.value:
-			self.amerishStatus.SetLocked(p_isLocked)
-
-		if p_id in PS2WarpgateIDs.esamir.value or p_id == PS2ZoneIDs.Esamir.value:
-			self.esamirStatus.SetLocked(p_isLocked)
+		continent = self.GetContinentFromID(p_worldState, p_id)
+		if continent == None:
+			return
 
-		if p_id in PS2WarpgateIDs.indar.value or p_id == PS2ZoneIDs.Indar.value:
-			self.indarStatus.SetLocked(p_isLocked)
+		continent.SetLocked(p_isLocked, p_datetime)
 
-		if p_id in PS2WarpgateIDs.hossin.value or p_id == PS2ZoneIDs.Hossin.value:
-			self.hossinStatus.SetLocked(p_isLocked)
+		if bLog and self.history != None:
+			self.history.LogContinent(p_worldState.world.worldID, continent.ps2Zone.value, p_isLocked, continent.lastEventTime)
 
-		if p_id in PS2WarpgateIDs.oshur.value or p_id == PS2ZoneIDs.Oshur.value:
-			self.oshurStatus.SetLocked(p_isLocked)
+		if p_worldState.mostRecentEventTime == None or continent.lastEventTime > p_worldState.mostRecentEventTime:
+			p_worldState.mostRecentEventTime = continent.lastEventTime
 	
 
 
-	def GetContinentFromID(self, p_id:int) -> ContinentStatus:
+	def GetContinentFromID(self, p_worldState:ContinentWorldState, p_id:int) -> ContinentStatus:
 		"""# Get Continent from ID
-		Returns the continent status object from a continent ID or Warpgate ID.
+		Returns the worlds continent status object from a continent ID or Warpgate ID.
 		
 		Returns NONE if invalid ID given."""
-		
-		for continent in self.GetContinentsAsArray(False):
-			if continent.ps2Zone.value == p_id or p_id in continent.warpgateIDs:
-				BUPrint.Debug("	> Matched")
-				return continent
-			
+		if p_id in p_worldState.continents:
+			return p_worldState.continents[p_id]
+
+		if p_id in self.warpgateZones:
+			return p_worldState.continents[ self.warpgateZones[p_id] ]
+
 		BUPrint.LogError(p_titleStr="Invalid continent or Warpgate ID", p_string=str(p_id))
 		return None # Invalid ID
-	
 
 
-	async def PostMessage_Short(self, p_continent:ContinentStatus = None):
+
+	async def SeedContinents(self):
+		"""# Seed Continents
+		Sets the warpgate owners of every continent from a single map snapshot of each world, then reconciles each continents state.
+
+		Called on load and after reconnecting, so events missed while disconnected are caught up.
+		"""
+		await asyncio.gather(*[self.SeedWorld(worldState) for worldState in self.worlds.values()])
+
+
+
+	async def SeedWorld(self, p_worldState:ContinentWorldState):
+		"""# Seed World
+		Seeds the continents of one world from its map snapshot."""
+		query = Query("map", service_id=BotSettings.ps2ServiceID, world_id=p_worldState.world.worldID, zone_ids=",".join(str(zoneID) for zoneID in p_worldState.continents))
+		query.create_join("map_region").set_fields("Regions.Row.RowData.RegionId", "map_region_id").set_inject_at("map_region").show("facility_id")
+
+		try:
+			with censusRequests.Time(("continentMap",)):
+				payload = await self.auraxClient.request(query)
+		except (AuraxiumException, aiohttp.ClientError, OSError, asyncio.TimeoutError, RuntimeError) as vError:
+			BUPrint.LogErrorExc(f"Unable to get continent map snapshot for world {p_worldState.world.worldID}.", vError)
+			return
+
+		for zoneMap in payload.get("map_list", []):
+			continent = p_worldState.continents.get( int(zoneMap["ZoneId"]) )
+			if continent == None:
+				continue
+
+			for row in zoneMap["Regions"]["Row"]:
+				facilityID = int( row["RowData"].get("map_region", {}).get("facility_id", -1) )
+				if facilityID in continent.warpgateIDs:
+					continent.warpgateFactions[facilityID] = int(row["RowData"]["FactionId"])
+
+			await self.ReconcileContinent(p_worldState, continent)
+
+		BUPrint.Info(f"Continent states seeded from map: {p_worldState.world.name}")
+
+
+
+	async def UpdateWarpgate(self, p_worldState:ContinentWorldState, p_facilityID:int, p_factionID:int):
+		"""# Update Warpgate
+		Updates the owner of a warpgate from a facility control event, and reconciles its continents state."""
+		continent = self.GetContinentFromID(p_worldState, p_facilityID)
+		continent.SetWarpgateFaction(p_facilityID, p_factionID)
+		await self.ReconcileContinent(p_worldState, continent)
+
+
+
+	async def ReconcileContinent(self, p_worldState:ContinentWorldState, p_continent:ContinentStatus):
+		"""# Reconcile Continent
+		Compares the continents state with the state implied by its warpgates.
+		Only acts when the warpgate implied state itself changes, as warpgates flip one at a time after a lock/unlock event.
+		On a change that differs from the continents state, the continent is updated and the change is posted.
+
+		Changes on a continent without prior data are set without posting.
+		"""
+		bWarpgatesLocked = p_continent.GetWarpgateLockState()
+		bPreviousWarpgatesLocked = p_continent.bWarpgatesLocked
+		p_continent.bWarpgatesLocked = bWarpgatesLocked
+
+		if bWarpgatesLocked == None:
+			return
+
+		if p_continent.lastEventTime != None and (bWarpgatesLocked == bPreviousWarpgatesLocked or bWarpgatesLocked == p_continent.bIsLocked):
+			return
+
+		bHasPriorData = p_continent.lastEventTime != None
+
+		self.SetContinentIsLocked(p_worldState, bWarpgatesLocked, p_continent.ps2Zone.value)
+
+		if not bHasPriorData:
+			return
+
+		# Lock messages are posted from the continent lock event.
+		if bWarpgatesLocked and ContinentTrack.contLockMessageType != PS2ContMessageType.NoMessage:
+			return
+
+		vMessageType = ContinentTrack.contLockMessageType if bWarpgatesLocked else ContinentTrack.contUnlockMessageType
+		await self.AnnounceContinent(p_worldState, p_continent, vMessageType)
+
+
+
+	async def AnnounceContinent(self, p_worldState:ContinentWorldState, p_continent:ContinentStatus, p_messageType:PS2ContMessageType):
+		"""# Announce Continent
+		Posts the continent change using the message type, subject to anti-spam.
+
+		Changes limited by anti-spam are merged into a single message posted once allowed, if enabled.
+		"""
+		if p_messageType == PS2ContMessageType.NoMessage:
+			BUPrint.Debug("Continent state changed, but configured to ignore.")
+			return
+
+		vSendFunction = self.PostMessage_Short if p_messageType == PS2ContMessageType.Simple else self.PostMessage_Detailed
+
+		await self.announcementLimiter.Post(
+			(p_worldState.world.continentChannelID, p_worldState.world.worldID, p_messageType),
+			p_continent,
+			partial(vSendFunction, p_worldState),
+			ContinentTrack.bAntiSpamDigest
+		)
+
+
+
+	async def PostMessage_Short(self, p_worldState:ContinentWorldState, p_continents:list[ContinentStatus]):
 		"""# Post Message: Short
-		Sends a message to the settings specified channel.
+		Sends a message to the worlds continent channel.
 
-		Message only includes the updated continent status of the passed event. 
+		Message only includes the current status of the passed continents. 
 		"""
-		notifChannel = self.botRef.get_channel(Channels.ps2ContinentNotifID)
-		message = f"**{p_continent.ps2Zone.name}** "
-		if p_continent.bIsLocked:
-			message += f"has **LOCKED**!"
-		else:
-			message += f"has **OPENED**!"
+		notifChannel = self.botRef.get_channel(p_worldState.world.continentChannelID)
+
+		messageLines = []
+		# Keyed by zone; repeat updates of a continent are shown once, with its current status.
+		for continent in {continent.ps2Zone: continent for continent in p_continents}.values():
+			line = f"**{continent.ps2Zone.name}** "
+			if continent.bIsLocked:
+				line += f"has **LOCKED**!"
+			else:
+				line += f"has **OPENED**!"
+
+			messageLines.append(f"{line} | {GetDiscordTime(continent.lastEventTime)}")
 
-		message += f" | {GetDiscordTime(p_continent.lastEventTime)}"
+		message = "\n".join(messageLines)
+
+		if len(self.worlds) > 1:
+			message = f"__{p_worldState.world.name}__\n{message}"
 
 		try:
 			await notifChannel.send(message)
@@ -400,25 +946,36 @@ class ContinentTrackerCog(GroupCog, name="continents"):
 			BUPrint.LogError("Unable to post continent status message.", "EXCEPTION OCCURED")
 
 
-		if ContinentTrack.bAlertCommanders:
+		if ContinentTrack.bAlertCommanders and p_worldState is self.primaryWorld:
 			await self.PostMessage_Commanders()
 	
 
 
-	async def PostMessage_Long(self, p_interaction:Interaction = None):
+	async def PostMessage_Detailed(self, p_worldState:ContinentWorldState, p_continents:list[ContinentStatus]):
+		"""# Post Message: Detailed
+		Sends the detailed embed to the worlds continent channel.
+
+		The embed shows every continent, so any number of updates are covered by one message.
+		"""
+		await self.PostMessage_Long(p_worldState)
+
+
+
+	async def PostMessage_Long(self, p_worldState:ContinentWorldState, p_interaction:Interaction = None):
 		"""# Post Message: Long
 
-		Message includes all continent statuses.
+		Message includes all continent statuses of the world.
 
  
 		## PARAMETRS:
+		- `p_worldState`: The world to post.
 		- `p_interaction`: An interaction reference.
 		
 		If interaction is included, the output is directed to the interaction.  
-		Else it sends a message to the settings specified channel.
+		Else it sends a message to the worlds continent channel.
 		"""
 
-		allContenents = self.GetContinentsAsArray()
+		allContenents = self.GetContinentsAsArray(p_worldState)
 
 		if allContenents.__len__() == 0:
 			if p_interaction != None:
@@ -430,25 +987,25 @@ class ContinentTrackerCog(GroupCog, name="continents"):
 
 		if p_interaction != None:
 			try:
-				await p_interaction.response.send_message(embed=self.CreateEmbed_Detailed(), ephemeral=True)
+				await p_interaction.response.send_message(embed=self.CreateEmbed_Detailed(p_worldState), ephemeral=True)
 			except: # Intentional catch all; too many possible causes.
 				BUPrint.LogError("Unable to post continent status message.", "EXCEPTION OCCURED")
 
 		else:
 			try:
-				await self.botRef.get_channel(Channels.ps2ContinentNotifID).send(embed=self.CreateEmbed_Detailed())
+				await self.botRef.get_channel(p_worldState.world.continentChannelID).send(embed=self.CreateEmbed_Detailed(p_worldState))
 			except: # Intentional catch all; too many possible causes.
 				BUPrint.LogError("Unable to post continent status message.", "EXCEPTION OCCURED")
 
-		if ContinentTrack.bAlertCommanders:
+		if ContinentTrack.bAlertCommanders and p_worldState is self.primaryWorld:
 			await self.PostMessage_Commanders()
 
 
 
-	def CreateEmbed_Detailed(self) -> Embed:
+	def CreateEmbed_Detailed(self, p_worldState:ContinentWorldState) -> Embed:
 		"""# Create Embed: Detailed
-		Creates and returns an embed for a detailed breakdown of the continent statuses."""
-		allContenents = self.GetContinentsAsArray()
+		Creates and returns an embed for a detailed breakdown of the worlds continent statuses."""
+		allContenents = self.GetContinentsAsArray(p_worldState)
 
 		openConts = [continent for continent in allContenents if not continent.bIsLocked]
 		lockedConts = [continent for continent in allContenents if continent.bIsLocked]
@@ -458,7 +1015,7 @@ class ContinentTrackerCog(GroupCog, name="continents"):
 		# Sort locked
 		lockedConts.sort(key=lambda continent: continent.lastEventTime)
 
-		newEmbed = Embed(title="CONTINENT STATUS")
+		newEmbed = Embed(title=f"CONTINENT STATUS{self.GetWorldLabel(p_worldState, ' | ')}")
 		# Compose message
 		if openConts.__len__() != 0:
 			for contenent in openConts:
@@ -481,155 +1038,78 @@ class ContinentTrackerCog(GroupCog, name="continents"):
 
 	async def PostMessage_Commanders(self):
 		"""# Post Message: Commander
-		Sends a detailed embed of the continent statuses to any live commanders.
+		Sends a detailed embed of the primary worlds continent statuses to any live commanders, concurrently.
 		"""
-		for commander in OperationManager.vLiveCommanders:
-			if commander.vCommanderStatus.value < CommanderStatus.Started.value:
-				managingUser = self.botRef.get_user(commander.vOpData.managedBy)
-
-				newMessage = "Continents updated\n"
-
-				if managingUser != None:
-					newMessage += f"{managingUser.mention}\n"
-				
-
-				if commander.continentAlert == None:
-					try:
-						commander.continentAlert = await commander.notifChn.send(content=newMessage, embed=self.CreateEmbed_Detailed())
-
-					except: # Intentional catch all; too many possible causes.
-						BUPrint.LogError("Unable to post continent status message.", "EXCEPTION OCCURED")
-
-				else:
-					await commander.continentAlert.edit(embed=self.CreateEmbed_Detailed())
-
+		vCommanders = [commander for commander in OperationManager.vLiveCommanders if commander.vCommanderStatus.value < CommanderStatus.Started.value]
 
+		if len(vCommanders) == 0:
+			return
 
-	async def CheckWarpgates(self, p_zoneID:int):
-		"""# Check Warpgates
-		Checks the warpgate captures array, based on the passed Zone(continent) ID.
-		
-		When a continent is considered locked or opened, the associated entries are removed from the array, and a message is posted."""
-		BUPrint.Debug("Checking Warpgates...")
-		
-		matchingGates = [gateCapture for gateCapture in self.warpgateCaptures if gateCapture.zoneID == p_zoneID]
+		vEmbed = self.CreateEmbed_Detailed(self.primaryWorld)
+		await asyncio.gather(*[self.AlertCommander(commander, vEmbed) for commander in vCommanders])
 
-		if matchingGates.__len__() < 2:
-			BUPrint.Debug(f"	> Insufficient gate length: {matchingGates.__len__()}")
-			return
 
-		firstFaction = -1
-		for gate in matchingGates:
-			if firstFaction == -1:
-				firstFaction = gate.factionID
-			
-			else:
-				if gate.factionID == firstFaction:
-					BUPrint.Debug("Matching factions, Continent has locked.")
-					# Commented out, since the actual continent lock event works as intended.
 
-					# continent.SetLocked(True)
-					# continent.lastLocked = p_timeStamp
-					pass
+	async def AlertCommander(self, p_commander, p_embed:Embed):
+		"""# Alert Commander
+		Posts the continent status embed to the commander, or updates its existing alert.
+		"""
+		if p_commander.continentAlert != None:
+			try:
+				await p_commander.continentAlert.edit(embed=p_embed)
+				return
+			except: # Intentional catch all; too many possible causes.
+				BUPrint.Debug("Unable to edit commander continent alert, posting a new one.")
 
-				else:
-					BUPrint.Debug("Mismatched factions. Continent open!")
-					
-					# Must be set before SetContinents as that updates the timestamps (to current), preventing a loop.
-					bCanPost = self.AntiSpamCanPost()
+		managingUser = self.botRef.get_user(p_commander.vOpData.managedBy)
 
-					self.SetContinentIsLocked(False, gate.warpgateID)
+		newMessage = "Continents updated\n"
 
-					if bCanPost:
-						if ContinentTrack.contUnlockMessageType == PS2ContMessageType.NoMessage:
-							BUPrint.Debug("Unlock event occured, but configured to ignore.")
-							pass
+		if managingUser != None:
+			newMessage += f"{managingUser.mention}\n"
 
-						elif ContinentTrack.contUnlockMessageType == PS2ContMessageType.Detailed:
-							await self.PostMessage_Long()
+		try:
+			p_commander.continentAlert = await p_commander.notifChn.send(content=newMessage, embed=p_embed)
 
-						elif ContinentTrack.contUnlockMessageType == PS2ContMessageType.Simple:
-							await self.PostMessage_Short( self.GetContinentFromID(gate.warpgateID) )
+		except: # Intentional catch all; too many possible causes.
+			BUPrint.LogError("Unable to post continent status message.", "EXCEPTION OCCURED")
 
 
-		# Check if more than 2 warpgate entries are saved.  In this event, clear the warpgate list.
-		if matchingGates.__len__() > 2:
-			BUPrint.Info("Acquired too many matching gates. Clearing WG captures to avoid future duplicates.")
-			self.warpgateCaptures.clear()
-			return
-		
-		# Rerun loop & remove entries.
-		BUPrint.Debug(f"Removing: {len(matchingGates)}")
-		
-		for gate in matchingGates:
-			try:
-				self.warpgateCaptures.remove(gate)
-				BUPrint.Debug("Warpgate entry removed")
-			except ValueError:
-				BUPrint.Info("Warpgate not in array. Clearing WGCaptures to avoid future duplicates. May miss a continent opening.")
-				self.warpgateCaptures.clear()
-				return
-			
 
-	
-	def GetMostRecentTimestamp(self) -> datetime:
+	def GetMostRecentTimestamp(self, p_worldState:ContinentWorldState = None) -> datetime:
 		"""# Get most recent timestamp:
-		Returns the timestamp of the most recent continent update.
+		Returns the timestamp of the most recent continent update of the world; the primary world if none given.
 		
-		Return NONE if array is empty.
+		Return NONE if no continent has been updated.
 		"""
-		contArray = self.GetContinentsAsArray()
+		if p_worldState == None:
+			p_worldState = self.primaryWorld
 
-		if contArray.__len__() == 0:
-			return None
-
-		contArray.sort(key=lambda continent: continent.lastEventTime, reverse=True)
-
-		return contArray[0].lastEventTime
+		return p_worldState.mostRecentEventTime
 	
 
 
-	def AntiSpamCanPost(self) -> bool:
-		"""# Anti Spam: Can Post
-		Function to protect against spam events, checks the given timestamp against the most recent.
-
-		Will always return true if no recent time exists.
-		
+	def LoadContinentData(self):
+		"""# Load Continent Data
+		Sets the continent objects of each world from their last logged state in the continent history.
 
-		## RETURNS
-		- `TRUE`: when a continent event may be posted.
-		- `FALSE`: When too many continent event updates have been posted.
+		If the history has no states, continent data saved to file by previous versions is loaded into the primary world and logged instead.
 		"""
-		BUPrint.Info("Continent Update Antispam check...")
-
-		mostRecentTime = self.GetMostRecentTimestamp()
+		BUPrint.Info("Loading continent data from history...")
 
-		if mostRecentTime == None:
-			return True
-		
-		BUPrint.Debug(f"	>> Checking: {mostRecentTime + ContinentTrack.antiSpamMinimalTime} > {datetime.now(tz=timezone.utc)}")
+		bHasStates = False
 
-		if mostRecentTime + ContinentTrack.antiSpamMinimalTime > datetime.now(tz=timezone.utc):
-			self.antiSpamUpdateCount += 1
-			BUPrint.Debug(f"	>> Event is occuring within spam minimal timeframe. (Antispam count: {self.antiSpamUpdateCount})")
+		for worldState in self.worlds.values():
+			zoneStates = self.history.GetZoneStates(worldState.world.worldID)
+			bHasStates = bHasStates or len(zoneStates) != 0
 
-			if self.antiSpamUpdateCount > ContinentTrack.antiSpamAllowedPosts:
-				BUPrint.Info(f"	>> Continent Tracker AntiSpam prevented a message from being sent. {self.antiSpamUpdateCount - ContinentTrack.antiSpamAllowedPosts} Messages blocked.")
-				return False
-		
-		else:
-			BUPrint.Debug("	>> Event occured past minimal timeframe.")
-			self.antiSpamUpdateCount = 0
-		
-		return True
+			for zoneID, (bIsLocked, eventTime) in zoneStates.items():
+				if zoneID in worldState.continents:
+					self.SetContinentIsLocked(worldState, bIsLocked, zoneID, eventTime, bLog=False)
 
+		if bHasStates:
+			return
 
-	def LoadContinentData(self):
-		"""# Load Continent Data
-		Sets the continent objects with saved data from file.
-		"""
-		BUPrint.Info("Loading continent data from file...")
-		
 		contFiles = FilesAndFolders.GetFiles(Directories.tempDir, ".cont")
 
 		for continentDataFilepath in contFiles:
@@ -648,32 +1128,5 @@ class ContinentTrackerCog(GroupCog, name="continents"):
 				break
 			
 
-			for continent in self.GetContinentsAsArray(False):
-				if continent.ps2Zone == continentData.ps2Zone:
-					BUPrint.Info(f"	> Setting {continent.ps2Zone.name} status")
-					continent.SetLocked(continentData.bIsLocked, continentData.lastEventTime)
-
-
-
-	def SaveContinentData(self):
-		"""# Save Continent Data
-		Saves the continent objects data to file.
-		"""
-		BUPrint.Info("Saving continent data to file...")
-		
-		continents = self.GetContinentsAsArray()
-
-		for continent in continents:
-			try:
-				BUPrint.Debug(f"	> Pickling: {continent.ps2Zone.name}")
-				filePath = f"{Directories.tempDir}{continent.ps2Zone.name}.cont"
-				with open(filePath, "wb") as vFile:
-					pickle.dump(continent, vFile, BotSettings.pickleProtocol)
-
-			except pickle.PicklingError as vError:
-				BUPrint.LogErrorExc("Invalid object passed to dump.", vError)
-				break
-
-			except pickle.PickleError:
-				BUPrint.LogError("Unable to save continent data", "PICKLE ERROR")
-				break
\ No newline at end of file
+			BUPrint.Info(f"	> Setting {continentData.ps2Zone.name} status")
+			self.SetContinentIsLocked(self.primaryWorld, continentData.bIsLocked, continentData.ps2Zone.value, continentData.lastEventTime)
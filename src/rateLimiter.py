@@ -0,0 +1,162 @@
+"""
+RATE LIMITER
+Token bucket rate limiting for bot announcements.
+
+Each key (typically a channel & message type) has its own bucket, refilled evenly over a period.
+Updates which can't be posted are merged into a digest, posted once a token is available, so nothing is silently dropped.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Hashable
+
+from botUtils import BotPrinter
+
+BUPrint = BotPrinter.GetLogger("rateLimiter")
+
+
+class TokenBucket():
+	"""
+	# TOKEN BUCKET
+	Holds up to `capacity` tokens, refilled evenly such that `capacity` tokens are regained each `period` seconds.
+	"""
+	def __init__(self, p_capacity:int, p_period:float) -> None:
+		self.capacity = max(p_capacity, 1)
+		self.refillRate = self.capacity / p_period
+		"""Tokens regained per second."""
+
+		self.tokens = float(self.capacity)
+		self.lastRefill = time.monotonic()
+
+
+	def Refill(self):
+		"""# REFILL
+		Adds the tokens regained since the last refill."""
+		vNow = time.monotonic()
+		self.tokens = min(self.capacity, self.tokens + (vNow - self.lastRefill) * self.refillRate)
+		self.lastRefill = vNow
+
+
+	def TryTake(self) -> bool:
+		"""# TRY TAKE
+		Takes a token if one is available.
+
+		## RETURNS
+		`bool`: True if a token was taken.
+		"""
+		self.Refill()
+
+		if self.tokens < 1:
+			return False
+
+		self.tokens -= 1
+		return True
+
+
+	def TimeUntilToken(self) -> float:
+		"""# TIME UNTIL TOKEN
+		Returns the seconds until a token is available; 0 if one is available now."""
+		self.Refill()
+		return max(0, (1 - self.tokens) / self.refillRate)
+
+
+
+class RateLimiter():
+	"""
+	# RATE LIMITER
+	Rate limits posts per key using token buckets.
+
+	Posts that are limited are added to a digest for their key.
+	When a token becomes available, all updates in the digest are sent in a single call.
+	"""
+	def __init__(self, p_name:str, p_capacity:int, p_period:float) -> None:
+		self.name = p_name
+		self.capacity = p_capacity
+		self.period = p_period
+
+		self.buckets: dict[Hashable, TokenBucket] = {}
+		self.digests: dict[Hashable, list] = {}
+		"""Key : Updates waiting to be posted."""
+
+		self.digestTasks: dict[Hashable, asyncio.Task] = {}
+		self.suppressedCount = 0
+		"""Number of updates merged into digests."""
+
+
+	def GetBucket(self, p_key:Hashable) -> TokenBucket:
+		"""# GET BUCKET
+		Returns the bucket for the key, creating it if needed."""
+		if p_key not in self.buckets:
+			self.buckets[p_key] = TokenBucket(self.capacity, self.period)
+
+		return self.buckets[p_key]
+
+
+	async def Post(self, p_key:Hashable, p_update, p_sendFunction:Callable[[list], Awaitable[None]], bDigest:bool = True) -> bool:
+		"""# POST
+		Sends the update immediately if the key has a token, else adds it to the keys digest.
+
+		While a digest is pending, updates are added to it to keep them in order.
+
+		## PARAMETERS
+		- `p_key`: The key to rate limit by.
+		- `p_update`: The update to send.
+		- `p_sendFunction`: Coroutine function called with a list of updates to send.
+		- `bDigest`: When false, a limited update is dropped instead of added to the digest.
+
+		## RETURNS
+		`bool`: True if the update was sent immediately.
+		"""
+		if p_key not in self.digests and self.GetBucket(p_key).TryTake():
+			await p_sendFunction([p_update])
+			return True
+
+		if not bDigest:
+			BUPrint.Info(f"Rate Limiter ({self.name}): Dropped update for {p_key}.")
+			return False
+
+		self.suppressedCount += 1
+		self.digests.setdefault(p_key, []).append(p_update)
+
+		if p_key not in self.digestTasks:
+			self.digestTasks[p_key] = asyncio.create_task(self.SendDigest(p_key, p_sendFunction))
+
+		BUPrint.Debug("Rate Limiter (%s): Update for %s added to digest (%d pending).", self.name, p_key, len(self.digests[p_key]))
+		return False
+
+
+	async def SendDigest(self, p_key:Hashable, p_sendFunction:Callable[[list], Awaitable[None]]):
+		"""# SEND DIGEST
+		Waits for a token, then sends all pending updates for the key."""
+		vBucket = self.GetBucket(p_key)
+
+		try:
+			while not vBucket.TryTake():
+				await asyncio.sleep(vBucket.TimeUntilToken())
+
+			vUpdates = self.digests.pop(p_key, [])
+			BUPrint.Info(f"Rate Limiter ({self.name}): Sending digest of {len(vUpdates)} updates for {p_key}.")
+			await p_sendFunction(vUpdates)
+
+		except asyncio.CancelledError:
+			self.digestTasks.pop(p_key, None)
+			raise
+
+		except Exception as vError: # Intentional catch all; errors would otherwise be lost in the task.
+			BUPrint.LogErrorExc(f"Rate Limiter ({self.name}): Unable to send digest.", vError)
+
+		self.digestTasks.pop(p_key, None)
+
+		# Updates added while sending start the next digest.
+		if p_key in self.digests:
+			self.digestTasks[p_key] = asyncio.create_task(self.SendDigest(p_key, p_sendFunction))
+
+
+	def Cancel(self):
+		"""# CANCEL
+		Cancels all pending digests."""
+		for task in self.digestTasks.values():
+			task.cancel()
+
+		self.digestTasks.clear()
+		self.digests.clear()
@@ -8,10 +8,12 @@ import asyncio
 from os import path
 import botData.settings 
 import botUtils
-from botUtils import BotPrinter as BUPrint
+from botUtils import BotPrinter
 from botUtils import UserHasCommandPerms, emptyStrings
 from botData.settings import CommandRestrictionLevels, SelfAssignableRoles, Directories
 
+BUPrint = BotPrinter.GetLogger("roles")
+
 
 class UserRoles(commands.GroupCog, name="roles", description="Add or remove user-assignable roles"):
 	"""
@@ -7,10 +7,8 @@ from discord.ext import commands, tasks
 
 from discord import app_commands
 
-from auraxium import Client as AuraxClient
-import auraxium.ps2 as AuraxPS2
-
 import os
+import asyncio
 
 import pickle
 
@@ -18,7 +16,7 @@ from datetime import datetime, timezone, timedelta
 
 from enum import Enum
 
-from botUtils import BotPrinter as BUPrint
+from botUtils import BotPrinter
 from botUtils import FilesAndFolders, GetDiscordTime, UserHasCommandPerms, GetGuildNF
 
 from botData.dataObjects import User, Session, OpsStatus, LibraryViewPage, UserInboxItem, EntryRetention
@@ -27,6 +25,13 @@ from botData.utilityData import DateFormat
 
 import botData.settings as settings
 import opsManager
+from botMetrics import BotMetrics
+from loopWatchdog import LoopWatchdog
+
+BUPrint = BotPrinter.GetLogger("userLibrary")
+
+libraryIO = BotMetrics.Histogram("userlibrary_io_seconds", "Duration of user library entry loads & saves from file.", ("operation",))
+libraryCacheHits = BotMetrics.Counter("userlibrary_cache_hits", "User library entries returned from the loaded entries instead of file.")
 
 
 
@@ -131,6 +136,7 @@ class UserLibraryCog(commands.GroupCog, name="user_library"):
 
 
 
+	@LoopWatchdog.TimedListener("CheckReactions")
 	async def CheckReactions(self, p_data:discord.RawReactionActionEvent):
 		if p_data.channel_id != settings.Channels.quoteID:
 			# Not correct channel.
@@ -204,6 +210,7 @@ class UserLibraryAdminCog(commands.GroupCog, name="userlib_admin"):
 		self.botRef:commands.Bot = p_botRef
 		self.userLibRetentionTask = None
 		self.querySleeperTask = None
+		self.bCreatingEntries = False # Prevents create_missing_entries running more than once at a time.
 
 		if settings.BotSettings.botFeatures.UserLibrary:
 			self.contextMenu_setAsRecruit = app_commands.ContextMenu(
@@ -428,21 +435,42 @@ class UserLibraryAdminCog(commands.GroupCog, name="userlib_admin"):
 			await p_interaction.edit_original_response(content="You do not have permission to run this command with `outfit_only` on false.")
 			return
 
+		if self.bCreatingEntries:
+			await p_interaction.edit_original_response(content="Entries are already being created.")
+			return
+
 		BUPrint.Info("Creating entries for missing users...")
+		self.bCreatingEntries = True
 		entriesCreated = 0
-		for member in p_interaction.guild.members:
-			memberRoleIDs = [role.id for role in member.roles]
-			bIsOutfitMember = bool(settings.Roles.recruit in memberRoleIDs or settings.Roles.recruitPromotion in memberRoleIDs)
-			if not bIsOutfitMember and bOutfitOnly:
-				BUPrint.Debug(f"{member.display_name} not part of outfit, and command is running: outfit only. Skipping")
-				continue
 
-			if not UserLibrary.HasEntry(member.id):
-				BUPrint.Debug(f"{member.display_name} had no entry, creating one.")
+		try:
+			# Members are compared against the entries on disk, so re-running after an interruption resumes where it stopped.
+			vExistingIDs = await asyncio.to_thread(UserLibrary.GetEntryIDs)
+			vOutfitRoleIDs = {settings.Roles.recruit, settings.Roles.recruitPromotion}
+
+			vMissingIDs = [
+				member.id for member in p_interaction.guild.members
+				if member.id not in vExistingIDs
+				and (not bOutfitOnly or any(member.get_role(roleID) != None for roleID in vOutfitRoleIDs))
+			]
+
+			BUPrint.Info(f"	-> {len(vMissingIDs)} members have no entry.")
+			vBatchSize = settings.UserLib.entryCreationBatchSize
 
-				newEntry = User(discordID=member.id)
-				UserLibrary.SaveEntry(newEntry)
-				entriesCreated += 1
+			for batchStart in range(0, len(vMissingIDs), vBatchSize):
+				vBatch = [User(discordID=memberID) for memberID in vMissingIDs[batchStart:batchStart + vBatchSize]]
+				await asyncio.to_thread(UserLibrary.SaveEntries, vBatch)
+				entriesCreated += len(vBatch)
+
+				await p_interaction.edit_original_response(content=f"Creating entries... {entriesCreated}/{len(vMissingIDs)}")
+
+		except Exception as vError:
+			BUPrint.LogErrorExc("Creating missing entries was interrupted.", vError)
+			await p_interaction.edit_original_response(content=f"Task interrupted after creating {entriesCreated} entries.  Run the command again to resume.")
+			return
+
+		finally:
+			self.bCreatingEntries = False
 
 		await p_interaction.edit_original_response(content=f"Task completed. {entriesCreated} entries created.")
 	
@@ -547,6 +575,23 @@ class UserLibrary():
 
 
 
+	def GetEntryIDs() -> set[int]:
+		"""
+		# GET ENTRY IDS
+		Returns the user IDs of all entries (both normal and recruits), from one listing of each directory.
+		"""
+		vEntryIDs: set[int] = set()
+		for directory in (settings.Directories.userLibrary, settings.Directories.userLibraryRecruits):
+			with os.scandir(directory) as vEntries:
+				for entry in vEntries:
+					vName, vExtension = os.path.splitext(entry.name)
+					if vExtension == ".bin" and vName.isnumeric():
+						vEntryIDs.add(int(vName))
+
+		return vEntryIDs
+
+
+
 	def HasEntry(p_UserID:int):
 		"""
 		# HAS LIBRARY ENTRY
@@ -580,6 +625,7 @@ class UserLibrary():
 
 
 
+	@BotMetrics.Timed(libraryIO, "save")
 	def SaveEntry(p_entry:User):
 		"""
 		# SAVE LIBRARY ENTRY
@@ -645,6 +691,16 @@ class UserLibrary():
 
 
 
+	def SaveEntries(p_entries:list[User]):
+		"""
+		# SAVE LIBRARY ENTRIES
+		Saves each of the entries to file; intended to be run in a thread for bulk saves.
+		"""
+		for entry in p_entries:
+			UserLibrary.SaveEntry(entry)
+
+
+
 	def LoadEntry(p_userID:int):
 		"""
 		# LOAD LIBRARY ENTRY
@@ -662,6 +718,7 @@ class UserLibrary():
 
 
 		if p_userID in UserLibrary.loadedEntries:
+			libraryCacheHits.Inc()
 			vLibEntry = UserLibrary.loadedEntries.get(p_userID)
 			vLibEntry.lastAccessed = datetime.now(tz=timezone.utc)
 			return vLibEntry
@@ -679,7 +736,7 @@ class UserLibrary():
 		FilesAndFolders.GetLock(vLockFile)
 
 		try:
-			with open(vFilePath, "rb") as vFile:
+			with libraryIO.Time(("load",)), open(vFilePath, "rb") as vFile:
 				vLibEntry = pickle.load(vFile)
 
 			FilesAndFolders.ReleaseLock(vLockFile)
@@ -780,7 +837,11 @@ class UserLibrary():
 
 		if p_entry.ps2Name == "":
 			return False
-		
+
+		# Imported here so auraxium is only loaded on first use.
+		from auraxium import Client as AuraxClient
+		import auraxium.ps2 as AuraxPS2
+
 		vAuraxClient = AuraxClient(service_id=settings.BotSettings.ps2ServiceID)
 
 		vPlayerChar = await vAuraxClient.get_by_name(AuraxPS2.Character, p_entry.ps2Name)
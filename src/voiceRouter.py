@@ -0,0 +1,140 @@
+"""
+VOICE ROUTER
+A single guild-wide listener for voice state updates.
+Events are dispatched only to the subscribers interested in them, instead of each cog scanning all commanders & channels.
+"""
+
+from __future__ import annotations
+
+import discord
+from discord.ext import commands
+
+from typing import TYPE_CHECKING
+
+from botUtils import BotPrinter
+from loopWatchdog import LoopWatchdog
+
+BUPrint = BotPrinter.GetLogger("voiceRouter")
+
+if TYPE_CHECKING:
+	from OpCommander.commander import Commander
+	from botData.dataObjects import Participant
+
+
+class VoiceRouter(commands.Cog):
+	"""
+	# VOICE ROUTER
+	Holds the lookup maps used to route voice state changes:
+	- `memberCommanders`: member ID -> {Commander: Participant} of live commanders containing that member.
+	- `linkedTextChannels`: voice channel ID -> linked text channel.
+	- `chatHandler`: coroutine called for voice channel changes, set by the chat utility cog when loaded.
+	"""
+	memberCommanders: dict[int, dict[Commander, Participant]] = {}
+	linkedTextChannels: dict[int, discord.TextChannel] = {}
+	chatHandler = None
+
+	def __init__(self, p_botRef) -> None:
+		super().__init__()
+		self.botRef: commands.Bot = p_botRef
+		BUPrint.Info("COG: Voice Router loaded!")
+
+
+	@commands.Cog.listener("on_voice_state_update")
+	@LoopWatchdog.TimedListener("VoiceRouter.VoiceStateChanged")
+	async def VoiceStateChanged(self, p_member:discord.Member, p_before:discord.VoiceState, p_after:discord.VoiceState):
+		"""
+		# VOICE STATE CHANGED: Listener
+		Dispatches the voice state change to interested commanders, then to the chat handler.
+		Errors in one subscriber are logged, and don't prevent the others from being called.
+		Mute/deafen changes are ignored.
+		"""
+		if p_before.channel == p_after.channel:
+			return
+
+		vInterested = VoiceRouter.memberCommanders.get(p_member.id)
+		if vInterested:
+			# Copy; commanders may unsubscribe during their update.
+			for commander, participant in list(vInterested.items()):
+				if commander.bIgnoreStateChange:
+					continue
+
+				participant.bInEventChannel = commander.IsEventVoiceChannel(p_after.channel)
+				# Each subscriber is isolated, so one failing doesn't skip the rest.
+				try:
+					await commander.UpdateCommanderLive()
+				except Exception as vError:
+					BUPrint.LogErrorExc("Commander failed to update from voice state change.", vError)
+
+		if VoiceRouter.chatHandler != None:
+			try:
+				await VoiceRouter.chatHandler(p_member, p_before, p_after)
+			except Exception as vError:
+				BUPrint.LogErrorExc("Chat handler failed on voice state change.", vError)
+
+
+	@commands.Cog.listener("on_guild_channel_delete")
+	async def ChannelDeleted(self, p_channel:discord.abc.GuildChannel):
+		"""
+		# CHANNEL DELETED: Listener
+		Removes stale links when a linked voice or text channel is deleted (eg, by a commander ending).
+		"""
+		if VoiceRouter.UnlinkTextChannel(p_channel.id) != None:
+			return
+
+		for voiceID, textChannel in list(VoiceRouter.linkedTextChannels.items()):
+			if textChannel.id == p_channel.id:
+				VoiceRouter.UnlinkTextChannel(voiceID)
+
+
+
+	@staticmethod
+	def SubscribeCommander(p_commander:Commander, p_participants:list[Participant]):
+		"""
+		# SUBSCRIBE COMMANDER
+		Replaces the members the commander is subscribed to with the passed participants.
+		"""
+		VoiceRouter.UnsubscribeCommander(p_commander)
+
+		for participant in p_participants:
+			VoiceRouter.memberCommanders.setdefault(participant.discordID, {})[p_commander] = participant
+
+		BUPrint.Debug(f"Voice Router: Commander subscribed to {len(p_participants)} members.")
+
+
+	@staticmethod
+	def UnsubscribeCommander(p_commander:Commander):
+		"""
+		# UNSUBSCRIBE COMMANDER
+		Removes all member subscriptions for the commander.
+		"""
+		for memberID in list(VoiceRouter.memberCommanders):
+			vInterested = VoiceRouter.memberCommanders[memberID]
+			if vInterested.pop(p_commander, None) != None and len(vInterested) == 0:
+				del VoiceRouter.memberCommanders[memberID]
+
+
+	@staticmethod
+	def LinkTextChannel(p_voiceChannel:discord.VoiceChannel, p_textChannel:discord.TextChannel):
+		"""
+		# LINK TEXT CHANNEL
+		Sets the text channel linked to the voice channel.
+		"""
+		VoiceRouter.linkedTextChannels[p_voiceChannel.id] = p_textChannel
+
+
+	@staticmethod
+	def UnlinkTextChannel(p_voiceChannelID:int):
+		"""
+		# UNLINK TEXT CHANNEL
+		Removes the voice channel link, returning the previously linked text channel, if any.
+		"""
+		return VoiceRouter.linkedTextChannels.pop(p_voiceChannelID, None)
+
+
+	@staticmethod
+	def GetLinkedTextChannel(p_voiceChannelID:int) -> discord.TextChannel|None:
+		"""
+		# GET LINKED TEXT CHANNEL
+		Returns the text channel linked to the voice channel ID, or None.
+		"""
+		return VoiceRouter.linkedTextChannels.get(p_voiceChannelID)